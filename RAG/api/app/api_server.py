@@ -11,6 +11,7 @@ worker 서비스(app.py)가 초기화한 pgvector 벡터 스토어를 사용하
 - worker가 초기화한 pgvector 벡터 스토어 활용
 """
 
+import asyncio
 import os
 import time
 import warnings
@@ -68,6 +69,10 @@ from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from sqlalchemy import text
+
+from app.repository.vector_store import VectorStoreRepository
+from app.service.startup import FAILED, LAZY, check_openai_model, run_parallel
 
 # Neon PostgreSQL 연결 문자열 (.env 파일의 DATABASE_URL 사용)
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -117,26 +122,27 @@ local_rag_chain: Optional[Runnable] = None
 openai_quota_exceeded = False
 # ChatService 인스턴스 (타입 힌트는 함수 내부에서 import)
 chat_service: Optional[Any] = None
+# 백그라운드 초기화 작업
+startup_task: Optional[asyncio.Task] = None
+# 크롤링 결과 주기 적재 (CRAWL_INGEST_INTERVAL_MINUTES > 0일 때만)
+crawl_ingest_scheduler: Optional[Any] = None
 
 
 def wait_for_postgres(max_retries: int = 30, delay: int = 2) -> None:
-    """Neon PostgreSQL이 준비될 때까지 대기."""
-    import psycopg2
-
+    """Neon PostgreSQL이 준비될 때까지 대기 (공유 연결 풀 사용)."""
     print(
         f"[INFO] Neon PostgreSQL 연결 시도 중... (연결 문자열: {CONNECTION_STRING[:50]}...)"
     )
 
     for i in range(max_retries):
         try:
-            conn = psycopg2.connect(CONNECTION_STRING)
-
-            # PGVector 확장 확인
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT extname, extversion FROM pg_extension WHERE extname = 'vector'"
-            )
-            vector_ext = cur.fetchone()
+            with VectorStoreRepository.connect(CONNECTION_STRING) as conn:
+                # PGVector 확장 확인
+                vector_ext = conn.execute(
+                    text(
+                        "SELECT extname, extversion FROM pg_extension WHERE extname = 'vector'"
+                    )
+                ).fetchone()
 
             if vector_ext:
                 print("[OK] Neon PostgreSQL 연결 성공!")
@@ -144,8 +150,6 @@ def wait_for_postgres(max_retries: int = 30, delay: int = 2) -> None:
             else:
                 print("[OK] Neon PostgreSQL 연결 성공!")
                 print("[WARNING] PGVector 확장이 설치되지 않았습니다!")
-
-            conn.close()
             return
         except Exception as e:
             if i < max_retries - 1:
@@ -166,8 +170,8 @@ def initialize_embeddings():
     if openai_api_key and openai_api_key != "your-api-key-here":
         try:
             openai_embeddings = OpenAIEmbeddings()
-            # 간단한 테스트
-            openai_embeddings.embed_query("test")
+            # 과금 없는 모델 메타데이터 조회로 API 키 확인
+            check_openai_model(openai_embeddings.model)
             print("[OK] OpenAI Embedding 모델 초기화 완료")
         except Exception as e:
             error_msg = str(e)
@@ -222,8 +226,8 @@ def initialize_llm():
     if openai_api_key and openai_api_key != "your-api-key-here":
         try:
             openai_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.7)
-            # 실제 API 호출 테스트 (할당량 확인)
-            openai_llm.invoke("test")
+            # 과금 없는 모델 메타데이터 조회로 API 키 확인
+            check_openai_model(openai_llm.model_name)
             print("[OK] OpenAI Chat 모델 초기화 완료")
         except Exception as e:
             error_msg = str(e)
@@ -281,25 +285,34 @@ def initialize_llm():
         )
 
 
-def initialize_vector_store():
-    """PGVector 스토어 초기화."""
-    global vector_store, openai_embeddings, local_embeddings
+def select_embeddings(verbose: bool = True):
+    """컬렉션에 쓸 embedding 모델 선택.
 
-    # LLM_PROVIDER에 따라 적절한 embedding 선택
+    우선순위: LLM_PROVIDER에 맞는 모델 > OpenAI > 로컬
+    """
     llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
 
-    # 사용할 embedding 모델 선택 (우선순위: LLM_PROVIDER에 맞는 모델 > OpenAI > 로컬)
     if llm_provider == "midm" and local_embeddings:
-        current_embeddings = local_embeddings
-        print("[INFO] 로컬 Embedding 모델 사용 (LLM_PROVIDER=midm)")
-    elif openai_embeddings:
-        current_embeddings = openai_embeddings
-        print("[INFO] OpenAI Embedding 모델 사용")
-    elif local_embeddings:
-        current_embeddings = local_embeddings
-        print("[INFO] 로컬 Embedding 모델 사용 (fallback)")
-    else:
-        raise RuntimeError("사용 가능한 Embedding 모델이 없습니다.")
+        if verbose:
+            print("[INFO] 로컬 Embedding 모델 사용 (LLM_PROVIDER=midm)")
+        return local_embeddings
+    if openai_embeddings:
+        if verbose:
+            print("[INFO] OpenAI Embedding 모델 사용")
+        return openai_embeddings
+    if local_embeddings:
+        if verbose:
+            print("[INFO] 로컬 Embedding 모델 사용 (fallback)")
+        return local_embeddings
+    raise RuntimeError("사용 가능한 Embedding 모델이 없습니다.")
+
+
+def initialize_vector_store():
+    """PGVector 스토어 초기화."""
+    global vector_store
+
+    # LLM_PROVIDER에 따라 적절한 embedding 선택
+    current_embeddings = select_embeddings()
 
     try:
         print("[INFO] ===== PGVector 연결 확인 시작 =====")
@@ -309,56 +322,56 @@ def initialize_vector_store():
         # 기존 컬렉션이 있고 벡터 데이터가 있는지 확인
         try:
             print("[INFO] PGVector 객체 생성 중...")
-            vector_store = PGVector(
-                embedding_function=current_embeddings,
-                collection_name=COLLECTION_NAME,
-                connection_string=CONNECTION_STRING,
+            # 임베딩 공간별 공유 스토어 (RAG 체인과 같은 인스턴스 사용)
+            repository = VectorStoreRepository.get_or_create(
+                CONNECTION_STRING, COLLECTION_NAME, current_embeddings
             )
+            vector_store = repository.vector_store
             print("[OK] PGVector 객체 생성 완료")
 
-            # 벡터 데이터가 있는지 확인
-            import psycopg2
-
+            # 벡터 데이터가 있는지 확인 (공유 연결 풀 사용)
             print("[INFO] 데이터베이스에서 벡터 데이터 확인 중...")
-            conn = psycopg2.connect(CONNECTION_STRING)
-            cur = conn.cursor()
-
-            # 컬렉션 UUID 확인
-            cur.execute(
-                f"""
-                SELECT uuid FROM langchain_pg_collection WHERE name = '{COLLECTION_NAME}'
-            """
-            )
-            collection_result = cur.fetchone()
+            with VectorStoreRepository.connect(CONNECTION_STRING) as conn:
+                # 컬렉션 UUID 확인
+                collection_result = conn.execute(
+                    text("SELECT uuid FROM langchain_pg_collection WHERE name = :name"),
+                    {"name": COLLECTION_NAME},
+                ).fetchone()
+
+                vector_count = 0
+                vector_dim = None
+                if collection_result:
+                    collection_uuid = collection_result[0]
+
+                    # 벡터 개수 확인
+                    vector_count = conn.execute(
+                        text(
+                            """
+                            SELECT COUNT(*)
+                            FROM langchain_pg_embedding
+                            WHERE collection_id = :collection_id
+                            """
+                        ),
+                        {"collection_id": collection_uuid},
+                    ).scalar()
+
+                    # 벡터 차원 확인
+                    dim_result = conn.execute(
+                        text(
+                            """
+                            SELECT vector_dims(embedding) as vector_dim
+                            FROM langchain_pg_embedding
+                            WHERE collection_id = :collection_id
+                            LIMIT 1
+                            """
+                        ),
+                        {"collection_id": collection_uuid},
+                    ).fetchone()
+                    vector_dim = dim_result[0] if dim_result and dim_result[0] else None
 
             if collection_result:
-                collection_uuid = collection_result[0]
                 print(f"[INFO] 컬렉션 UUID: {collection_uuid}")
 
-                # 벡터 개수 확인
-                cur.execute(
-                    f"""
-                    SELECT COUNT(*)
-                    FROM langchain_pg_embedding
-                    WHERE collection_id = '{collection_uuid}'
-                """
-                )
-                vector_count = cur.fetchone()[0]
-
-                # 벡터 차원 확인
-                cur.execute(
-                    f"""
-                    SELECT array_length(embedding::vector, 1) as vector_dim
-                    FROM langchain_pg_embedding
-                    WHERE collection_id = '{collection_uuid}'
-                    LIMIT 1
-                """
-                )
-                dim_result = cur.fetchone()
-                vector_dim = dim_result[0] if dim_result and dim_result[0] else None
-
-                conn.close()
-
                 if vector_count > 0:
                     print("[OK] 기존 PGVector 스토어 로드 완료")
                     print(f"[INFO] 벡터 데이터 개수: {vector_count}개")
@@ -369,16 +382,6 @@ def initialize_vector_store():
                     # 컬렉션은 있지만 벡터 데이터가 없으면 초기 문서 추가
                     print("[INFO] 컬렉션은 존재하지만 벡터 데이터가 없습니다.")
 
-                    # 기존 문서 확인 (중복 방지)
-                    cur.execute(
-                        f"""
-                        SELECT DISTINCT document
-                        FROM langchain_pg_embedding
-                        WHERE collection_id = '{collection_uuid}'
-                    """
-                    )
-                    existing_docs = {row[0] for row in cur.fetchall()}
-
                     initial_docs = [
                         Document(
                             page_content="LangChain은 LLM 애플리케이션 개발을 위한 프레임워크입니다.",
@@ -394,53 +397,16 @@ def initialize_vector_store():
                         ),
                     ]
 
-                    # 중복되지 않은 문서만 추가
-                    docs_to_add = [
-                        doc
-                        for doc in initial_docs
-                        if doc.page_content not in existing_docs
-                    ]
-
-                    if docs_to_add:
-                        print(f"[INFO] 초기 문서 {len(docs_to_add)}개를 추가합니다...")
-                        vector_store.add_documents(docs_to_add)
-                        print("[OK] 초기 문서 추가 완료")
-                    else:
-                        print(
-                            "[INFO] 초기 문서가 이미 모두 존재합니다. 추가하지 않습니다."
-                        )
-
-                    # 추가 후 확인
-                    conn = psycopg2.connect(CONNECTION_STRING)
-                    cur = conn.cursor()
-                    cur.execute(
-                        f"""
-                        SELECT COUNT(*)
-                        FROM langchain_pg_embedding
-                        WHERE collection_id = '{collection_uuid}'
-                    """
+                    # 내용 해시 기반 색인 (이미 색인된 문서는 임베딩 없이 건너뜀)
+                    result = repository.index_documents(initial_docs)
+                    print(
+                        f"[OK] 초기 문서 색인 완료 (추가 {result['num_added']}개, "
+                        f"변경 {result['num_updated']}개, "
+                        f"건너뜀 {result['num_skipped']}개, "
+                        f"삭제 {result['num_deleted']}개)"
                     )
-                    final_count = cur.fetchone()[0]
-
-                    # 고유 문서 개수 확인
-                    cur.execute(
-                        f"""
-                        SELECT COUNT(DISTINCT document)
-                        FROM langchain_pg_embedding
-                        WHERE collection_id = '{collection_uuid}'
-                    """
-                    )
-                    unique_doc_count = cur.fetchone()[0]
-                    conn.close()
-                    print(f"[INFO] 현재 벡터 데이터 개수: {final_count}개")
-                    print(f"[INFO] 고유 문서 개수: {unique_doc_count}개")
-                    if final_count > unique_doc_count:
-                        print(
-                            f"[WARNING] 중복된 벡터가 {final_count - unique_doc_count}개 있습니다."
-                        )
                     print("[OK] ===== PGVector 연결 확인 완료 =====")
             else:
-                conn.close()
                 print("[WARNING] 컬렉션이 데이터베이스에 존재하지 않습니다.")
 
         except Exception as e:
@@ -449,43 +415,26 @@ def initialize_vector_store():
             print("[INFO] 컬렉션 로드 실패, 새로 생성합니다...")
             print(f"[INFO] 오류 내용: {error_msg[:150]}")
             print("[INFO] 초기 문서로 PGVector 스토어 생성 중...")
-            vector_store = PGVector.from_documents(
-                embedding=current_embeddings,
-                documents=[
-                    Document(
-                        page_content="LangChain은 LLM 애플리케이션 개발을 위한 프레임워크입니다.",
-                        metadata={"source": "intro"},
-                    ),
-                    Document(
-                        page_content="pgvector는 PostgreSQL에서 벡터 검색을 가능하게 하는 확장입니다.",
-                        metadata={"source": "pgvector"},
-                    ),
-                    Document(
-                        page_content="Hello World는 프로그래밍의 첫 번째 예제입니다.",
-                        metadata={"source": "hello"},
-                    ),
-                ],
-                collection_name=COLLECTION_NAME,
-                connection_string=CONNECTION_STRING,
-            )
+            # 리포지토리가 컬렉션이 없으면 초기 문서로 생성
+            vector_store = VectorStoreRepository.get_or_create(
+                CONNECTION_STRING, COLLECTION_NAME, current_embeddings
+            ).vector_store
             print("[OK] PGVector 스토어 생성 완료")
 
             # 생성 후 벡터 개수 확인
-            import psycopg2
-
-            conn = psycopg2.connect(CONNECTION_STRING)
-            cur = conn.cursor()
-            cur.execute(
-                f"""
-                SELECT COUNT(*)
-                FROM langchain_pg_embedding
-                WHERE collection_id = (
-                    SELECT uuid FROM langchain_pg_collection WHERE name = '{COLLECTION_NAME}'
-                )
-            """
-            )
-            vector_count = cur.fetchone()[0]
-            conn.close()
+            with VectorStoreRepository.connect(CONNECTION_STRING) as conn:
+                vector_count = conn.execute(
+                    text(
+                        """
+                        SELECT COUNT(*)
+                        FROM langchain_pg_embedding
+                        WHERE collection_id = (
+                            SELECT uuid FROM langchain_pg_collection WHERE name = :name
+                        )
+                        """
+                    ),
+                    {"name": COLLECTION_NAME},
+                ).scalar()
             print(f"[INFO] 생성된 벡터 데이터 개수: {vector_count}개")
             print("[OK] ===== PGVector 연결 확인 완료 =====")
     except Exception as e:
@@ -498,12 +447,9 @@ def create_rag_chain(llm_model, embeddings_model):
     """RAG 체인 생성 - LangChain 체인 기능 활용."""
     try:
         # 1. Retriever 생성 (현재 Embedding 모델 사용)
-        current_vector_store = PGVector(
-            embedding_function=embeddings_model,
-            collection_name=COLLECTION_NAME,
-            connection_string=CONNECTION_STRING,
-        )
-        retriever = current_vector_store.as_retriever(search_kwargs={"k": 3})
+        retriever = VectorStoreRepository.get_or_create(
+            CONNECTION_STRING, COLLECTION_NAME, embeddings_model
+        ).get_retriever(search_kwargs={"k": 3})
 
         # 2. 대화 기록을 고려한 검색 쿼리 생성 프롬프트
         contextualize_q_system_prompt = (
@@ -590,19 +536,109 @@ def initialize_rag_chain():
         raise RuntimeError(error_msg)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 초기화."""
+async def initialize_components() -> None:
+    """서버 구성 요소 병렬 초기화 (백그라운드 실행).
+
+    1단계: DB 연결, OpenAI/로컬 Embedding, OpenAI LLM (서로 독립, 동시 실행)
+    2단계: PGVector 스토어 확인 (DB + Embedding 필요)
+    3단계: RAG 체인 생성
+
+    로컬 Midm 모델은 LOCAL_LLM_LAZY_LOAD=false가 아니면 첫 local 요청에서 로드합니다.
+    """
     global \
-        chat_service, \
         openai_embeddings, \
         local_embeddings, \
         openai_llm, \
         local_llm, \
         openai_rag_chain, \
         local_rag_chain, \
-        openai_quota_exceeded, \
-        vector_store
+        openai_quota_exceeded
+
+    readiness = chat_service.readiness
+    lazy_local_llm = os.getenv("LOCAL_LLM_LAZY_LOAD", "true").lower() == "true"
+    start = time.perf_counter()
+
+    # 1단계: 서로 독립적인 초기화 동시 실행
+    steps = {
+        "database": wait_for_postgres,
+        "openai_embeddings": chat_service.initialize_openai_embeddings,
+        "local_embeddings": chat_service.initialize_local_embeddings,
+        "openai_llm": chat_service.initialize_openai_llm,
+    }
+    if not lazy_local_llm:
+        steps["local_llm"] = chat_service.initialize_local_llm
+    results = await run_parallel(readiness, steps)
+
+    # ChatService의 모델을 전역 변수에 할당 (기존 코드 호환성)
+    openai_embeddings = chat_service.openai_embeddings
+    local_embeddings = chat_service.local_embeddings
+    openai_llm = chat_service.openai_llm
+    local_llm = chat_service.local_llm
+    openai_quota_exceeded = chat_service.openai_quota_exceeded
+
+    # 2단계: PGVector 스토어 확인
+    if results["database"] and (openai_embeddings or local_embeddings):
+        await run_parallel(readiness, {"vector_store": initialize_vector_store})
+    else:
+        readiness.set(
+            "vector_store",
+            FAILED,
+            error="데이터베이스 또는 Embedding 모델이 준비되지 않았습니다.",
+        )
+
+    # 3단계: RAG 체인 생성 (로컬 체인은 로컬 LLM이 로드된 경우에만)
+    chain_steps = {"openai_rag_chain": chat_service.initialize_openai_rag_chain}
+    if lazy_local_llm:
+        readiness.set("local_llm", LAZY)
+        readiness.set("local_rag_chain", LAZY)
+    else:
+        chain_steps["local_rag_chain"] = chat_service.initialize_local_rag_chain
+    await run_parallel(readiness, chain_steps)
+
+    # ChatService의 RAG 체인을 전역 변수에 할당 (기존 코드 호환성)
+    openai_rag_chain = chat_service.openai_rag_chain
+    local_rag_chain = chat_service.local_rag_chain
+
+    # 4단계: 크롤링 결과 주기 적재 (컬렉션과 같은 임베딩 공간에만 색인)
+    start_crawl_ingest()
+
+    print("\n" + "=" * 50)
+    print(
+        f"[OK] 서버 초기화 완료! ({readiness.overall()}, "
+        f"{time.perf_counter() - start:.2f}초)"
+    )
+    print("=" * 50)
+
+
+def start_crawl_ingest() -> None:
+    """크롤링 적재 스케줄 시작 (설정되지 않았거나 Embedding 모델이 없으면 건너뜀).
+
+    한 컬렉션에 차원이 다른 벡터가 섞이면 검색이 실패하므로,
+    initialize_vector_store()와 같은 embedding 모델로만 적재합니다.
+    """
+    global crawl_ingest_scheduler
+
+    from app.service.crawl_ingest_service_t import create_scheduler_from_env
+
+    try:
+        embeddings = select_embeddings(verbose=False)
+    except RuntimeError:
+        embeddings = None
+    crawl_ingest_scheduler = create_scheduler_from_env(
+        CONNECTION_STRING, COLLECTION_NAME, embeddings
+    )
+    if crawl_ingest_scheduler is not None:
+        crawl_ingest_scheduler.start()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """서버 시작 시 초기화.
+
+    ChatService만 만들고 바로 요청을 받습니다.
+    무거운 초기화는 백그라운드에서 병렬로 진행되며, 진행 상태는 /health에서 확인합니다.
+    """
+    global chat_service, startup_task
 
     print("=" * 50)
     print("LangChain FastAPI 서버 시작 중...")
@@ -614,12 +650,6 @@ async def startup_event():
     print(f"\n[INFO] LLM_PROVIDER: {llm_provider}")
     print(f"[INFO] LOCAL_MODEL_DIR: {local_model_dir}")
 
-    # Neon PostgreSQL 연결 대기
-    print("\n1. Neon PostgreSQL 연결 확인 중...")
-    wait_for_postgres()
-
-    # ChatService 초기화
-    print("\n2. ChatService 초기화 중...")
     from app.service.chat_service_t import ChatService
 
     chat_service = ChatService(
@@ -630,34 +660,18 @@ async def startup_event():
         else None,
     )
 
-    # Embedding 모델 초기화
-    print("\n3. Embedding 모델 초기화 중...")
-    chat_service.initialize_embeddings()
+    # 무거운 초기화는 백그라운드에서 진행 (서버는 즉시 요청 수신)
+    startup_task = asyncio.create_task(initialize_components())
 
-    # LLM 모델 초기화
-    print("\n4. LLM 모델 초기화 중...")
-    chat_service.initialize_llm()
 
-    # PGVector 스토어 초기화 (기존 함수 사용)
-    print("\n5. PGVector 스토어 초기화 중...")
-    # ChatService의 embeddings를 전역 변수에 할당 (기존 코드 호환성)
-    openai_embeddings = chat_service.openai_embeddings
-    local_embeddings = chat_service.local_embeddings
-    openai_llm = chat_service.openai_llm
-    local_llm = chat_service.local_llm
-    openai_quota_exceeded = chat_service.openai_quota_exceeded
-    initialize_vector_store()
-
-    # RAG 체인 초기화
-    print("\n6. RAG 체인 초기화 중...")
-    chat_service.initialize_rag_chain()
-    # ChatService의 RAG 체인을 전역 변수에 할당 (기존 코드 호환성)
-    openai_rag_chain = chat_service.openai_rag_chain
-    local_rag_chain = chat_service.local_rag_chain
-
-    print("\n" + "=" * 50)
-    print("[OK] 서버 초기화 완료!")
-    print("=" * 50)
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 리소스 정리."""
+    if crawl_ingest_scheduler is not None:
+        await crawl_ingest_scheduler.stop()
+    if chat_service is not None:
+        chat_service.shutdown()
+    VectorStoreRepository.dispose_engines()
 
 
 # 라우터 등록 (순환 import 방지를 위해 여기서 import)
@@ -682,14 +696,32 @@ async def health_check():
     global openai_quota_exceeded
     return {
         "status": "healthy",
+        "readiness": chat_service.readiness.overall() if chat_service else "starting",
+        "components": chat_service.readiness.snapshot() if chat_service else {},
         "vector_store": "initialized" if vector_store else "not initialized",
+        "db_pool": VectorStoreRepository.pool_status(CONNECTION_STRING),
+        "vector_stores": VectorStoreRepository.registered_stores(),
         "openai_embeddings": "initialized" if openai_embeddings else "not initialized",
         "local_embeddings": "initialized" if local_embeddings else "not initialized",
         "openai_llm": "initialized" if openai_llm else "not initialized",
-        "local_llm": "initialized" if local_llm else "not initialized",
+        "local_llm": "initialized"
+        if chat_service and chat_service.local_llm
+        else "not initialized",
         "openai_rag_chain": "initialized" if openai_rag_chain else "not initialized",
-        "local_rag_chain": "initialized" if local_rag_chain else "not initialized",
+        "local_rag_chain": "initialized"
+        if chat_service and chat_service.local_rag_chain
+        else "not initialized",
         "openai_quota_exceeded": openai_quota_exceeded,
+        "local_inference": chat_service.local_executor.stats()
+        if chat_service
+        else None,
+        "embedding_cache": chat_service.embedding_cache.stats()
+        if chat_service
+        else None,
+        "answer_cache": chat_service.answer_cache.stats() if chat_service else None,
+        "crawl_ingest": crawl_ingest_scheduler.stats()
+        if crawl_ingest_scheduler
+        else None,
     }
 
 
@@ -61,6 +61,9 @@ from langchain_community.vectorstores import PGVector
 from langchain_core.documents import Document
 from langchain_core.embeddings import FakeEmbeddings
 from langchain_openai import OpenAIEmbeddings
+from sqlalchemy import text
+
+from app.repository.vector_store import VectorStoreRepository
 
 # .env 파일 로드
 try:
@@ -92,13 +95,11 @@ COLLECTION_NAME = "langchain_collection"
 
 
 def wait_for_postgres(max_retries: int = 30, delay: int = 2) -> None:
-    """Neon PostgreSQL이 준비될 때까지 대기."""
-    import psycopg2
-
+    """Neon PostgreSQL이 준비될 때까지 대기 (공유 연결 풀 사용)."""
     for i in range(max_retries):
         try:
-            conn = psycopg2.connect(CONNECTION_STRING)
-            conn.close()
+            with VectorStoreRepository.connect(CONNECTION_STRING) as conn:
+                conn.execute(text("SELECT 1"))
             print("✓ Neon PostgreSQL 연결 성공!")
             return
         except Exception as e:
@@ -171,6 +172,7 @@ def main() -> None:
             ],
             collection_name=COLLECTION_NAME,
             connection_string=CONNECTION_STRING,
+            connection=VectorStoreRepository.get_engine(CONNECTION_STRING),
         )
         print("✓ PGVector 스토어 생성 완료")
     except Exception as e:
@@ -203,6 +205,7 @@ def main() -> None:
                     ],
                     collection_name=COLLECTION_NAME,
                     connection_string=CONNECTION_STRING,
+                    connection=VectorStoreRepository.get_engine(CONNECTION_STRING),
                 )
                 print("✓ FakeEmbeddings로 PGVector 스토어 생성 완료")
             except Exception as retry_error:
@@ -264,44 +267,45 @@ def main() -> None:
                     except Exception as e:
                         print(f"    ⚠ 쿼리 '{query}' 실패: {e}")
 
-                # Neon PostgreSQL에서 직접 데이터 개수 확인
+                # Neon PostgreSQL에서 직접 데이터 개수 확인 (공유 연결 풀 사용)
                 try:
-                    import psycopg2
-
-                    conn = psycopg2.connect(CONNECTION_STRING)
-                    cursor = conn.cursor()
-
-                    # PGVector 테이블 구조 확인 및 데이터 개수 조회
-                    # langchain_pg_embedding과 langchain_pg_collection 테이블 사용
-                    try:
-                        cursor.execute(
-                            """
-                            SELECT COUNT(*)
-                            FROM langchain_pg_embedding
-                            WHERE collection_id = (
-                                SELECT uuid FROM langchain_pg_collection WHERE name = %s
-                            )
-                            """,
-                            (COLLECTION_NAME,),
-                        )
-                        result = cursor.fetchone()
-                        count = result[0] if result else 0
-                    except Exception:
-                        # 테이블 이름이 다를 수 있으므로 다른 방법 시도
-                        cursor.execute(
-                            "SELECT COUNT(*) FROM information_schema.tables "
-                            "WHERE table_schema = 'public' AND table_name LIKE '%embedding%'"
-                        )
-                        result = cursor.fetchone()
-                        count = result[0] if result else "확인 불가"
-
-                    cursor.close()
-                    conn.close()
-
+                    with VectorStoreRepository.connect(CONNECTION_STRING) as conn:
+                        # PGVector 테이블 구조 확인 및 데이터 개수 조회
+                        # langchain_pg_embedding과 langchain_pg_collection 테이블 사용
+                        try:
+                            count = conn.execute(
+                                text(
+                                    """
+                                    SELECT COUNT(*)
+                                    FROM langchain_pg_embedding
+                                    WHERE collection_id = (
+                                        SELECT uuid FROM langchain_pg_collection WHERE name = :name
+                                    )
+                                    """
+                                ),
+                                {"name": COLLECTION_NAME},
+                            ).scalar()
+                            count = count or 0
+                        except Exception:
+                            # 실패한 트랜잭션 정리 후 다른 방법 시도
+                            conn.rollback()
+                            count = conn.execute(
+                                text(
+                                    "SELECT COUNT(*) FROM information_schema.tables "
+                                    "WHERE table_schema = 'public' AND table_name LIKE '%embedding%'"
+                                )
+                            ).scalar()
+                            count = count if count is not None else "확인 불가"
+
+                    pool_status = VectorStoreRepository.pool_status(CONNECTION_STRING)
                     print("\n  📊 PGVector 저장소 통계:")
                     print(f"     - 컬렉션: {COLLECTION_NAME}")
                     print(f"     - 저장된 문서 수: {count}개")
                     print("     - PostgreSQL 연결: ✓ 정상")
+                    print(
+                        f"     - 연결 풀: 사용 중 {pool_status.get('checkedout', 0)}개, "
+                        f"누적 연결 {pool_status.get('connects', 0)}회"
+                    )
                 except Exception as db_error:
                     print(f"\n  📊 Neon PostgreSQL 직접 조회 실패: {db_error}")
                     print("     - PGVector 검색은 정상 작동 중")
@@ -1,6 +1,13 @@
 """리포지토리 레이어 - 데이터 접근."""
 
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+from .semantic_cache import SemanticAnswerCache
 from .vector_store import VectorStoreRepository
 
-__all__ = ["VectorStoreRepository"]
+__all__ = [
+    "CachedEmbeddings",
+    "EmbeddingCache",
+    "SemanticAnswerCache",
+    "VectorStoreRepository",
+]
 
@@ -0,0 +1,194 @@
+"""임베딩 캐시 리포지토리.
+
+검색 질문 임베딩을 (모델, 정규화된 텍스트) 키로 캐싱합니다.
+- 1차: 프로세스 내 LRU + TTL
+- 2차(선택): SQLite 파일 (EMBEDDING_CACHE_DB 설정 시)
+
+자주 반복되는 질문은 OpenAI API 호출이나 로컬 모델 연산 없이 바로 검색합니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from app.repository.vector_store import embedding_model_key
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC + 공백 정리)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """LRU + TTL 메모리 캐시와 선택적 SQLite 캐시."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 3600,
+        db_path: Optional[str] = None,
+    ):
+        """임베딩 캐시 초기화.
+
+        Args:
+            max_size: 메모리 캐시 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초, 0 이하면 만료 없음)
+            db_path: SQLite 파일 경로 (None이면 메모리 캐시만 사용)
+        """
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                    "key TEXT PRIMARY KEY, vector BLOB NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._db.commit()
+                print(f"[INFO] 임베딩 디스크 캐시 사용: {db_path}")
+            except Exception as e:
+                print(f"[WARNING] 임베딩 디스크 캐시 초기화 실패: {str(e)[:100]}")
+                self._db = None
+
+    @staticmethod
+    def make_key(model_key: str, text: str) -> str:
+        """(모델, 정규화된 텍스트) 캐시 키."""
+        raw = f"{model_key}\0{normalize_query(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """캐시 조회 (메모리 → 디스크)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, vector = entry
+                if not self._is_expired(created_at):
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return vector
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT vector, created_at FROM embedding_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and not self._is_expired(row[1]):
+                    vector = array("d", row[0]).tolist()
+                    self._put_memory(key, row[1], vector)
+                    self._disk_hits += 1
+                    return vector
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, vector: List[float]) -> None:
+        """캐시 저장."""
+        created_at = time.time()
+        with self._lock:
+            self._put_memory(key, created_at, vector)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO embedding_cache (key, vector, created_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, array("d", vector).tobytes(), created_at),
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    print(f"[WARNING] 임베딩 디스크 캐시 저장 실패: {str(e)[:100]}")
+
+    def _put_memory(self, key: str, created_at: float, vector: List[float]) -> None:
+        self._memory[key] = (created_at, vector)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 적중/미스 통계."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "size": len(self._memory),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "disk": self._db is not None,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._disk_hits) / lookups, 4)
+                if lookups
+                else 0.0,
+            }
+
+    @classmethod
+    def from_env(cls) -> "EmbeddingCache":
+        """환경 변수 설정으로 캐시 생성."""
+        return cls(
+            max_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "1024")),
+            ttl_seconds=float(os.getenv("EMBEDDING_CACHE_TTL", "3600")),
+            db_path=os.getenv("EMBEDDING_CACHE_DB") or None,
+        )
+
+
+class CachedEmbeddings(Embeddings):
+    """질문 임베딩(embed_query)을 캐싱하는 Embeddings 래퍼.
+
+    문서 임베딩(embed_documents)은 캐싱하지 않고 그대로 위임합니다.
+    """
+
+    def __init__(self, underlying: Embeddings, cache: EmbeddingCache):
+        """캐시 래퍼 초기화.
+
+        Args:
+            underlying: 실제 Embedding 모델
+            cache: 임베딩 캐시
+        """
+        self.underlying = underlying
+        self.cache = cache
+        # 벡터 스토어 레지스트리에서 원래 모델과 같은 임베딩 공간으로 취급
+        self.model_key = embedding_model_key(underlying)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시 미사용)."""
+        return self.underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """질문 임베딩 (캐시 사용)."""
+        key = self.cache.make_key(self.model_key, text)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self.cache.put(key, vector)
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (비동기, 캐시 미사용)."""
+        return await self.underlying.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """질문 임베딩 (비동기, 캐시 사용)."""
+        key = self.cache.make_key(self.model_key, text)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = await self.underlying.aembed_query(text)
+            self.cache.put(key, vector)
+        return vector
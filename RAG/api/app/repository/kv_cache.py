@@ -0,0 +1,124 @@
+"""세션 KV 캐시 리포지토리.
+
+멀티턴 대화에서 세션마다 이전 턴까지의 토큰 ID와 모델의 past key/values를 보관합니다.
+다음 턴의 프롬프트는 이전 프롬프트 + 응답으로 시작하므로, 공통 접두사만큼은
+다시 prefill하지 않고 새 토큰만 모델에 넣을 수 있습니다.
+
+- 메모리 예산(바이트) 기준 LRU: 예산을 넘으면 가장 오래 쓰지 않은 세션부터 제거
+- 사용 중인 항목은 캐시에서 꺼내 두므로 같은 세션의 동시 요청이 텐서를 공유하지 않음
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def cache_nbytes(past_key_values: Any) -> int:
+    """past key/values가 차지하는 메모리 (바이트)."""
+    tensors = []
+    layers = getattr(past_key_values, "layers", None)
+    if layers is not None:
+        # transformers 4.56+ (레이어별 캐시 객체)
+        for layer in layers:
+            tensors.extend((getattr(layer, "keys", None), getattr(layer, "values", None)))
+    else:
+        tensors.extend(getattr(past_key_values, "key_cache", []))
+        tensors.extend(getattr(past_key_values, "value_cache", []))
+    return sum(
+        t.numel() * t.element_size() for t in tensors if hasattr(t, "element_size")
+    )
+
+
+class SessionKVCache:
+    """세션별 (토큰 ID, past key/values) LRU 캐시 (메모리 예산 기준)."""
+
+    def __init__(self, max_bytes: int):
+        """KV 캐시 초기화.
+
+        Args:
+            max_bytes: 전체 캐시 메모리 예산 (바이트, 0 이하면 캐시 사용 안 함)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._reused_tokens = 0
+        self._prefilled_tokens = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def take(self, session_id: str) -> Optional[Tuple[Any, Any]]:
+        """세션 항목을 꺼냄 (사용 후 put()으로 되돌림).
+
+        Returns:
+            (토큰 ID 텐서, past key/values) 또는 None
+        """
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._bytes -= entry[2]
+            self._hits += 1
+            return entry[0], entry[1]
+
+    def put(self, session_id: str, token_ids: Any, past_key_values: Any) -> None:
+        """세션 항목 저장 (예산을 넘으면 오래된 세션부터 제거)."""
+        if not self.enabled:
+            return
+        nbytes = cache_nbytes(past_key_values)
+        if nbytes > self.max_bytes:
+            # 한 세션이 예산보다 크면 저장하지 않음
+            return
+        with self._lock:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[session_id] = (token_ids, past_key_values, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[2]
+                self._evictions += 1
+
+    def invalidate(self, session_id: str) -> None:
+        """세션 항목 삭제 (히스토리가 바뀐 경우)."""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (모델 가중치가 바뀐 경우)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def record(self, reused_tokens: int, prefilled_tokens: int) -> None:
+        """재사용/새로 prefill한 토큰 수 집계."""
+        with self._lock:
+            self._reused_tokens += reused_tokens
+            self._prefilled_tokens += prefilled_tokens
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 적중/메모리 통계."""
+        with self._lock:
+            total_tokens = self._reused_tokens + self._prefilled_tokens
+            return {
+                "sessions": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "reused_tokens": self._reused_tokens,
+                "prefilled_tokens": self._prefilled_tokens,
+                "reuse_rate": round(self._reused_tokens / total_tokens, 4)
+                if total_tokens
+                else 0.0,
+            }
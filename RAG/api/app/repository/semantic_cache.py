@@ -0,0 +1,201 @@
+"""시맨틱 답변 캐시 리포지토리.
+
+대화 기록이 없는 첫 질문에 대해, 의미가 거의 같은 이전 질문의 답변을 재사용합니다.
+("LangChain이 뭐야?" / "LangChain은 무엇인가요?")
+
+질문 임베딩을 정규화하여 (컬렉션, 모델 타입)별 작은 메모리 테이블에 저장하고,
+코사인 유사도가 임계값 이상이면 캐시된 답변을 반환합니다.
+컬렉션에 문서가 추가되면 해당 컬렉션의 캐시를 비웁니다.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class CachedAnswer:
+    """캐시된 답변."""
+
+    question: str
+    answer: str
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+    similarity: float = 1.0
+
+
+class _AnswerTable:
+    """(컬렉션, 모델 타입) 하나에 대한 벡터 테이블."""
+
+    def __init__(self):
+        self.vectors: Optional[np.ndarray] = None
+        self.entries: List[Tuple[float, CachedAnswer]] = []
+
+    def search(self, vector: np.ndarray) -> Tuple[int, float]:
+        """가장 유사한 항목의 (인덱스, 코사인 유사도)."""
+        if self.vectors is None or not self.entries:
+            return -1, 0.0
+        scores = self.vectors @ vector
+        index = int(np.argmax(scores))
+        return index, float(scores[index])
+
+    def append(self, vector: np.ndarray, entry: CachedAnswer, max_entries: int) -> None:
+        """항목 추가 (초과 시 가장 오래된 항목 제거)."""
+        row = vector.reshape(1, -1)
+        if self.vectors is None or self.vectors.shape[1] != row.shape[1]:
+            self.vectors = row
+            self.entries = [(time.time(), entry)]
+            return
+        self.vectors = np.vstack([self.vectors, row])
+        self.entries.append((time.time(), entry))
+        overflow = len(self.entries) - max_entries
+        if overflow > 0:
+            self.vectors = self.vectors[overflow:]
+            self.entries = self.entries[overflow:]
+
+    def remove(self, index: int) -> None:
+        """항목 제거."""
+        self.vectors = np.delete(self.vectors, index, axis=0)
+        del self.entries[index]
+
+
+class SemanticAnswerCache:
+    """임베딩 유사도 기반 답변 캐시."""
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl_seconds: float = 3600,
+        enabled: bool = True,
+    ):
+        """시맨틱 답변 캐시 초기화.
+
+        Args:
+            threshold: 캐시 적중으로 볼 최소 코사인 유사도
+            max_entries: (컬렉션, 모델 타입)별 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초, 0 이하면 만료 없음)
+            enabled: 캐시 사용 여부
+        """
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._tables: Dict[Tuple[str, str], _AnswerTable] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> Optional[np.ndarray]:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0:
+            return None
+        return array / norm
+
+    def lookup(
+        self, collection_name: str, model_type: str, vector: List[float]
+    ) -> Optional[CachedAnswer]:
+        """유사한 질문의 캐시된 답변 조회.
+
+        Args:
+            collection_name: 벡터 컬렉션 이름
+            model_type: 모델 타입 ("openai" 또는 "local")
+            vector: 질문 임베딩
+
+        Returns:
+            캐시된 답변 (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        query = self._normalize(vector)
+        if query is None:
+            return None
+
+        with self._lock:
+            table = self._tables.get((collection_name, model_type))
+            if (
+                table is None
+                or table.vectors is None
+                or table.vectors.shape[1] != query.shape[0]
+            ):
+                self._misses += 1
+                return None
+
+            index, similarity = table.search(query)
+            if index >= 0 and similarity >= self.threshold:
+                created_at, entry = table.entries[index]
+                age = time.time() - created_at
+                if self.ttl_seconds <= 0 or age <= self.ttl_seconds:
+                    self._hits += 1
+                    return CachedAnswer(
+                        question=entry.question,
+                        answer=entry.answer,
+                        sources=entry.sources,
+                        similarity=similarity,
+                    )
+                # 만료된 항목 제거
+                table.remove(index)
+
+            self._misses += 1
+            return None
+
+    def store(
+        self,
+        collection_name: str,
+        model_type: str,
+        vector: List[float],
+        question: str,
+        answer: str,
+        sources: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """질문 임베딩과 답변 저장."""
+        if not self.enabled:
+            return
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+
+        entry = CachedAnswer(question=question, answer=answer, sources=sources or [])
+        with self._lock:
+            table = self._tables.setdefault(
+                (collection_name, model_type), _AnswerTable()
+            )
+            table.append(normalized, entry, self.max_entries)
+
+    def invalidate_collection(self, collection_name: str) -> None:
+        """컬렉션의 모든 캐시 항목 삭제 (문서 추가 시 호출)."""
+        with self._lock:
+            keys = [key for key in self._tables if key[0] == collection_name]
+            for key in keys:
+                del self._tables[key]
+            if keys:
+                self._invalidations += 1
+                print(f"[INFO] 시맨틱 답변 캐시 무효화: {collection_name}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "entries": sum(len(table.entries) for table in self._tables.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+    @classmethod
+    def from_env(cls) -> "SemanticAnswerCache":
+        """환경 변수 설정으로 캐시 생성."""
+        return cls(
+            threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95")),
+            max_entries=int(os.getenv("SEMANTIC_CACHE_SIZE", "1000")),
+            ttl_seconds=float(os.getenv("SEMANTIC_CACHE_TTL", "3600")),
+            enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true",
+        )
@@ -1,26 +1,212 @@
-"""벡터 스토어 리포지토리."""
+"""벡터 스토어 리포지토리.
+
+PGVector 스토어와 PostgreSQL 연결 풀을 관리합니다.
+연결 문자열마다 하나의 SQLAlchemy 엔진(연결 풀)을 만들어
+RAG 체인, 헬스 체크, 워커가 함께 재사용합니다.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from typing import List, Optional, Dict, Any
 from langchain_community.vectorstores import PGVector
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
+from langchain_core.indexing import IndexingResult, index
 from langchain_core.retrievers import BaseRetriever
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+
+try:
+    from langchain_classic.indexes import SQLRecordManager
+except ImportError:
+    from langchain.indexes import SQLRecordManager
+
+# 연결 문자열별 공유 엔진 (연결 풀)
+_engine_lock = threading.Lock()
+_engines: Dict[str, Engine] = {}
+_pool_counters: Dict[str, Dict[str, int]] = {}
+
+# (연결 문자열, 컬렉션, 임베딩 모델)별 공유 리포지토리
+_repository_lock = threading.Lock()
+_repositories: Dict[Tuple[str, str, str], "VectorStoreRepository"] = {}
+
+# 컬렉션 문서가 변경되면 호출되는 콜백 (답변 캐시 무효화 등)
+_invalidation_listeners: List[Callable[[str], None]] = []
+
+
+def embedding_model_key(embeddings: Embeddings) -> str:
+    """임베딩 모델을 식별하는 키 (같은 임베딩 공간이면 같은 키)."""
+    # 캐시 래퍼 등은 원래 모델의 키를 그대로 노출
+    model_key = getattr(embeddings, "model_key", None)
+    if isinstance(model_key, str) and model_key:
+        return model_key
+    for attr in ("model", "model_name"):
+        value = getattr(embeddings, attr, None)
+        if isinstance(value, str) and value:
+            return f"{type(embeddings).__name__}:{value}"
+    return type(embeddings).__name__
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """연결 풀 설정 (환경 변수로 조정)."""
+    return {
+        "pool_size": int(os.getenv("PG_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("PG_MAX_OVERFLOW", "5")),
+        "pool_timeout": int(os.getenv("PG_POOL_TIMEOUT", "30")),
+        # Neon은 유휴 연결을 끊으므로 주기적으로 재생성
+        "pool_recycle": int(os.getenv("PG_POOL_RECYCLE", "300")),
+        # 체크아웃 시 연결 상태 확인 (끊긴 연결 자동 교체)
+        "pool_pre_ping": True,
+    }
+
+
+def _register_pool_counters(engine: Engine, connection_string: str) -> None:
+    """연결 풀 이벤트 카운터 등록."""
+    counters = {"connects": 0, "checkouts": 0, "invalidations": 0}
+    _pool_counters[connection_string] = counters
+
+    def on_connect(*_: Any) -> None:
+        counters["connects"] += 1
+
+    def on_checkout(*_: Any) -> None:
+        counters["checkouts"] += 1
+
+    def on_invalidate(*_: Any) -> None:
+        counters["invalidations"] += 1
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "invalidate", on_invalidate)
 
 
 class VectorStoreRepository:
     """벡터 스토어 리포지토리."""
 
+    @staticmethod
+    def get_engine(connection_string: str) -> Engine:
+        """연결 문자열에 대한 공유 엔진(연결 풀) 반환."""
+        engine = _engines.get(connection_string)
+        if engine is not None:
+            return engine
+
+        with _engine_lock:
+            engine = _engines.get(connection_string)
+            if engine is None:
+                engine = create_engine(connection_string, **_pool_kwargs())
+                _register_pool_counters(engine, connection_string)
+                _engines[connection_string] = engine
+            return engine
+
+    @staticmethod
+    @contextmanager
+    def connect(connection_string: str) -> Iterator[Connection]:
+        """공유 연결 풀에서 연결을 빌려 사용."""
+        with VectorStoreRepository.get_engine(connection_string).connect() as conn:
+            yield conn
+
+    @staticmethod
+    def pool_status(connection_string: str) -> Dict[str, Any]:
+        """연결 풀 상태 및 메트릭 반환."""
+        engine = _engines.get(connection_string)
+        if engine is None:
+            return {"initialized": False}
+
+        pool = engine.pool
+        status: Dict[str, Any] = {"initialized": True}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            getter = getattr(pool, name, None)
+            if callable(getter):
+                status[name] = getter()
+        status.update(_pool_counters.get(connection_string, {}))
+        return status
+
+    @staticmethod
+    def dispose_engines() -> None:
+        """모든 공유 엔진의 연결 풀 정리 (서버 종료 시)."""
+        with _engine_lock:
+            for engine in _engines.values():
+                engine.dispose()
+            _engines.clear()
+
+    @classmethod
+    def get_or_create(
+        cls,
+        connection_string: str,
+        collection_name: str,
+        embeddings: Embeddings,
+    ) -> "VectorStoreRepository":
+        """(컬렉션, 임베딩 모델)별 공유 리포지토리 반환.
+
+        같은 임베딩 공간에 대해서는 벡터 스토어와 컬렉션 확인을 한 번만 수행하고,
+        이후 호출에서는 같은 인스턴스를 재사용합니다.
+
+        Args:
+            connection_string: PostgreSQL 연결 문자열
+            collection_name: PGVector 컬렉션 이름
+            embeddings: Embedding 모델
+
+        Returns:
+            공유 VectorStoreRepository 인스턴스
+        """
+        key = (connection_string, collection_name, embedding_model_key(embeddings))
+        repository = _repositories.get(key)
+        if repository is not None:
+            return repository
+
+        with _repository_lock:
+            repository = _repositories.get(key)
+            if repository is None:
+                repository = cls(connection_string, collection_name, embeddings)
+                _repositories[key] = repository
+                print(
+                    f"[INFO] 벡터 스토어 등록: {collection_name} ({key[2]}), "
+                    f"총 {len(_repositories)}개"
+                )
+            return repository
+
+    @staticmethod
+    def registered_stores() -> List[Dict[str, str]]:
+        """등록된 (컬렉션, 임베딩 모델) 목록 반환."""
+        return [
+            {"collection": collection, "embedding_model": model_key}
+            for _, collection, model_key in _repositories.keys()
+        ]
+
+    @staticmethod
+    def add_invalidation_listener(listener: Callable[[str], None]) -> None:
+        """컬렉션 문서 변경 시 호출할 콜백 등록 (인자: 컬렉션 이름)."""
+        if listener not in _invalidation_listeners:
+            _invalidation_listeners.append(listener)
+
+    @staticmethod
+    def notify_collection_changed(collection_name: str) -> None:
+        """컬렉션 문서 변경 알림."""
+        for listener in list(_invalidation_listeners):
+            try:
+                listener(collection_name)
+            except Exception as e:
+                print(f"[WARNING] 컬렉션 변경 알림 처리 실패: {str(e)[:100]}")
+
     def __init__(
         self,
         connection_string: str,
         collection_name: str,
         embeddings: Embeddings,
     ):
-        """벡터 스토어 리포지토리 초기화."""
+        """벡터 스토어 리포지토리 초기화.
+
+        공유 인스턴스가 필요하면 get_or_create()를 사용하세요.
+        """
         self.connection_string = connection_string
         self.collection_name = collection_name
         self.embeddings = embeddings
+        self.engine = self.get_engine(connection_string)
         self.vector_store: Optional[PGVector] = None
+        self._retrievers: Dict[Tuple[Tuple[str, str], ...], BaseRetriever] = {}
+        self._record_manager: Optional[SQLRecordManager] = None
+        self._record_manager_lock = threading.Lock()
         self._initialize()
 
     def _initialize(self) -> None:
@@ -31,6 +217,7 @@ class VectorStoreRepository:
                 embedding_function=self.embeddings,
                 collection_name=self.collection_name,
                 connection_string=self.connection_string,
+                connection=self.engine,
             )
         except Exception:
             # 컬렉션이 없으면 생성 (초기 문서로)
@@ -52,15 +239,21 @@ class VectorStoreRepository:
                 ],
                 collection_name=self.collection_name,
                 connection_string=self.connection_string,
+                connection=self.engine,
             )
 
     def get_retriever(self, search_kwargs: Optional[Dict[str, Any]] = None) -> BaseRetriever:
-        """Retriever 반환."""
+        """Retriever 반환 (같은 검색 옵션이면 같은 인스턴스 재사용)."""
         if not self.vector_store:
             raise RuntimeError("벡터 스토어가 초기화되지 않았습니다.")
-        return self.vector_store.as_retriever(
-            search_kwargs=search_kwargs or {"k": 3}
-        )
+        search_kwargs = search_kwargs or {"k": 3}
+        # filter 등 해시 불가능한 값이 있을 수 있으므로 repr로 키 구성
+        key = tuple(sorted((name, repr(value)) for name, value in search_kwargs.items()))
+        retriever = self._retrievers.get(key)
+        if retriever is None:
+            retriever = self.vector_store.as_retriever(search_kwargs=search_kwargs)
+            self._retrievers[key] = retriever
+        return retriever
 
     def similarity_search(
         self, query: str, k: int = 3
@@ -71,8 +264,65 @@ class VectorStoreRepository:
         return self.vector_store.similarity_search(query, k=k)
 
     def add_documents(self, documents: List[Document]) -> List[str]:
-        """문서 추가."""
+        """문서 추가 (컬렉션 변경 알림 포함)."""
         if not self.vector_store:
             raise RuntimeError("벡터 스토어가 초기화되지 않았습니다.")
-        return self.vector_store.add_documents(documents)
+        ids = self.vector_store.add_documents(documents)
+        self.notify_collection_changed(self.collection_name)
+        return ids
+
+    def get_record_manager(self) -> SQLRecordManager:
+        """색인 기록 관리자 반환 (같은 PostgreSQL의 upsertion_record 테이블 사용).
+
+        네임스페이스는 (컬렉션, 임베딩 모델)별로 분리되어,
+        같은 문서라도 임베딩 공간이 다르면 따로 기록됩니다.
+        """
+        if self._record_manager is not None:
+            return self._record_manager
+
+        with self._record_manager_lock:
+            if self._record_manager is None:
+                namespace = (
+                    f"pgvector/{self.collection_name}/"
+                    f"{embedding_model_key(self.embeddings)}"
+                )
+                record_manager = SQLRecordManager(namespace, engine=self.engine)
+                record_manager.create_schema()
+                self._record_manager = record_manager
+            return self._record_manager
+
+    def index_documents(
+        self,
+        documents: List[Document],
+        cleanup: Optional[str] = "incremental",
+        source_id_key: Optional[str] = "source",
+        batch_size: int = 100,
+    ) -> IndexingResult:
+        """내용 해시 기반 중복 제거 색인.
 
+        이미 같은 내용으로 색인된 문서는 임베딩 없이 건너뛰고,
+        incremental 모드에서는 같은 source의 이전 버전 문서를 삭제합니다.
+
+        Args:
+            documents: 색인할 문서 목록
+            cleanup: 정리 모드 (None, "incremental", "full", "scoped_full")
+            source_id_key: 원본 식별 메타데이터 키 (incremental 모드에서 필수)
+            batch_size: 임베딩/저장 배치 크기
+
+        Returns:
+            색인 결과 (num_added, num_updated, num_skipped, num_deleted)
+        """
+        if not self.vector_store:
+            raise RuntimeError("벡터 스토어가 초기화되지 않았습니다.")
+        result = index(
+            documents,
+            self.get_record_manager(),
+            self.vector_store,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_key=source_id_key if cleanup else None,
+            key_encoder="sha256",
+        )
+        if result["num_added"] or result["num_updated"] or result["num_deleted"]:
+            self.notify_collection_changed(self.collection_name)
+        return result
@@ -4,14 +4,20 @@ FastAPI 기준의 API 엔드포인트 계층입니다.
 chat_router.py
 POST /api/chat
 세션 ID, 메시지 리스트 등을 받아 대화형 응답 반환.
+POST /api/chat/stream
+같은 요청을 받아 검색 문서와 답변 토큰을 SSE로 스트리밍.
 """
 
+import json
 import os
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from app.service.inference_executor import InferenceQueueFullError
+
 router = APIRouter(prefix="/api", tags=["chat"])
 
 
@@ -51,19 +57,11 @@ def get_chat_service():
     return api_server.chat_service
 
 
-@router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """챗봇 API 엔드포인트 - ChatService를 사용한 RAG 체인."""
-    # ChatService 인스턴스 가져오기
-    chat_service = get_chat_service()
-    if chat_service is None:
-        raise HTTPException(
-            status_code=503,
-            detail="ChatService가 초기화되지 않았습니다. 서버를 재시작해주세요.",
-        )
+def _resolve_model_type(request: ChatRequest) -> str:
+    """요청의 model_type 결정.
 
-    # 모델 타입에 따라 적절한 RAG 체인 선택
-    # 프론트엔드에서 전달된 model_type이 없으면 .env의 LLM_PROVIDER 사용
+    프론트엔드에서 전달된 model_type이 없으면 .env의 LLM_PROVIDER 사용.
+    """
     model_type = request.model_type or os.getenv("LLM_PROVIDER", "openai")
     if model_type:
         model_type = model_type.lower()
@@ -72,19 +70,22 @@ async def chat(request: ChatRequest):
     print(
         f"[DEBUG] 받은 model_type: {request.model_type}, 처리된 model_type: {model_type}"
     )
+    return model_type
 
-    try:
-        # ChatService를 통해 RAG 체인 실행
-        response_text = chat_service.chat_with_rag(
-            message=request.message,
-            history=request.history,
-            model_type=model_type,
-        )
 
-        return ChatResponse(response=response_text)
+def _to_http_exception(e: Exception) -> HTTPException:
+    """챗봇 응답 생성 중 발생한 예외를 HTTPException으로 변환."""
+    error_msg = str(e)
 
-    except RuntimeError as e:
-        error_msg = str(e)
+    if isinstance(e, InferenceQueueFullError):
+        print(f"[WARNING] 로컬 모델 추론 대기열 초과: {error_msg}")
+        return HTTPException(
+            status_code=503,
+            detail=error_msg,
+            headers={"Retry-After": "1"},
+        )
+
+    if isinstance(e, RuntimeError):
         print(f"[ERROR] 챗봇 응답 생성 실패: {error_msg}")
 
         # OpenAI API 할당량 초과 에러 확인
@@ -96,42 +97,126 @@ async def chat(request: ChatRequest):
                 "2. OpenAI 계정에 결제 정보를 추가하거나 할당량을 늘리세요\n"
                 "3. 또는 '🖥️ 로컬 모델' 버튼을 선택하여 로컬 Midm 모델을 사용하세요"
             )
-            raise HTTPException(
+            return HTTPException(
                 status_code=503,
                 detail=error_detail,
             )
-        else:
-            raise HTTPException(
-                status_code=503,
-                detail=error_msg,
-            )
+        return HTTPException(
+            status_code=503,
+            detail=error_msg,
+        )
 
-    except ValueError as e:
-        error_msg = str(e)
+    if isinstance(e, ValueError):
         print(f"[ERROR] 잘못된 요청: {error_msg}")
-        raise HTTPException(
+        return HTTPException(
             status_code=400,
             detail=error_msg,
         )
 
+    print(f"[ERROR] 챗봇 응답 생성 실패: {error_msg}")
+
+    # OpenAI API 호출량 초과 에러 확인
+    if (
+        "quota" in error_msg.lower()
+        or "429" in error_msg
+        or "insufficient_quota" in error_msg
+        or "exceeded" in error_msg.lower()
+    ):
+        error_detail = (
+            "OpenAI API 호출량이 초과되었습니다. 할당량을 확인하고 다시 시도해주세요."
+        )
+        return HTTPException(
+            status_code=429,
+            detail=error_detail,
+        )
+    return HTTPException(
+        status_code=500,
+        detail=f"응답 생성 중 오류가 발생했습니다: {error_msg[:200]}",
+    )
+
+
+def _format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식으로 직렬화."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    """챗봇 API 엔드포인트 - ChatService를 사용한 RAG 체인."""
+    # ChatService 인스턴스 가져오기
+    chat_service = get_chat_service()
+    if chat_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="ChatService가 초기화되지 않았습니다. 서버를 재시작해주세요.",
+        )
+
+    # 모델 타입에 따라 적절한 RAG 체인 선택
+    model_type = _resolve_model_type(request)
+
+    try:
+        # ChatService를 통해 RAG 체인 실행 (이벤트 루프를 막지 않는 비동기 경로)
+        response_text = await chat_service.achat_with_rag(
+            message=request.message,
+            history=request.history,
+            model_type=model_type,
+        )
+
+        return ChatResponse(response=response_text)
+
     except Exception as e:
-        error_msg = str(e)
-        print(f"[ERROR] 챗봇 응답 생성 실패: {error_msg}")
+        raise _to_http_exception(e)
 
-        # OpenAI API 호출량 초과 에러 확인
-        if (
-            "quota" in error_msg.lower()
-            or "429" in error_msg
-            or "insufficient_quota" in error_msg
-            or "exceeded" in error_msg.lower()
-        ):
-            error_detail = "OpenAI API 호출량이 초과되었습니다. 할당량을 확인하고 다시 시도해주세요."
-            raise HTTPException(
-                status_code=429,
-                detail=error_detail,
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail=f"응답 생성 중 오류가 발생했습니다: {error_msg[:200]}",
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """챗봇 스트리밍 API 엔드포인트 - Server-Sent Events.
+
+    이벤트 순서:
+    - sources: 검색된 문서 목록
+    - token: 답변 토큰 (여러 번)
+    - done: 전체 답변
+    - error: 스트리밍 도중 오류 발생 시
+    """
+    # ChatService 인스턴스 가져오기
+    chat_service = get_chat_service()
+    if chat_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="ChatService가 초기화되지 않았습니다. 서버를 재시작해주세요.",
+        )
+
+    model_type = _resolve_model_type(request)
+    events = chat_service.astream_chat_with_rag(
+        message=request.message,
+        history=request.history,
+        model_type=model_type,
+    )
+
+    # 첫 이벤트까지는 일반 HTTP 오류로 응답 (모델 선택 실패, 대기열 초과 등)
+    try:
+        first_event = await events.__anext__()
+    except StopAsyncIteration:
+        first_event = None
+    except Exception as e:
+        raise _to_http_exception(e)
+
+    async def event_generator():
+        try:
+            if first_event is not None:
+                yield _format_sse(first_event["event"], first_event["data"])
+            async for event in events:
+                yield _format_sse(event["event"], event["data"])
+        except Exception as e:
+            error = _to_http_exception(e)
+            yield _format_sse(
+                "error", {"status_code": error.status_code, "detail": error.detail}
             )
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
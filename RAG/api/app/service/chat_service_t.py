@@ -6,12 +6,14 @@ PEFT QLoRA 방식으로 대화하고 학습하는 기능 포함.
 세션별 히스토리 관리, 요약, 토큰 절약 전략 등.
 """
 
+import asyncio
 import json
 import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import torch
 from datasets import Dataset
@@ -21,6 +23,8 @@ from langchain_classic.chains import (
 )
 from langchain_classic.chains.combine_documents import create_stuff_documents_chain
 from langchain_community.vectorstores import PGVector
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import Runnable
@@ -40,6 +44,12 @@ from transformers import (
     TrainingArguments,
 )
 
+try:
+    from transformers import DynamicCache
+except ImportError:
+    # transformers < 4.36: 세션 KV 캐시 없이 매 턴 전체 prefill
+    DynamicCache = None
+
 try:
     from trl import SFTTrainer
 except ImportError:
@@ -50,6 +60,101 @@ try:
 except ImportError:
     from langchain_community.embeddings import HuggingFaceEmbeddings
 
+from app.repository.embedding_cache import CachedEmbeddings, EmbeddingCache
+from app.repository.kv_cache import SessionKVCache
+from app.repository.semantic_cache import CachedAnswer, SemanticAnswerCache
+from app.repository.vector_store import VectorStoreRepository
+from app.service.inference_executor import BoundedInferenceExecutor
+from app.service.startup import ComponentReadiness, check_openai_model
+
+
+class AnswerStreamCleaner:
+    """스트리밍 답변에 "Assistant:" 정리 규칙을 점진적으로 적용.
+
+    - 응답이 역할 접두어("System:", "Human:", "Assistant:")로 시작하면
+      첫 "Assistant:" 이후부터 다음 "\\nHuman:" 전까지만 내보냅니다.
+    - 그렇지 않으면 토큰을 그대로 내보냅니다.
+
+    _extract_answer는 "Assistant:"가 응답 중간에 있어도 그 앞을 버리지만,
+    스트리밍은 이미 보낸 토큰을 되돌릴 수 없어 응답 첫머리만 판별합니다.
+    그래서 역할 접두어 없이 시작해 중간에 "Assistant:"가 나오는 응답은
+    token 이벤트와 /chat 응답이 다를 수 있으며, done 이벤트의 response는
+    전체 응답에 _extract_answer를 적용해 /chat과 같게 맞춥니다.
+    """
+
+    ROLE_PREFIXES = ("System:", "Human:", "Assistant:")
+    ASSISTANT_MARKER = "Assistant:"
+    HUMAN_MARKER = "\nHuman:"
+
+    def __init__(self):
+        """정리기 초기화."""
+        self._buffer = ""
+        # detect: 역할 접두어 판별 중, passthrough: 그대로 출력,
+        # answer: Assistant 답변 출력 중, done: 이후 내용 버림
+        self._mode = "detect"
+        self._answer_started = False
+
+    def _could_be_role_prefix(self, text: str) -> bool:
+        """텍스트가 역할 접두어(또는 그 일부)로 시작하는지 확인."""
+        return any(
+            prefix.startswith(text) or text.startswith(prefix)
+            for prefix in self.ROLE_PREFIXES
+        )
+
+    @staticmethod
+    def _partial_suffix_len(text: str, marker: str) -> int:
+        """텍스트 끝이 marker의 앞부분과 겹치는 길이."""
+        for size in range(min(len(text), len(marker) - 1), 0, -1):
+            if marker.startswith(text[-size:]):
+                return size
+        return 0
+
+    def feed(self, chunk: str) -> str:
+        """토큰 조각을 받아 내보낼 텍스트 반환."""
+        if self._mode == "done" or not chunk:
+            return ""
+        if self._mode == "passthrough":
+            return chunk
+
+        self._buffer += chunk
+
+        if self._mode == "detect":
+            marker_pos = self._buffer.find(self.ASSISTANT_MARKER)
+            if marker_pos >= 0:
+                self._mode = "answer"
+                self._buffer = self._buffer[marker_pos + len(self.ASSISTANT_MARKER) :]
+            else:
+                head = self._buffer.lstrip()
+                if not head or self._could_be_role_prefix(head):
+                    return ""
+                self._mode = "passthrough"
+                text, self._buffer = self._buffer, ""
+                return text
+
+        # answer 모드: 앞 공백을 제거하고 다음 "\nHuman:" 전까지만 출력
+        if not self._answer_started:
+            self._buffer = self._buffer.lstrip()
+            if not self._buffer:
+                return ""
+            self._answer_started = True
+        human_pos = self._buffer.find(self.HUMAN_MARKER)
+        if human_pos >= 0:
+            text = self._buffer[:human_pos]
+            self._buffer = ""
+            self._mode = "done"
+            return text
+        keep = self._partial_suffix_len(self._buffer, self.HUMAN_MARKER)
+        text = self._buffer[: len(self._buffer) - keep]
+        self._buffer = self._buffer[len(self._buffer) - keep :]
+        return text
+
+    def flush(self) -> str:
+        """스트림 종료 시 남은 텍스트 반환."""
+        text, self._buffer = self._buffer, ""
+        if self._mode == "done":
+            return ""
+        return text
+
 
 class ChatService:
     """채팅 서비스 - 모델 로딩 및 RAG 체인 관리."""
@@ -72,8 +177,8 @@ class ChatService:
         self.model_name_or_path = model_name_or_path
 
         # 모델 및 체인
-        self.openai_embeddings: Optional[OpenAIEmbeddings] = None
-        self.local_embeddings: Optional[HuggingFaceEmbeddings] = None
+        self.openai_embeddings: Optional[Embeddings] = None
+        self.local_embeddings: Optional[Embeddings] = None
         self.openai_llm: Optional[ChatOpenAI] = None
         self.local_llm: Optional[Any] = None
         self.openai_rag_chain: Optional[Runnable] = None
@@ -81,54 +186,117 @@ class ChatService:
         self.openai_quota_exceeded = False
         self.vector_store: Optional[PGVector] = None
 
-    def initialize_embeddings(self) -> None:
-        """Embedding 모델 초기화 - OpenAI와 로컬 모델 모두 초기화."""
-        openai_api_key = os.getenv("OPENAI_API_KEY")
+        # 질문 임베딩 캐시 (모델별 키로 구분되므로 두 모델이 공유)
+        self.embedding_cache = EmbeddingCache.from_env()
 
-        # OpenAI Embedding 초기화
-        if openai_api_key and openai_api_key != "your-api-key-here":
-            try:
-                self.openai_embeddings = OpenAIEmbeddings()
-                # 간단한 테스트
-                self.openai_embeddings.embed_query("test")
-                print("[OK] OpenAI Embedding 모델 초기화 완료")
-            except Exception as e:
-                error_msg = str(e)
-                if (
-                    "quota" in error_msg.lower()
-                    or "429" in error_msg
-                    or "insufficient_quota" in error_msg
-                ):
-                    self.openai_quota_exceeded = True
-                    print(f"[WARNING] OpenAI API 할당량 초과: {error_msg[:100]}...")
-                    print("   OpenAI Embedding을 사용할 수 없습니다.")
-                    self.openai_embeddings = None
-                else:
-                    print(
-                        f"[WARNING] OpenAI Embedding 초기화 실패: {error_msg[:100]}..."
-                    )
-                    self.openai_embeddings = None
+        # 첫 질문용 시맨틱 답변 캐시 (컬렉션에 문서가 추가되면 무효화)
+        self.answer_cache = SemanticAnswerCache.from_env()
+        VectorStoreRepository.add_invalidation_listener(
+            self.answer_cache.invalidate_collection
+        )
+
+        # 컴포넌트별 초기화 상태 (/health 노출) 및 로컬 모델 지연 로드
+        self.readiness = ComponentReadiness()
+        self._local_init_lock = threading.Lock()
+        self._local_init_error: Optional[str] = None
+
+        # 로컬 모델 추론 전용 실행기 (이벤트 루프 블로킹 방지)
+        self.local_executor = BoundedInferenceExecutor(
+            max_workers=int(os.getenv("LOCAL_INFERENCE_WORKERS", "1")),
+            max_queue=int(os.getenv("LOCAL_INFERENCE_MAX_QUEUE", "8")),
+            thread_name_prefix="midm-inference",
+        )
+
+    @staticmethod
+    def _has_openai_api_key() -> bool:
+        """OpenAI API 키 설정 여부."""
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        return bool(openai_api_key) and openai_api_key != "your-api-key-here"
+
+    def _handle_openai_init_error(self, component: str, error: Exception) -> None:
+        """OpenAI 초기화 오류 로그 (할당량 초과 여부 기록)."""
+        error_msg = str(error)
+        if (
+            "quota" in error_msg.lower()
+            or "429" in error_msg
+            or "insufficient_quota" in error_msg
+        ):
+            self.openai_quota_exceeded = True
+            print(f"[WARNING] OpenAI API 할당량 초과: {error_msg[:100]}...")
+            print(f"   {component}을 사용할 수 없습니다.")
         else:
+            print(f"[WARNING] {component} 초기화 실패: {error_msg[:100]}...")
+
+    def initialize_openai_embeddings(self) -> bool:
+        """OpenAI Embedding 모델 초기화.
+
+        실제 임베딩 호출 대신 모델 메타데이터 조회로 API 키를 확인합니다 (과금 없음).
+
+        Returns:
+            초기화 여부 (API 키가 없으면 False)
+
+        Raises:
+            Exception: API 키 또는 모델 확인 실패
+        """
+        if not self._has_openai_api_key():
             print("[WARNING] OpenAI API 키가 설정되지 않았습니다.")
             self.openai_embeddings = None
+            return False
+
+        try:
+            embeddings = OpenAIEmbeddings()
+            check_openai_model(embeddings.model)
+        except Exception as e:
+            self._handle_openai_init_error("OpenAI Embedding", e)
+            self.openai_embeddings = None
+            raise
+
+        # 질문 임베딩 캐시 적용 (반복 질문은 임베딩 단계 생략)
+        self.openai_embeddings = CachedEmbeddings(embeddings, self.embedding_cache)
+        print("[OK] OpenAI Embedding 모델 초기화 완료")
+        return True
+
+    def initialize_local_embeddings(self) -> bool:
+        """로컬 Embedding 모델 초기화 (sentence-transformers).
+
+        Returns:
+            초기화 여부
 
-        # 로컬 Embedding 초기화
+        Raises:
+            Exception: 모델 로드 실패
+        """
         try:
             embedding_device = os.getenv("EMBEDDING_DEVICE", "cpu")
-            self.local_embeddings = HuggingFaceEmbeddings(
+            embeddings = HuggingFaceEmbeddings(
                 model_name="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
                 model_kwargs={"device": embedding_device},
             )
-            # 간단한 테스트
-            self.local_embeddings.embed_query("test")
-            print(
-                f"[OK] 로컬 Embedding 모델 초기화 완료 (sentence-transformers, device={embedding_device})"
-            )
+            # 간단한 테스트 (로컬 연산이므로 모델 워밍업 겸용)
+            embeddings.embed_query("test")
         except Exception as local_error:
             print(
                 f"[WARNING] 로컬 Embedding 모델 초기화 실패: {str(local_error)[:100]}..."
             )
             self.local_embeddings = None
+            raise
+
+        # 질문 임베딩 캐시 적용 (반복 질문은 임베딩 단계 생략)
+        self.local_embeddings = CachedEmbeddings(embeddings, self.embedding_cache)
+        print(
+            f"[OK] 로컬 Embedding 모델 초기화 완료 (sentence-transformers, device={embedding_device})"
+        )
+        return True
+
+    def initialize_embeddings(self) -> None:
+        """Embedding 모델 초기화 - OpenAI와 로컬 모델 모두 초기화."""
+        for initialize in (
+            self.initialize_openai_embeddings,
+            self.initialize_local_embeddings,
+        ):
+            try:
+                initialize()
+            except Exception:
+                pass  # 각 초기화 함수에서 로그 출력
 
         if not self.openai_embeddings and not self.local_embeddings:
             raise RuntimeError(
@@ -136,38 +304,44 @@ class ChatService:
                 "OpenAI API 키를 설정하거나 sentence-transformers를 설치해주세요."
             )
 
-    def initialize_llm(self) -> None:
-        """LLM 모델 초기화 - OpenAI와 로컬 모델 모두 초기화."""
-        openai_api_key = os.getenv("OPENAI_API_KEY")
+    def initialize_openai_llm(self) -> bool:
+        """OpenAI LLM 초기화.
 
-        # OpenAI LLM 초기화
-        if openai_api_key and openai_api_key != "your-api-key-here":
-            try:
-                self.openai_llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.7)
-                # 실제 API 호출 테스트 (할당량 확인)
-                self.openai_llm.invoke("test")
-                print("[OK] OpenAI Chat 모델 초기화 완료")
-            except Exception as e:
-                error_msg = str(e)
-                if (
-                    "quota" in error_msg.lower()
-                    or "429" in error_msg
-                    or "insufficient_quota" in error_msg
-                ):
-                    self.openai_quota_exceeded = True
-                    print(f"[WARNING] OpenAI API 할당량 초과: {error_msg[:100]}...")
-                    print("   OpenAI LLM을 사용할 수 없습니다.")
-                    self.openai_llm = None
-                else:
-                    print(
-                        f"[WARNING] OpenAI Chat 모델 초기화 실패: {error_msg[:100]}..."
-                    )
-                    self.openai_llm = None
-        else:
+        실제 채팅 호출 대신 모델 메타데이터 조회로 API 키를 확인합니다 (과금 없음).
+        할당량 초과는 첫 요청에서 429로 응답합니다.
+
+        Returns:
+            초기화 여부 (API 키가 없으면 False)
+
+        Raises:
+            Exception: API 키 또는 모델 확인 실패
+        """
+        if not self._has_openai_api_key():
             print("[WARNING] OpenAI API 키가 설정되지 않았습니다.")
             self.openai_llm = None
+            return False
+
+        try:
+            llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.7)
+            check_openai_model(llm.model_name)
+        except Exception as e:
+            self._handle_openai_init_error("OpenAI LLM", e)
+            self.openai_llm = None
+            raise
+
+        self.openai_llm = llm
+        print("[OK] OpenAI Chat 모델 초기화 완료")
+        return True
 
-        # 로컬 Midm LLM 초기화
+    def initialize_local_llm(self) -> bool:
+        """로컬 Midm LLM 초기화.
+
+        Returns:
+            초기화 여부
+
+        Raises:
+            Exception: 모델 로드 실패
+        """
         try:
             from app.model.model_loader import load_midm_model
 
@@ -192,6 +366,7 @@ class ChatService:
 
             self.local_llm = midm_model.get_langchain_model()
             print("[OK] 로컬 Midm LLM 모델 초기화 완료")
+            return True
         except Exception as local_error:
             error_msg = str(local_error)
             print(f"[WARNING] 로컬 Midm 모델 초기화 실패: {error_msg[:200]}...")
@@ -199,6 +374,15 @@ class ChatService:
 
             print(f"[DEBUG] 상세 오류: {traceback.format_exc()[:500]}")
             self.local_llm = None
+            raise
+
+    def initialize_llm(self) -> None:
+        """LLM 모델 초기화 - OpenAI와 로컬 모델 모두 초기화."""
+        for initialize in (self.initialize_openai_llm, self.initialize_local_llm):
+            try:
+                initialize()
+            except Exception:
+                pass  # 각 초기화 함수에서 로그 출력
 
         if not self.openai_llm and not self.local_llm:
             raise RuntimeError(
@@ -206,6 +390,33 @@ class ChatService:
                 "OpenAI API 키를 설정하거나 Midm 모델을 확인해주세요."
             )
 
+    def _create_rewrite_llm(self, llm_model: Any) -> Any:
+        """질문 재구성용 LLM 생성 (빠른 모델 + 짧은 최대 토큰).
+
+        재구성 결과는 검색 쿼리 한 문장이므로 긴 생성이 필요 없습니다.
+
+        Args:
+            llm_model: 답변 생성용 LLM
+
+        Returns:
+            질문 재구성용 LLM
+        """
+        max_tokens = int(os.getenv("REWRITE_MAX_TOKENS", "64"))
+
+        if isinstance(llm_model, ChatOpenAI):
+            return ChatOpenAI(
+                model=os.getenv("REWRITE_LLM_MODEL", "gpt-3.5-turbo"),
+                temperature=0,
+                max_tokens=max_tokens,
+            )
+
+        # HuggingFacePipeline (또는 이를 감싼 ChatHuggingFace)은 호출 시 생성 길이 지정 가능
+        pipeline_llm = getattr(llm_model, "llm", llm_model)
+        if hasattr(pipeline_llm, "pipeline") and hasattr(llm_model, "bind"):
+            return llm_model.bind(pipeline_kwargs={"max_new_tokens": max_tokens})
+
+        return llm_model
+
     def create_rag_chain(self, llm_model: Any, embeddings_model: Any) -> Runnable:
         """RAG 체인 생성 - LangChain 체인 기능 활용.
 
@@ -218,12 +429,11 @@ class ChatService:
         """
         try:
             # 1. Retriever 생성 (현재 Embedding 모델 사용)
-            current_vector_store = PGVector(
-                embedding_function=embeddings_model,
-                collection_name=self.collection_name,
-                connection_string=self.connection_string,
+            # 임베딩 공간별 공유 벡터 스토어/Retriever 사용 (연결 풀도 공유)
+            repository = VectorStoreRepository.get_or_create(
+                self.connection_string, self.collection_name, embeddings_model
             )
-            retriever = current_vector_store.as_retriever(search_kwargs={"k": 3})
+            retriever = repository.get_retriever(search_kwargs={"k": 3})
 
             # 2. 대화 기록을 고려한 검색 쿼리 생성 프롬프트
             contextualize_q_system_prompt = (
@@ -240,8 +450,11 @@ class ChatService:
             )
 
             # 3. 대화 기록을 고려한 Retriever 생성
+            # 대화 기록이 없으면 질문 재구성(LLM 호출) 없이 원래 메시지로 바로 검색하고,
+            # 대화 기록이 있으면 짧은 토큰 예산의 재구성 모델로 질문을 재구성
+            rewrite_llm = self._create_rewrite_llm(llm_model)
             history_aware_retriever = create_history_aware_retriever(
-                llm_model, retriever, contextualize_q_prompt
+                rewrite_llm, retriever, contextualize_q_prompt
             )
 
             # 4. 질문 답변 프롬프트
@@ -274,29 +487,44 @@ class ChatService:
             print(f"[ERROR] RAG 체인 생성 실패: {error_msg[:200]}...")
             raise
 
+    def initialize_openai_rag_chain(self) -> bool:
+        """OpenAI용 RAG 체인 생성.
+
+        Returns:
+            생성 여부 (OpenAI LLM/Embedding이 없으면 False)
+        """
+        if not (self.openai_llm and self.openai_embeddings):
+            return False
+        self.openai_rag_chain = self.create_rag_chain(
+            self.openai_llm, self.openai_embeddings
+        )
+        print("[OK] OpenAI RAG 체인 초기화 완료")
+        return True
+
+    def initialize_local_rag_chain(self) -> bool:
+        """로컬 모델용 RAG 체인 생성.
+
+        Returns:
+            생성 여부 (로컬 LLM/Embedding이 없으면 False)
+        """
+        if not (self.local_llm and self.local_embeddings):
+            return False
+        self.local_rag_chain = self.create_rag_chain(
+            self.local_llm, self.local_embeddings
+        )
+        print("[OK] 로컬 RAG 체인 초기화 완료")
+        return True
+
     def initialize_rag_chain(self) -> None:
         """RAG 체인 초기화 - OpenAI와 로컬 모델용 체인 생성."""
-        # OpenAI용 RAG 체인 생성
-        if self.openai_llm and self.openai_embeddings:
-            try:
-                self.openai_rag_chain = self.create_rag_chain(
-                    self.openai_llm, self.openai_embeddings
-                )
-                print("[OK] OpenAI RAG 체인 초기화 완료")
-            except Exception as e:
-                print(f"[WARNING] OpenAI RAG 체인 초기화 실패: {str(e)[:100]}...")
-                self.openai_rag_chain = None
-
-        # 로컬 모델용 RAG 체인 생성
-        if self.local_llm and self.local_embeddings:
+        for name, initialize in (
+            ("OpenAI", self.initialize_openai_rag_chain),
+            ("로컬", self.initialize_local_rag_chain),
+        ):
             try:
-                self.local_rag_chain = self.create_rag_chain(
-                    self.local_llm, self.local_embeddings
-                )
-                print("[OK] 로컬 RAG 체인 초기화 완료")
+                initialize()
             except Exception as e:
-                print(f"[WARNING] 로컬 RAG 체인 초기화 실패: {str(e)[:100]}...")
-                self.local_rag_chain = None
+                print(f"[WARNING] {name} RAG 체인 초기화 실패: {str(e)[:100]}...")
 
         if not self.openai_rag_chain and not self.local_rag_chain:
             error_msg = "OpenAI와 로컬 RAG 체인 모두 초기화에 실패했습니다.\n"
@@ -304,21 +532,61 @@ class ChatService:
             print(f"[ERROR] {error_msg}")
             raise RuntimeError(error_msg)
 
-    def chat_with_rag(
-        self,
-        message: str,
-        history: Optional[List[Dict[str, str]]] = None,
-        model_type: str = "openai",
-    ) -> str:
-        """RAG 체인을 사용하여 대화 생성.
+    def ensure_local_rag_chain(self) -> Runnable:
+        """로컬 RAG 체인 지연 초기화.
+
+        첫 local 요청에서 Midm 모델을 로드하고 체인을 생성합니다.
+        동시에 들어온 요청은 한 번의 로드를 기다리고, 실패하면 이후 요청도
+        다시 로드하지 않고 같은 오류를 반환합니다.
+
+        Returns:
+            로컬 RAG 체인
+
+        Raises:
+            RuntimeError: 로컬 Embedding이 준비되지 않았거나 모델 로드 실패
+        """
+        if self.local_rag_chain is not None:
+            return self.local_rag_chain
+
+        with self._local_init_lock:
+            if self.local_rag_chain is not None:
+                return self.local_rag_chain
+            if self._local_init_error:
+                raise RuntimeError(
+                    f"로컬 모델을 불러오지 못했습니다: {self._local_init_error}"
+                )
+            if not self.local_embeddings:
+                if self.readiness.is_pending("local_embeddings"):
+                    raise RuntimeError(
+                        "로컬 Embedding 모델을 초기화하는 중입니다. "
+                        "잠시 후 다시 시도해주세요."
+                    )
+                raise RuntimeError("로컬 Embedding 모델을 사용할 수 없습니다.")
+
+            print("[INFO] 첫 로컬 모델 요청 - Midm 모델 로드 중...")
+            try:
+                if not self.local_llm:
+                    with self.readiness.track("local_llm"):
+                        self.initialize_local_llm()
+                with self.readiness.track("local_rag_chain"):
+                    self.initialize_local_rag_chain()
+            except Exception as e:
+                self._local_init_error = str(e)[:200]
+                raise RuntimeError(
+                    f"로컬 모델을 불러오지 못했습니다: {self._local_init_error}"
+                ) from e
+            return self.local_rag_chain
+
+    def _resolve_rag_chain(self, model_type: str) -> Tuple[str, Runnable]:
+        """모델 타입에 맞는 RAG 체인 선택.
+
+        로컬 체인이 아직 없으면 이 자리에서 지연 초기화합니다 (블로킹).
 
         Args:
-            message: 사용자 메시지
-            history: 대화 기록
-            model_type: 모델 타입 ("openai" 또는 "local")
+            model_type: 모델 타입 ("openai", "local" 또는 "midm")
 
         Returns:
-            생성된 응답
+            (정규화된 모델 타입, RAG 체인)
         """
         # 모델 타입 정규화
         if model_type:
@@ -331,17 +599,30 @@ class ChatService:
             if not self.openai_rag_chain:
                 if self.openai_quota_exceeded:
                     raise RuntimeError("OpenAI API 할당량이 초과되었습니다.")
+                elif self.readiness.is_pending("openai_rag_chain"):
+                    raise RuntimeError(
+                        "OpenAI RAG 체인을 초기화하는 중입니다. "
+                        "잠시 후 다시 시도해주세요."
+                    )
                 else:
                     raise RuntimeError("OpenAI RAG 체인이 초기화되지 않았습니다.")
-            current_rag_chain = self.openai_rag_chain
+            return model_type, self.openai_rag_chain
         elif model_type == "local":
-            if not self.local_rag_chain:
-                raise RuntimeError("로컬 RAG 체인이 초기화되지 않았습니다.")
-            current_rag_chain = self.local_rag_chain
+            return model_type, self.ensure_local_rag_chain()
         else:
             raise ValueError(f"지원하지 않는 모델 타입입니다: {model_type}")
 
-        # 대화 기록을 LangChain 메시지 형식으로 변환
+    async def _aresolve_rag_chain(self, model_type: str) -> Tuple[str, Runnable]:
+        """모델 타입에 맞는 RAG 체인 선택 (로컬 모델 로드는 스레드에서 실행)."""
+        if (model_type or "").lower() in ("local", "midm") and not self.local_rag_chain:
+            await asyncio.to_thread(self.ensure_local_rag_chain)
+        return self._resolve_rag_chain(model_type)
+
+    @staticmethod
+    def _build_chain_input(
+        message: str, history: Optional[List[Dict[str, str]]]
+    ) -> Dict[str, Any]:
+        """대화 기록을 LangChain 메시지 형식으로 변환하여 체인 입력 구성."""
         chat_history = []
         if history:
             for msg in history:
@@ -350,15 +631,14 @@ class ChatService:
                 elif msg.get("role") == "assistant":
                     chat_history.append(AIMessage(content=msg.get("content", "")))
 
-        # RAG 체인 실행
-        result = current_rag_chain.invoke(
-            {
-                "input": message,
-                "chat_history": chat_history,
-            }
-        )
+        return {
+            "input": message,
+            "chat_history": chat_history,
+        }
 
-        # 체인 결과에서 답변 추출
+    @staticmethod
+    def _extract_answer(result: Dict[str, Any]) -> str:
+        """체인 결과에서 답변 추출 및 후처리."""
         response_text = result.get("answer", "답변을 생성할 수 없습니다.")
 
         # response_text가 None이거나 문자열이 아닌 경우 처리
@@ -384,6 +664,279 @@ class ChatService:
 
         return response_text
 
+    def chat_with_rag(
+        self,
+        message: str,
+        history: Optional[List[Dict[str, str]]] = None,
+        model_type: str = "openai",
+    ) -> str:
+        """RAG 체인을 사용하여 대화 생성.
+
+        Args:
+            message: 사용자 메시지
+            history: 대화 기록
+            model_type: 모델 타입 ("openai" 또는 "local")
+
+        Returns:
+            생성된 응답
+        """
+        model_type, current_rag_chain = self._resolve_rag_chain(model_type)
+
+        # 첫 질문이면 시맨틱 답변 캐시 조회
+        question_vector = self._question_vector(model_type, message, history)
+        cached = self._lookup_cached_answer(model_type, question_vector)
+        if cached is not None:
+            return cached.answer
+
+        # RAG 체인 실행
+        result = current_rag_chain.invoke(self._build_chain_input(message, history))
+
+        response_text = self._extract_answer(result)
+        self._store_cached_answer(
+            model_type, question_vector, message, response_text, result.get("context")
+        )
+        return response_text
+
+    async def achat_with_rag(
+        self,
+        message: str,
+        history: Optional[List[Dict[str, str]]] = None,
+        model_type: str = "openai",
+    ) -> str:
+        """RAG 체인을 사용하여 비동기로 대화 생성.
+
+        OpenAI 체인은 ainvoke로 이벤트 루프를 막지 않고 실행하고,
+        로컬 Midm 체인은 전용 추론 실행기(동시 실행 수/대기열 제한)에서 실행합니다.
+
+        Args:
+            message: 사용자 메시지
+            history: 대화 기록
+            model_type: 모델 타입 ("openai" 또는 "local")
+
+        Returns:
+            생성된 응답
+
+        Raises:
+            InferenceQueueFullError: 로컬 모델 추론 대기열이 가득 찬 경우
+        """
+        model_type, current_rag_chain = await self._aresolve_rag_chain(model_type)
+        chain_input = self._build_chain_input(message, history)
+
+        # 첫 질문이면 시맨틱 답변 캐시 조회
+        question_vector = await self._aquestion_vector(model_type, message, history)
+        cached = self._lookup_cached_answer(model_type, question_vector)
+        if cached is not None:
+            return cached.answer
+
+        # RAG 체인 실행
+        if model_type == "local":
+            result = await self.local_executor.run(
+                current_rag_chain.invoke, chain_input
+            )
+        else:
+            result = await current_rag_chain.ainvoke(chain_input)
+
+        response_text = self._extract_answer(result)
+        self._store_cached_answer(
+            model_type, question_vector, message, response_text, result.get("context")
+        )
+        return response_text
+
+    async def astream_chat_with_rag(
+        self,
+        message: str,
+        history: Optional[List[Dict[str, str]]] = None,
+        model_type: str = "openai",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """RAG 체인을 사용하여 스트리밍으로 대화 생성.
+
+        검색된 문서를 먼저 "sources" 이벤트로 보내고,
+        답변 토큰을 "token" 이벤트로, 마지막에 전체 답변을 "done" 이벤트로 보냅니다.
+
+        Args:
+            message: 사용자 메시지
+            history: 대화 기록
+            model_type: 모델 타입 ("openai" 또는 "local")
+
+        Yields:
+            {"event": 이벤트 이름, "data": 이벤트 데이터}
+
+        Raises:
+            InferenceQueueFullError: 로컬 모델 추론 대기열이 가득 찬 경우
+        """
+        model_type, current_rag_chain = await self._aresolve_rag_chain(model_type)
+        chain_input = self._build_chain_input(message, history)
+
+        # 첫 질문이면 시맨틱 답변 캐시 조회
+        question_vector = await self._aquestion_vector(model_type, message, history)
+        cached = self._lookup_cached_answer(model_type, question_vector)
+        if cached is not None:
+            yield {"event": "sources", "data": {"documents": cached.sources}}
+            yield {"event": "token", "data": {"content": cached.answer}}
+            yield {"event": "done", "data": {"response": cached.answer, "cached": True}}
+            return
+
+        if model_type == "local":
+            chunks = self._astream_in_executor(current_rag_chain, chain_input)
+        else:
+            chunks = current_rag_chain.astream(chain_input)
+
+        cleaner = AnswerStreamCleaner()
+        raw_parts: List[str] = []
+        streamed = False
+        context: List[Document] = []
+        async for chunk in chunks:
+            if "context" in chunk:
+                context = chunk["context"]
+                yield {
+                    "event": "sources",
+                    "data": {
+                        "documents": [self._serialize_document(doc) for doc in context]
+                    },
+                }
+            answer = chunk.get("answer")
+            if answer:
+                raw_parts.append(str(answer))
+                text = cleaner.feed(str(answer))
+                if text:
+                    streamed = True
+                    yield {"event": "token", "data": {"content": text}}
+
+        tail = cleaner.flush()
+        if tail:
+            streamed = True
+            yield {"event": "token", "data": {"content": tail}}
+
+        # 최종 답변은 /chat과 같은 후처리 (빈 응답이면 안내 문구)
+        raw_text = "".join(raw_parts)
+        response_text = self._extract_answer({"answer": raw_text})
+        if not streamed or not raw_text.strip():
+            yield {"event": "token", "data": {"content": response_text}}
+
+        self._store_cached_answer(
+            model_type, question_vector, message, response_text, context
+        )
+        yield {"event": "done", "data": {"response": response_text, "cached": False}}
+
+    async def _astream_in_executor(
+        self, chain: Runnable, chain_input: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """동기 체인 스트림을 전용 추론 실행기에서 실행하고 비동기로 전달."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        finished = object()
+
+        def produce() -> None:
+            try:
+                for chunk in chain.stream(chain_input):
+                    # 클라이언트 연결이 끊기면 생성 중단
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+        future = self.local_executor.submit(produce)
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is finished:
+                    break
+                yield chunk
+            # 생성 중 발생한 예외 전파
+            await asyncio.wrap_future(future)
+        finally:
+            stop.set()
+
+    def _question_embeddings(
+        self, model_type: str, history: Optional[List[Dict[str, str]]]
+    ) -> Optional[Embeddings]:
+        """답변 캐시 조회에 사용할 Embedding 모델 (첫 질문일 때만)."""
+        # 대화 기록이 있으면 같은 질문이라도 답변이 달라질 수 있으므로 캐시 미사용
+        if history or not self.answer_cache.enabled:
+            return None
+        if model_type == "openai":
+            return self.openai_embeddings
+        return self.local_embeddings
+
+    def _question_vector(
+        self,
+        model_type: str,
+        message: str,
+        history: Optional[List[Dict[str, str]]],
+    ) -> Optional[List[float]]:
+        """답변 캐시용 질문 임베딩 (검색 단계와 임베딩 캐시를 공유)."""
+        embeddings = self._question_embeddings(model_type, history)
+        if embeddings is None:
+            return None
+        try:
+            return embeddings.embed_query(message)
+        except Exception as e:
+            print(f"[WARNING] 답변 캐시용 질문 임베딩 실패: {str(e)[:100]}")
+            return None
+
+    async def _aquestion_vector(
+        self,
+        model_type: str,
+        message: str,
+        history: Optional[List[Dict[str, str]]],
+    ) -> Optional[List[float]]:
+        """답변 캐시용 질문 임베딩 (비동기)."""
+        embeddings = self._question_embeddings(model_type, history)
+        if embeddings is None:
+            return None
+        try:
+            return await embeddings.aembed_query(message)
+        except Exception as e:
+            print(f"[WARNING] 답변 캐시용 질문 임베딩 실패: {str(e)[:100]}")
+            return None
+
+    def _lookup_cached_answer(
+        self, model_type: str, question_vector: Optional[List[float]]
+    ) -> Optional[CachedAnswer]:
+        """시맨틱 답변 캐시 조회."""
+        if question_vector is None:
+            return None
+        cached = self.answer_cache.lookup(
+            self.collection_name, model_type, question_vector
+        )
+        if cached is not None:
+            print(
+                f"[INFO] 시맨틱 답변 캐시 적중 (유사도: {cached.similarity:.4f}, "
+                f"원래 질문: {cached.question[:50]})"
+            )
+        return cached
+
+    def _store_cached_answer(
+        self,
+        model_type: str,
+        question_vector: Optional[List[float]],
+        message: str,
+        response_text: str,
+        context: Optional[List[Document]],
+    ) -> None:
+        """생성된 답변을 시맨틱 답변 캐시에 저장."""
+        if question_vector is None or response_text == "답변을 생성할 수 없습니다.":
+            return
+        self.answer_cache.store(
+            self.collection_name,
+            model_type,
+            question_vector,
+            question=message,
+            answer=response_text,
+            sources=[self._serialize_document(doc) for doc in context or []],
+        )
+
+    @staticmethod
+    def _serialize_document(doc: Document) -> Dict[str, Any]:
+        """검색된 문서를 JSON 직렬화 가능한 형태로 변환."""
+        return {"page_content": doc.page_content, "metadata": doc.metadata}
+
+    def shutdown(self) -> None:
+        """서비스 종료 시 리소스 정리."""
+        self.local_executor.shutdown(wait=False)
+
 
 class ChatServiceQLoRA:
     """QLoRA를 사용한 채팅 및 학습 서비스."""
@@ -397,6 +950,7 @@ class ChatServiceQLoRA:
         lora_dropout: float = 0.05,
         target_modules: Optional[List[str]] = None,
         device_map: str = "auto",
+        kv_cache_mb: Optional[int] = None,
     ):
         """QLoRA 채팅 서비스 초기화.
 
@@ -408,6 +962,7 @@ class ChatServiceQLoRA:
             lora_dropout: LoRA dropout
             target_modules: LoRA를 적용할 모듈 목록 (None이면 자동 감지)
             device_map: 디바이스 매핑 ("auto", "cpu", "cuda" 등)
+            kv_cache_mb: 세션 KV 캐시 메모리 예산 (MB, None이면 QLORA_KV_CACHE_MB, 0이면 사용 안 함)
         """
         self.model_name_or_path = model_name_or_path
         self.output_dir = Path(output_dir)
@@ -444,6 +999,11 @@ class ChatServiceQLoRA:
         # 세션별 대화 히스토리
         self.chat_sessions: Dict[str, List[Dict[str, str]]] = {}
 
+        # 세션별 past key/values (다음 턴에서 공통 접두사 prefill 생략)
+        if kv_cache_mb is None:
+            kv_cache_mb = int(os.getenv("QLORA_KV_CACHE_MB", "1024"))
+        self.kv_cache = SessionKVCache(max_bytes=kv_cache_mb * 1024 * 1024)
+
     def load_model(self) -> None:
         """모델 및 토크나이저 로드."""
         print(f"[INFO] 모델 로딩 중: {self.model_name_or_path}")
@@ -495,6 +1055,8 @@ class ChatServiceQLoRA:
         self.peft_model = PeftModel.from_pretrained(
             self.model, peft_model_path, device_map=self.device_map
         )
+        # 가중치가 바뀌었으므로 이전 KV 캐시는 사용할 수 없음
+        self.kv_cache.clear()
         print("[OK] PEFT 모델 로딩 완료")
 
     def chat(
@@ -536,11 +1098,17 @@ class ChatServiceQLoRA:
         inputs = self.tokenizer(
             prompt, return_tensors="pt", truncation=True, max_length=2048
         ).to(self.peft_model.device)
+        prompt_length = inputs["input_ids"].shape[1]
+
+        # 이전 턴의 KV 캐시 재사용 (공통 접두사 이후의 새 토큰만 prefill)
+        past_key_values = self._reuse_kv_cache(session_id, inputs["input_ids"])
 
         # 생성
         with torch.no_grad():
             outputs = self.peft_model.generate(
                 **inputs,
+                past_key_values=past_key_values,
+                return_dict_in_generate=True,
                 max_new_tokens=max_new_tokens,
                 temperature=temperature,
                 top_p=top_p,
@@ -551,11 +1119,14 @@ class ChatServiceQLoRA:
                 eos_token_id=self.tokenizer.eos_token_id,
             )
 
-        # 디코딩
-        generated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
+        # 생성된 토큰만 디코딩 (프롬프트 전체를 디코딩한 뒤 잘라내지 않음)
+        sequences = outputs.sequences
+        response = self.tokenizer.decode(
+            sequences[0, prompt_length:], skip_special_tokens=True
+        ).strip()
 
-        # 응답만 추출 (프롬프트 제외)
-        response = generated_text[len(prompt) :].strip()
+        # 다음 턴을 위해 이번 턴의 KV 캐시 저장
+        self._store_kv_cache(session_id, sequences, outputs.past_key_values)
 
         # 히스토리 업데이트
         self.chat_sessions[session_id] = history + [
@@ -565,6 +1136,51 @@ class ChatServiceQLoRA:
 
         return response
 
+    def _reuse_kv_cache(self, session_id: str, input_ids: torch.Tensor) -> Optional[Any]:
+        """세션 KV 캐시에서 현재 프롬프트와 겹치는 접두사만큼 남긴 캐시 반환.
+
+        Args:
+            session_id: 세션 ID
+            input_ids: 현재 프롬프트 토큰 ID (1, 길이)
+
+        Returns:
+            generate()에 넘길 past key/values (캐시를 쓸 수 없으면 None)
+        """
+        if DynamicCache is None or not self.kv_cache.enabled:
+            return None
+
+        prompt_length = input_ids.shape[1]
+        entry = self.kv_cache.take(session_id)
+        if entry is None:
+            self.kv_cache.record(0, prompt_length)
+            return DynamicCache()
+
+        cached_ids, past_key_values = entry
+        # 마지막 토큰은 다음 토큰 logits를 얻기 위해 항상 새로 넣음
+        limit = min(cached_ids.shape[1], prompt_length - 1)
+        mismatch = (
+            cached_ids[0, :limit].to(input_ids.device) != input_ids[0, :limit]
+        ).nonzero()
+        prefix = int(mismatch[0, 0]) if mismatch.numel() else limit
+        if prefix <= 0:
+            # 히스토리가 달라져 겹치는 부분이 없으면 처음부터 prefill
+            self.kv_cache.record(0, prompt_length)
+            return DynamicCache()
+
+        past_key_values.crop(prefix)
+        self.kv_cache.record(prefix, prompt_length - prefix)
+        return past_key_values
+
+    def _store_kv_cache(
+        self, session_id: str, sequences: torch.Tensor, past_key_values: Any
+    ) -> None:
+        """이번 턴까지의 토큰 ID와 past key/values를 세션 KV 캐시에 저장."""
+        if not self.kv_cache.enabled or not hasattr(past_key_values, "crop"):
+            return
+        # 마지막으로 생성된 토큰은 아직 캐시에 들어가지 않음
+        cached_length = past_key_values.get_seq_length()
+        self.kv_cache.put(session_id, sequences[:, :cached_length], past_key_values)
+
     def _format_chat_prompt(self, message: str, history: List[Dict[str, str]]) -> str:
         """대화 형식으로 프롬프트 구성.
 
@@ -697,6 +1313,7 @@ class ChatServiceQLoRA:
         # 학습 실행
         print("[INFO] 학습 시작...")
         trainer.train()
+        self.kv_cache.clear()
         print("[OK] 학습 완료")
 
         # 모델 저장
@@ -777,6 +1394,7 @@ class ChatServiceQLoRA:
         with open(file_path, "r", encoding="utf-8") as f:
             history = json.load(f)
         self.chat_sessions[session_id] = history
+        self.kv_cache.invalidate(session_id)
         print(f"[OK] 세션 로드 완료: {file_path}")
 
     def clear_session(self, session_id: str) -> None:
@@ -785,6 +1403,7 @@ class ChatServiceQLoRA:
         Args:
             session_id: 세션 ID
         """
+        self.kv_cache.invalidate(session_id)
         if session_id in self.chat_sessions:
             del self.chat_sessions[session_id]
             print(f"[OK] 세션 삭제 완료: {session_id}")
@@ -0,0 +1,414 @@
+"""
+크롤링 결과 → PGVector 주기 적재 파이프라인 crawl_ingest_service_t.py
+
+crawlerservice(/crawler/bugsmusic, /crawler/danawa, /crawler/navernews)의 결과를
+Document로 정규화해 langchain_collection에 적재합니다.
+적재는 RAG 검색기가 쓰는 임베딩 공간 하나에만 합니다 (한 컬렉션에 차원이 다른
+벡터가 섞이면 pgvector 거리 계산이 실패함).
+
+- 크롤링 단계: 소스별로 동시에 crawlerservice를 호출하고 행을 Document로 변환
+- 적재 단계: 배치 단위로 임베딩/업서트 (langchain_core.indexing.index + SQLRecordManager)
+  이미 같은 내용으로 색인된 문서는 임베딩 없이 건너뜀
+- 두 단계는 크기가 제한된 큐로 연결되어, 적재가 밀리면 크롤링 단계가 기다림 (backpressure)
+- 한 번 실행 안에서 같은 내용의 문서는 내용 해시로 한 번만 적재
+- 단계별 처리량(docs/sec)과 큐 대기 시간 집계
+- CRAWL_INGEST_INTERVAL_MINUTES가 0보다 크면 서버가 주기적으로 실행
+
+실행 (한 번 적재):
+    python -m app.service.crawl_ingest_service_t --embedding local
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from app.repository.vector_store import VectorStoreRepository
+
+DEFAULT_CRAWLER_URL = "http://localhost:9012"
+
+# 큐 종료 표시
+_DONE = object()
+
+
+def _bugsmusic_documents(rows: List[Dict[str, Any]]) -> List[Document]:
+    """Bugs 차트 행 → Document (순위는 자주 바뀌므로 내용/메타데이터에서 제외)."""
+    documents = []
+    for row in rows:
+        title, artist, album = row.get("title"), row.get("artist"), row.get("album")
+        if not title or title == "N/A":
+            continue
+        documents.append(
+            Document(
+                page_content=f"{title} - {artist} (앨범: {album})",
+                metadata={
+                    "source": "crawler:bugsmusic",
+                    "type": "music_chart",
+                    "title": title,
+                    "artist": artist,
+                    "album": album,
+                },
+            )
+        )
+    return documents
+
+
+def _danawa_documents(rows: List[Dict[str, Any]]) -> List[Document]:
+    """다나와 제품 행 → Document."""
+    documents = []
+    for row in rows:
+        name = row.get("prod_name")
+        if not name or name == "N/A":
+            continue
+        documents.append(
+            Document(
+                page_content=f"{name}\n{row.get('prod_meta', '')}\n최저가: {row.get('low_price', '')}",
+                metadata={
+                    "source": "crawler:danawa",
+                    "type": "product",
+                    "prod_name": name,
+                    "low_price": row.get("low_price"),
+                },
+            )
+        )
+    return documents
+
+
+def _navernews_documents(rows: List[Dict[str, Any]]) -> List[Document]:
+    """네이버 뉴스 행 → Document."""
+    documents = []
+    for row in rows:
+        content = (row.get("title") or row.get("content") or "").strip()
+        if not content:
+            continue
+        metadata = {"source": "crawler:navernews", "type": row.get("type", "news")}
+        if row.get("url"):
+            metadata["url"] = row["url"]
+        documents.append(Document(page_content=content, metadata=metadata))
+    return documents
+
+
+# 소스 이름 → (crawlerservice 경로, 쿼리 파라미터, 정규화 함수)
+SOURCES: Dict[str, Dict[str, Any]] = {
+    "bugsmusic": {"path": "/crawler/bugsmusic", "params": {}, "normalize": _bugsmusic_documents},
+    "danawa": {"path": "/crawler/danawa", "params": {"pages": 3}, "normalize": _danawa_documents},
+    "navernews": {"path": "/crawler/navernews", "params": {}, "normalize": _navernews_documents},
+}
+
+
+def content_hash(document: Document) -> str:
+    """문서 내용 해시 (한 실행 안의 중복 제거용)."""
+    return hashlib.sha256(document.page_content.encode("utf-8")).hexdigest()
+
+
+class CrawlIngestService:
+    """크롤링 → 임베딩/업서트 파이프라인."""
+
+    def __init__(
+        self,
+        connection_string: str,
+        collection_name: str,
+        embeddings: Embeddings,
+        crawler_url: str = DEFAULT_CRAWLER_URL,
+        sources: Optional[List[str]] = None,
+        batch_size: int = 64,
+        queue_size: int = 256,
+        timeout: float = 120.0,
+    ):
+        """파이프라인 초기화.
+
+        Args:
+            connection_string: PostgreSQL 연결 문자열
+            collection_name: PGVector 컬렉션 이름
+            embeddings: 적재할 임베딩 모델 (RAG 검색기와 같은 모델)
+            crawler_url: crawlerservice 주소
+            sources: 실행할 소스 이름 (None이면 전체)
+            batch_size: 한 번에 임베딩/저장할 문서 수
+            queue_size: 크롤링 → 적재 단계 사이 큐 크기 (문서 수)
+            timeout: crawlerservice 요청 타임아웃 (초, Selenium 크롤링 고려)
+        """
+        self.connection_string = connection_string
+        self.collection_name = collection_name
+        self.embeddings = embeddings
+        self.crawler_url = crawler_url.rstrip("/")
+        self.sources = sources or list(SOURCES)
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(self.batch_size, queue_size)
+        self.timeout = timeout
+        self._run_lock = asyncio.Lock()
+        self.last_run: Optional[Dict[str, Any]] = None
+        self.runs = 0
+
+    @classmethod
+    def from_env(
+        cls, connection_string: str, collection_name: str, embeddings: Embeddings
+    ) -> "CrawlIngestService":
+        """환경 변수 설정으로 서비스 생성."""
+        sources = os.getenv("CRAWL_INGEST_SOURCES")
+        return cls(
+            connection_string=connection_string,
+            collection_name=collection_name,
+            embeddings=embeddings,
+            crawler_url=os.getenv("CRAWLER_SERVICE_URL", DEFAULT_CRAWLER_URL),
+            sources=[s.strip() for s in sources.split(",") if s.strip()] if sources else None,
+            batch_size=int(os.getenv("CRAWL_INGEST_BATCH_SIZE", "64")),
+            queue_size=int(os.getenv("CRAWL_INGEST_QUEUE_SIZE", "256")),
+            timeout=float(os.getenv("CRAWL_INGEST_TIMEOUT", "120")),
+        )
+
+    # ------------------------------------------------------------------
+    # 파이프라인 단계
+    # ------------------------------------------------------------------
+
+    async def _crawl_source(
+        self,
+        client: httpx.AsyncClient,
+        name: str,
+        queue: "asyncio.Queue[Any]",
+        seen: set,
+        stats: Dict[str, Any],
+    ) -> None:
+        """크롤링 단계: 소스 하나를 호출해 정규화한 문서를 큐에 넣음."""
+        source = SOURCES[name]
+        source_stats = stats["crawl"][name] = {"rows": 0, "documents": 0, "duplicates": 0}
+        start = time.perf_counter()
+        try:
+            response = await client.get(f"{self.crawler_url}{source['path']}", params=source["params"])
+            response.raise_for_status()
+            rows = response.json().get("data") or []
+        except Exception as e:
+            source_stats["error"] = str(e)[:200]
+            print(f"[WARNING] 크롤링 실패 ({name}): {str(e)[:100]}")
+            return
+        finally:
+            source_stats["seconds"] = round(time.perf_counter() - start, 2)
+
+        source_stats["rows"] = len(rows)
+        for document in source["normalize"](rows):
+            digest = content_hash(document)
+            if digest in seen:
+                source_stats["duplicates"] += 1
+                continue
+            seen.add(digest)
+            document.metadata["content_hash"] = digest
+            # 큐가 가득 차면 적재 단계가 따라올 때까지 대기
+            wait_start = time.perf_counter()
+            await queue.put(document)
+            stats["queue"]["producer_wait_seconds"] += time.perf_counter() - wait_start
+            stats["queue"]["max_depth"] = max(stats["queue"]["max_depth"], queue.qsize())
+            source_stats["documents"] += 1
+
+    def _index_batch(
+        self, repository: VectorStoreRepository, batch: List[Document]
+    ) -> Dict[str, int]:
+        """배치 하나를 색인 (워커 스레드에서 실행)."""
+        # 크롤링 결과는 배치로 나뉘어 들어오므로 source 단위 정리(cleanup)는 하지 않음
+        return repository.index_documents(batch, cleanup=None, batch_size=self.batch_size)
+
+    async def _embed_stage(
+        self,
+        repository: VectorStoreRepository,
+        queue: "asyncio.Queue[Any]",
+        stats: Dict[str, Any],
+    ) -> None:
+        """적재 단계: 큐에서 배치를 모아 임베딩/업서트."""
+        embed_stats = stats["embed"]
+        done = False
+        while not done:
+            batch: List[Document] = []
+            while len(batch) < self.batch_size:
+                item = await queue.get()
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(self._index_batch, repository, batch)
+            except Exception as e:
+                embed_stats["failed_batches"] += 1
+                print(f"[WARNING] 배치 색인 실패 ({len(batch)}건): {str(e)[:100]}")
+                continue
+            finally:
+                embed_stats["seconds"] += time.perf_counter() - start
+            embed_stats["batches"] += 1
+            embed_stats["documents"] += len(batch)
+            for key in ("num_added", "num_updated", "num_skipped", "num_deleted"):
+                embed_stats[key] += result[key]
+
+    async def run_once(self) -> Dict[str, Any]:
+        """크롤링 → 적재를 한 번 실행.
+
+        Returns:
+            단계별 통계 (소스별 행/문서 수, 큐 대기, 추가/건너뜀 수, docs/sec)
+        """
+        if self.embeddings is None:
+            raise RuntimeError("적재할 Embedding 모델이 없습니다.")
+
+        async with self._run_lock:
+            stats: Dict[str, Any] = {
+                "started_at": time.time(),
+                "crawl": {},
+                "queue": {"size": self.queue_size, "max_depth": 0, "producer_wait_seconds": 0.0},
+                "embed": {
+                    "batches": 0, "failed_batches": 0, "documents": 0, "seconds": 0.0,
+                    "num_added": 0, "num_updated": 0, "num_skipped": 0, "num_deleted": 0,
+                },
+            }
+            start = time.perf_counter()
+
+            repository = await asyncio.to_thread(
+                VectorStoreRepository.get_or_create,
+                self.connection_string,
+                self.collection_name,
+                self.embeddings,
+            )
+            queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.queue_size)
+            seen: set = set()
+
+            consumer = asyncio.create_task(self._embed_stage(repository, queue, stats))
+            crawl_start = time.perf_counter()
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                await asyncio.gather(
+                    *(self._crawl_source(client, name, queue, seen, stats) for name in self.sources)
+                )
+            crawl_seconds = time.perf_counter() - crawl_start
+            await queue.put(_DONE)
+            await consumer
+
+            elapsed = time.perf_counter() - start
+            crawled = sum(source["documents"] for source in stats["crawl"].values())
+            stats["crawl_seconds"] = round(crawl_seconds, 2)
+            stats["crawl_docs_per_sec"] = round(crawled / crawl_seconds, 1) if crawl_seconds else 0.0
+            embed_seconds = stats["embed"]["seconds"]
+            stats["embed"]["seconds"] = round(embed_seconds, 2)
+            stats["embed"]["docs_per_sec"] = (
+                round(stats["embed"]["documents"] / embed_seconds, 1) if embed_seconds else 0.0
+            )
+            stats["queue"]["producer_wait_seconds"] = round(stats["queue"]["producer_wait_seconds"], 2)
+            stats["seconds"] = round(elapsed, 2)
+
+            self.runs += 1
+            self.last_run = stats
+            print(
+                f"[OK] 크롤링 적재 완료: 문서 {crawled}개 "
+                f"(추가 {stats['embed']['num_added']}, 건너뜀 {stats['embed']['num_skipped']}), "
+                f"{stats['seconds']}초 (크롤링 {stats['crawl_docs_per_sec']} docs/sec, "
+                f"적재 {stats['embed']['docs_per_sec']} docs/sec)"
+            )
+            return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """실행 횟수와 마지막 실행 통계."""
+        return {"runs": self.runs, "sources": self.sources, "last_run": self.last_run}
+
+
+class CrawlIngestScheduler:
+    """크롤링 적재를 주기적으로 실행하는 백그라운드 작업."""
+
+    def __init__(self, service: CrawlIngestService, interval_seconds: float):
+        """스케줄러 초기화.
+
+        Args:
+            service: 실행할 파이프라인
+            interval_seconds: 실행 간격 (초)
+        """
+        self.service = service
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.last_error: Optional[str] = None
+
+    def start(self) -> None:
+        """스케줄 시작 (이미 실행 중이면 무시)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            print(f"[INFO] 크롤링 적재 스케줄 시작: {self.interval_seconds / 60:.0f}분 간격")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.service.run_once()
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)[:200]
+                print(f"[WARNING] 크롤링 적재 실패: {self.last_error}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def stop(self) -> None:
+        """스케줄 중지."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄 상태."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval_seconds,
+            "last_error": self.last_error,
+            **self.service.stats(),
+        }
+
+
+def create_scheduler_from_env(
+    connection_string: str, collection_name: str, embeddings: Optional[Embeddings]
+) -> Optional[CrawlIngestScheduler]:
+    """CRAWL_INGEST_INTERVAL_MINUTES가 0보다 크면 스케줄러 생성 (아니면 None)."""
+    interval_minutes = float(os.getenv("CRAWL_INGEST_INTERVAL_MINUTES", "0"))
+    if interval_minutes <= 0 or embeddings is None:
+        return None
+    service = CrawlIngestService.from_env(connection_string, collection_name, embeddings)
+    return CrawlIngestScheduler(service, interval_minutes * 60)
+
+
+def main() -> None:
+    """크롤링 적재 CLI (한 번 실행)."""
+    from app.service.embedding_ingest_service_t import _create_embeddings
+
+    parser = argparse.ArgumentParser(description="crawlerservice 결과를 PGVector에 적재")
+    parser.add_argument("--collection", default="langchain_collection")
+    parser.add_argument("--embedding", choices=["local", "openai"], default="local")
+    parser.add_argument("--crawler-url", help="crawlerservice 주소")
+    parser.add_argument("--sources", nargs="+", choices=list(SOURCES))
+    parser.add_argument("--batch-size", type=int)
+    args = parser.parse_args()
+
+    connection_string = os.getenv("DATABASE_URL") or os.getenv(
+        "POSTGRES_CONNECTION_STRING"
+    )
+    if not connection_string:
+        raise SystemExit("DATABASE_URL 또는 POSTGRES_CONNECTION_STRING을 설정해주세요.")
+
+    service = CrawlIngestService.from_env(
+        connection_string, args.collection, _create_embeddings(args.embedding)
+    )
+    if args.crawler_url:
+        service.crawler_url = args.crawler_url.rstrip("/")
+    if args.sources:
+        service.sources = args.sources
+    if args.batch_size:
+        service.batch_size = max(1, args.batch_size)
+
+    try:
+        asyncio.run(service.run_once())
+    finally:
+        VectorStoreRepository.dispose_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,4 +4,346 @@
 문서를 받아 임베딩 생성 + 벡터스토어 업서트까지 한 번에 처리.
 
 배치/주기적인 인덱싱 작업도 이 서비스 레벨에서 처리.
+
+영화 리뷰 JSON(app/data/*.json)을 스트리밍 방식으로 적재합니다.
+- JSON 파일을 하나씩 읽어 문서로 변환 (전체 코퍼스를 메모리에 올리지 않음)
+- 긴 리뷰는 청크로 분할
+- 내용 해시 기반 색인 (langchain_core.indexing.index + SQLRecordManager)
+  이미 색인된 청크는 임베딩 없이 건너뛰고, 바뀐 파일의 이전 청크는 삭제
+- 파일별 색인을 워커 풀에서 동시에 실행, 파일 안에서는 배치 단위 임베딩/저장
+- 파일 단위 체크포인트로 중단 후 이어서 적재
+- 처리량(docs/sec) 집계
+
+실행:
+    python -m app.service.embedding_ingest_service_t --embedding local
 """
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.repository.vector_store import VectorStoreRepository
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def iter_review_files(data_dir: Path) -> List[Path]:
+    """리뷰 JSON 파일 목록 (이름순)."""
+    return sorted(Path(data_dir).glob("*.json"))
+
+
+def load_review_documents(path: Path) -> List[Document]:
+    """리뷰 JSON 파일 하나를 Document 목록으로 변환.
+
+    Args:
+        path: 리뷰 JSON 파일 경로 (review, rating, movie_id, author, ... 목록)
+
+    Returns:
+        리뷰 Document 목록 (빈 리뷰 제외)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reviews = json.load(f)
+
+    documents = []
+    for index, review in enumerate(reviews):
+        content = (review.get("review") or "").strip()
+        if not content:
+            continue
+        documents.append(
+            Document(
+                page_content=content,
+                metadata={
+                    "source": path.name,
+                    "review_id": review.get("review_id") or f"{path.stem}-{index}",
+                    "movie_id": review.get("movie_id"),
+                    "rating": review.get("rating"),
+                    "author": review.get("author"),
+                    "date": review.get("date"),
+                },
+            )
+        )
+    return documents
+
+
+class EmbeddingIngestService:
+    """리뷰 코퍼스 배치 적재 서비스."""
+
+    def __init__(
+        self,
+        connection_string: str,
+        collection_name: str,
+        embeddings: Embeddings,
+        batch_size: int = 256,
+        embed_workers: int = 2,
+        chunk_size: int = 500,
+        chunk_overlap: int = 50,
+        checkpoint_path: Optional[Path] = None,
+    ):
+        """적재 서비스 초기화.
+
+        Args:
+            connection_string: PostgreSQL 연결 문자열
+            collection_name: PGVector 컬렉션 이름
+            embeddings: 문서 임베딩 모델
+            batch_size: 한 번에 임베딩/저장할 청크 수
+            embed_workers: 동시에 색인할 파일 수 (워커 수)
+            chunk_size: 청크 최대 길이 (문자)
+            chunk_overlap: 청크 간 겹치는 길이 (문자)
+            checkpoint_path: 체크포인트 파일 경로 (None이면 체크포인트 미사용)
+        """
+        self.connection_string = connection_string
+        self.collection_name = collection_name
+        self.embeddings = embeddings
+        self.batch_size = max(1, batch_size)
+        self.embed_workers = max(1, embed_workers)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+
+    @classmethod
+    def from_env(
+        cls, connection_string: str, collection_name: str, embeddings: Embeddings
+    ) -> "EmbeddingIngestService":
+        """환경 변수 설정으로 서비스 생성."""
+        checkpoint = os.getenv("INGEST_CHECKPOINT")
+        return cls(
+            connection_string=connection_string,
+            collection_name=collection_name,
+            embeddings=embeddings,
+            batch_size=int(os.getenv("INGEST_BATCH_SIZE", "256")),
+            embed_workers=int(os.getenv("INGEST_EMBED_WORKERS", "2")),
+            chunk_size=int(os.getenv("INGEST_CHUNK_SIZE", "500")),
+            chunk_overlap=int(os.getenv("INGEST_CHUNK_OVERLAP", "50")),
+            checkpoint_path=Path(checkpoint) if checkpoint else None,
+        )
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self) -> Set[str]:
+        """적재가 끝난 파일 목록 로드."""
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return set()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("collection") != self.collection_name:
+            print("[WARNING] 다른 컬렉션의 체크포인트입니다. 처음부터 적재합니다.")
+            return set()
+        return set(checkpoint.get("completed_files", []))
+
+    def _save_checkpoint(self, completed_files: Set[str]) -> None:
+        """적재가 끝난 파일 목록 저장 (임시 파일 교체로 원자적 저장)."""
+        if not self.checkpoint_path:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "collection": self.collection_name,
+                    "completed_files": sorted(completed_files),
+                    "updated_at": time.time(),
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # ------------------------------------------------------------------
+    # 파이프라인 단계
+    # ------------------------------------------------------------------
+
+    def _split(self, documents: List[Document]) -> List[Document]:
+        """긴 리뷰를 청크로 분할 (청크 번호를 메타데이터에 기록)."""
+        chunks: List[Document] = []
+        for document in documents:
+            pieces = self.splitter.split_text(document.page_content)
+            for index, piece in enumerate(pieces):
+                chunks.append(
+                    Document(
+                        page_content=piece,
+                        metadata={**document.metadata, "chunk": index},
+                    )
+                )
+        return chunks
+
+    def _index_file(
+        self, repository: VectorStoreRepository, path: Path
+    ) -> Dict[str, Any]:
+        """리뷰 파일 하나를 색인.
+
+        파일 이름이 source이므로, incremental 모드에서 같은 파일의 이전 버전
+        청크는 삭제되고 바뀌지 않은 청크는 임베딩 없이 건너뜁니다.
+        """
+        start = time.perf_counter()
+        chunks = self._split(load_review_documents(path))
+        result = repository.index_documents(
+            chunks,
+            cleanup="incremental",
+            source_id_key="source",
+            batch_size=self.batch_size,
+        )
+        return {
+            **result,
+            "chunks": len(chunks),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def ingest_directory(
+        self, data_dir: Path = DEFAULT_DATA_DIR, resume: bool = True
+    ) -> Dict[str, Any]:
+        """리뷰 디렉토리 전체 적재.
+
+        Args:
+            data_dir: 리뷰 JSON 디렉토리
+            resume: 체크포인트에 기록된 파일 건너뛰기 여부
+
+        Returns:
+            적재 통계 (파일/청크 수, 추가/변경/건너뜀/삭제 수, 소요 시간, docs/sec)
+        """
+        files = iter_review_files(Path(data_dir))
+        completed = self._load_checkpoint() if resume else set()
+        pending_files = [path for path in files if path.name not in completed]
+        print(
+            f"[INFO] 리뷰 적재 시작: 파일 {len(pending_files)}개 "
+            f"(전체 {len(files)}개, 완료 {len(files) - len(pending_files)}개), "
+            f"배치 {self.batch_size}, 워커 {self.embed_workers}"
+        )
+
+        repository = VectorStoreRepository.get_or_create(
+            self.connection_string, self.collection_name, self.embeddings
+        )
+        # 워커 스레드들이 동시에 스키마를 만들지 않도록 미리 생성
+        repository.get_record_manager()
+
+        stats: Dict[str, Any] = {
+            "files": 0,
+            "failed_files": 0,
+            "chunks": 0,
+            "num_added": 0,
+            "num_updated": 0,
+            "num_skipped": 0,
+            "num_deleted": 0,
+        }
+        start = time.perf_counter()
+
+        # 파일별 색인을 워커 풀에서 동시에 실행하고, 결과는 제출 순서대로 반영
+        in_flight: Deque[Tuple[Path, Future]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self.embed_workers, thread_name_prefix="ingest-index"
+        ) as executor:
+            for path in pending_files:
+                future = executor.submit(self._index_file, repository, path)
+                in_flight.append((path, future))
+                if len(in_flight) > self.embed_workers:
+                    self._collect_one(in_flight, completed, stats)
+            while in_flight:
+                self._collect_one(in_flight, completed, stats)
+
+        elapsed = time.perf_counter() - start
+        stats["seconds"] = round(elapsed, 2)
+        stats["docs_per_sec"] = round(stats["chunks"] / elapsed, 1) if elapsed else 0.0
+        print(
+            f"[OK] 리뷰 적재 완료: 파일 {stats['files']}개, 청크 {stats['chunks']}개 "
+            f"(추가 {stats['num_added']}, 건너뜀 {stats['num_skipped']}, "
+            f"삭제 {stats['num_deleted']}), "
+            f"{stats['seconds']}초 ({stats['docs_per_sec']} docs/sec)"
+        )
+        return stats
+
+    def _collect_one(
+        self,
+        in_flight: Deque[Tuple[Path, Future]],
+        completed: Set[str],
+        stats: Dict[str, Any],
+    ) -> None:
+        """가장 먼저 제출된 파일의 색인 결과를 반영하고 체크포인트 갱신."""
+        path, future = in_flight.popleft()
+        try:
+            result = future.result()
+        except Exception as e:
+            stats["failed_files"] += 1
+            print(f"[WARNING] 리뷰 파일 색인 실패 ({path.name}): {str(e)[:100]}")
+            return
+
+        stats["files"] += 1
+        for key in ("chunks", "num_added", "num_updated", "num_skipped", "num_deleted"):
+            stats[key] += result[key]
+        completed.add(path.name)
+        self._save_checkpoint(completed)
+        print(
+            f"[INFO] {path.name} 색인: 청크 {result['chunks']}개 "
+            f"(추가 {result['num_added']}, 건너뜀 {result['num_skipped']}, "
+            f"삭제 {result['num_deleted']}), {result['seconds']:.2f}초"
+        )
+
+
+def _create_embeddings(kind: str) -> Embeddings:
+    """CLI용 Embedding 모델 생성."""
+    if kind == "openai":
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings()
+
+    try:
+        from langchain_huggingface import HuggingFaceEmbeddings
+    except ImportError:
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(
+        model_name="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        model_kwargs={"device": os.getenv("EMBEDDING_DEVICE", "cpu")},
+        encode_kwargs={"batch_size": int(os.getenv("INGEST_ENCODE_BATCH_SIZE", "64"))},
+    )
+
+
+def main() -> None:
+    """리뷰 코퍼스 적재 CLI."""
+    parser = argparse.ArgumentParser(description="영화 리뷰 JSON을 PGVector에 적재")
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument("--collection", default="langchain_collection")
+    parser.add_argument("--embedding", choices=["local", "openai"], default="local")
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--checkpoint", help="체크포인트 파일 경로")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트 무시")
+    args = parser.parse_args()
+
+    connection_string = os.getenv("DATABASE_URL") or os.getenv(
+        "POSTGRES_CONNECTION_STRING"
+    )
+    if not connection_string:
+        raise SystemExit("DATABASE_URL 또는 POSTGRES_CONNECTION_STRING을 설정해주세요.")
+
+    service = EmbeddingIngestService.from_env(
+        connection_string, args.collection, _create_embeddings(args.embedding)
+    )
+    if args.batch_size:
+        service.batch_size = args.batch_size
+    if args.workers:
+        service.embed_workers = args.workers
+    service.checkpoint_path = Path(
+        args.checkpoint
+        or service.checkpoint_path
+        or Path(args.data_dir) / f".ingest_checkpoint_{args.collection}.json"
+    )
+
+    try:
+        service.ingest_directory(Path(args.data_dir), resume=not args.no_resume)
+    finally:
+        VectorStoreRepository.dispose_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+로컬 모델 추론 전용 실행기.
+
+로컬 Midm 모델 생성은 동기/CPU(GPU) 바운드 작업이므로 이벤트 루프에서
+직접 실행하면 같은 워커의 다른 요청이 모두 멈춥니다.
+전용 스레드 풀에서 실행하고, 대기 중인 요청 수(큐 깊이)를 제한하여
+과부하 시 즉시 거절합니다.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+
+class InferenceQueueFullError(RuntimeError):
+    """추론 대기열이 가득 찼을 때 발생하는 예외."""
+
+
+class BoundedInferenceExecutor:
+    """동시 실행 수와 대기열 길이가 제한된 추론 실행기."""
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        max_queue: int = 8,
+        thread_name_prefix: str = "inference",
+    ):
+        """추론 실행기 초기화.
+
+        Args:
+            max_workers: 동시에 실행할 추론 작업 수
+            max_queue: 실행 대기 가능한 최대 작업 수 (실행 중인 작업 제외)
+            thread_name_prefix: 워커 스레드 이름 접두사
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """함수를 전용 스레드 풀에 제출합니다.
+
+        Args:
+            func: 실행할 동기 함수
+            *args: 함수 인자
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            concurrent.futures.Future
+
+        Raises:
+            InferenceQueueFullError: 대기열이 가득 찬 경우
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise InferenceQueueFullError(
+                    "로컬 모델 추론 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+                )
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(partial(func, *args, **kwargs))
+        except Exception:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        # 요청이 취소되어도 스레드 작업은 끝까지 실행되므로 완료 시점에 카운트 감소
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """함수를 전용 스레드 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            func: 실행할 동기 함수
+            *args: 함수 인자
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            함수 실행 결과
+
+        Raises:
+            InferenceQueueFullError: 대기열이 가득 찬 경우
+        """
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def _on_done(self, _future: Any) -> None:
+        """작업 완료 콜백."""
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        """실행기 상태 반환."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.max_workers),
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """스레드 풀 종료."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
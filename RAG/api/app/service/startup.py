@@ -0,0 +1,159 @@
+"""
+서버 시작 초기화 오케스트레이션.
+
+DB 연결 확인, Embedding/LLM 준비, 벡터 스토어 확인은 서로 독립적인 작업이 많아
+순서대로 실행하면 콜드 스타트가 길어집니다.
+독립적인 작업은 스레드에서 동시에 실행하고, 컴포넌트별 준비 상태를 기록하여
+/health에서 확인할 수 있게 합니다.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+DISABLED = "disabled"
+LAZY = "lazy"
+
+
+class ComponentReadiness:
+    """컴포넌트별 초기화 상태 추적."""
+
+    def __init__(self):
+        """상태 추적기 초기화."""
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def set(
+        self,
+        name: str,
+        status: str,
+        error: Optional[str] = None,
+        seconds: Optional[float] = None,
+    ) -> None:
+        """컴포넌트 상태 설정.
+
+        Args:
+            name: 컴포넌트 이름
+            status: 상태 (pending, loading, ready, failed, disabled, lazy)
+            error: 실패 사유
+            seconds: 초기화 소요 시간 (초)
+        """
+        entry: Dict[str, Any] = {"status": status}
+        if error:
+            entry["error"] = error[:200]
+        if seconds is not None:
+            entry["seconds"] = round(seconds, 2)
+        with self._lock:
+            self._components[name] = entry
+
+    def get(self, name: str) -> str:
+        """컴포넌트 상태 반환 (등록되지 않았으면 pending)."""
+        with self._lock:
+            return self._components.get(name, {}).get("status", PENDING)
+
+    def is_pending(self, name: str) -> bool:
+        """등록된 컴포넌트의 초기화가 아직 끝나지 않았는지 확인."""
+        with self._lock:
+            entry = self._components.get(name)
+        return entry is not None and entry["status"] in (PENDING, LOADING)
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """블록 실행 동안 loading, 끝나면 ready/failed로 기록 (예외는 그대로 전파)."""
+        self.set(name, LOADING)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.set(name, FAILED, error=str(e), seconds=time.perf_counter() - start)
+            raise
+        self.set(name, READY, seconds=time.perf_counter() - start)
+
+    def run(self, name: str, func: Callable[[], Any]) -> bool:
+        """초기화 함수 실행 및 상태 기록.
+
+        함수가 False를 반환하면 disabled(설정되지 않음)로 기록합니다.
+
+        Args:
+            name: 컴포넌트 이름
+            func: 초기화 함수
+
+        Returns:
+            준비 완료 여부
+        """
+        self.set(name, LOADING)
+        start = time.perf_counter()
+        try:
+            result = func()
+        except Exception as e:
+            print(f"[WARNING] {name} 초기화 실패: {str(e)[:200]}")
+            self.set(name, FAILED, error=str(e), seconds=time.perf_counter() - start)
+            return False
+
+        elapsed = time.perf_counter() - start
+        if result is False:
+            self.set(name, DISABLED, seconds=elapsed)
+            return False
+        self.set(name, READY, seconds=elapsed)
+        print(f"[OK] {name} 준비 완료 ({elapsed:.2f}초)")
+        return True
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """전체 컴포넌트 상태 복사본."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._components.items()}
+
+    def overall(self) -> str:
+        """전체 상태 요약.
+
+        Returns:
+            "starting" (초기화 진행 중), "degraded" (일부 실패), "ready"
+        """
+        statuses = [entry["status"] for entry in self.snapshot().values()]
+        if any(status in (PENDING, LOADING) for status in statuses):
+            return "starting"
+        if any(status == FAILED for status in statuses):
+            return "degraded"
+        return "ready"
+
+
+async def run_parallel(
+    readiness: ComponentReadiness, steps: Dict[str, Callable[[], Any]]
+) -> Dict[str, bool]:
+    """서로 독립적인 초기화 작업을 스레드에서 동시에 실행.
+
+    Args:
+        readiness: 상태 추적기
+        steps: {컴포넌트 이름: 초기화 함수}
+
+    Returns:
+        {컴포넌트 이름: 준비 완료 여부}
+    """
+    for name in steps:
+        readiness.set(name, PENDING)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(readiness.run, name, func) for name, func in steps.items())
+    )
+    return dict(zip(steps, results))
+
+
+def check_openai_model(model_name: str) -> None:
+    """OpenAI 모델 메타데이터 조회로 API 키와 모델 접근 권한 확인.
+
+    임베딩/채팅 호출과 달리 과금되지 않는 요청입니다.
+
+    Args:
+        model_name: 확인할 모델 이름
+
+    Raises:
+        openai.OpenAIError: API 키가 잘못되었거나 모델에 접근할 수 없는 경우
+    """
+    from openai import OpenAI
+
+    OpenAI(timeout=10, max_retries=1).models.retrieve(model_name)
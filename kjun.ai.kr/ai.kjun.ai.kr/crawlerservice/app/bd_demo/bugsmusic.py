@@ -1,89 +1,101 @@
 """
 Bugs Music 실시간 차트 크롤러
 정적 크롤링을 사용하여 title, artist, album 정보를 추출합니다.
+요청은 공용 비동기 크롤러(crawler.async_crawler)로 보내고, 파싱은 lxml로 합니다.
+결과는 크롤링 캐시(crawler.crawl_cache)를 거치므로 연속 호출은 캐시에서 응답합니다.
 """
 
-import requests
+import asyncio
 from bs4 import BeautifulSoup
+import httpx
 import json
 
+from crawler.async_crawler import AsyncCrawler
+from crawler.crawl_cache import crawl_cache
 
-def crawl_bugs_chart():
+BUGS_CHART_URL = "https://music.bugs.co.kr/chart/track/realtime/total"
+
+
+def parse_bugs_chart(html):
+    """
+    Bugs Music 차트 HTML에서 곡 정보를 추출합니다.
+
+    Args:
+        html (str): 차트 페이지 HTML
+
+    Returns:
+        list: 곡 정보를 담은 딕셔너리 리스트
+    """
+    # HTML 파싱 (lxml이 html.parser보다 빠름)
+    soup = BeautifulSoup(html, 'lxml')
+
+    # 차트 데이터 저장할 리스트
+    chart_data = []
+
+    # Bugs Music의 차트 테이블 찾기
+    # 실제 구조에 따라 셀렉터를 조정해야 할 수 있습니다
+    chart_table = soup.select('table.list.trackList.byChart')
+
+    if not chart_table:
+        # 대체 셀렉터 시도
+        chart_table = soup.select('table.trackList')
+
+    if chart_table:
+        # 테이블의 각 행(tr) 순회
+        rows = chart_table[0].select('tbody tr')
+
+        for idx, row in enumerate(rows, 1):
+            try:
+                # title 정보 추출
+                title_element = row.select_one('p.title a')
+                title = title_element.get_text(strip=True) if title_element else "N/A"
+
+                # artist 정보 추출
+                artist_element = row.select_one('p.artist a')
+                artist = artist_element.get_text(strip=True) if artist_element else "N/A"
+
+                # album 정보 추출
+                album_element = row.select_one('a.album')
+                album = album_element.get_text(strip=True) if album_element else "N/A"
+
+                # 곡 정보를 딕셔너리로 저장
+                song_info = {
+                    "rank": idx,
+                    "title": title,
+                    "artist": artist,
+                    "album": album
+                }
+
+                chart_data.append(song_info)
+
+            except Exception as e:
+                print(f"행 {idx} 파싱 중 오류 발생: {e}")
+                continue
+    else:
+        print("차트 테이블을 찾을 수 없습니다.")
+
+        # 디버깅을 위해 페이지 구조 일부 출력
+        print("\n=== 페이지 구조 확인 ===")
+        tables = soup.find_all('table', limit=3)
+        for i, table in enumerate(tables):
+            print(f"테이블 {i+1}: {table.get('class', 'class 없음')}")
+
+    return chart_data
+
+
+async def crawl_bugs_chart_async(client=None):
     """
-    Bugs Music 실시간 차트에서 곡 정보를 크롤링합니다.
-    
+    Bugs Music 실시간 차트에서 곡 정보를 크롤링합니다 (비동기).
+
+    Args:
+        client (AsyncCrawler): 사용할 크롤러 (기본값: 서비스 공용 인스턴스)
+
     Returns:
         list: 곡 정보를 담은 딕셔너리 리스트
     """
-    url = "https://music.bugs.co.kr/chart/track/realtime/total"
-    
-    # User-Agent 헤더 추가 (일부 사이트는 봇 접근을 차단할 수 있음)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        # 웹페이지 요청
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-        
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 차트 데이터 저장할 리스트
-        chart_data = []
-        
-        # Bugs Music의 차트 테이블 찾기
-        # 실제 구조에 따라 셀렉터를 조정해야 할 수 있습니다
-        chart_table = soup.select('table.list.trackList.byChart')
-        
-        if not chart_table:
-            # 대체 셀렉터 시도
-            chart_table = soup.select('table.trackList')
-        
-        if chart_table:
-            # 테이블의 각 행(tr) 순회
-            rows = chart_table[0].select('tbody tr')
-            
-            for idx, row in enumerate(rows, 1):
-                try:
-                    # title 정보 추출
-                    title_element = row.select_one('p.title a')
-                    title = title_element.get_text(strip=True) if title_element else "N/A"
-                    
-                    # artist 정보 추출
-                    artist_element = row.select_one('p.artist a')
-                    artist = artist_element.get_text(strip=True) if artist_element else "N/A"
-                    
-                    # album 정보 추출
-                    album_element = row.select_one('a.album')
-                    album = album_element.get_text(strip=True) if album_element else "N/A"
-                    
-                    # 곡 정보를 딕셔너리로 저장
-                    song_info = {
-                        "rank": idx,
-                        "title": title,
-                        "artist": artist,
-                        "album": album
-                    }
-                    
-                    chart_data.append(song_info)
-                    
-                except Exception as e:
-                    print(f"행 {idx} 파싱 중 오류 발생: {e}")
-                    continue
-        else:
-            print("차트 테이블을 찾을 수 없습니다.")
-            
-            # 디버깅을 위해 페이지 구조 일부 출력
-            print("\n=== 페이지 구조 확인 ===")
-            tables = soup.find_all('table', limit=3)
-            for i, table in enumerate(tables):
-                print(f"테이블 {i+1}: {table.get('class', 'class 없음')}")
-        
-        return chart_data
-        
-    except requests.RequestException as e:
+        return await crawl_cache.crawl(BUGS_CHART_URL, parse_bugs_chart, client=client)
+    except httpx.HTTPError as e:
         print(f"웹페이지 요청 중 오류 발생: {e}")
         return []
     except Exception as e:
@@ -91,15 +103,30 @@ def crawl_bugs_chart():
         return []
 
 
+def crawl_bugs_chart():
+    """
+    Bugs Music 실시간 차트에서 곡 정보를 크롤링합니다 (동기 호출용).
+
+    Returns:
+        list: 곡 정보를 담은 딕셔너리 리스트
+    """
+    async def _run():
+        # 이벤트 루프마다 새 크롤러 사용 (공용 인스턴스는 서버 루프에 묶여 있음)
+        async with AsyncCrawler() as client:
+            return await crawl_bugs_chart_async(client)
+
+    return asyncio.run(_run())
+
+
 def main():
     """
     메인 함수: 크롤링을 실행하고 결과를 JSON 형태로 출력합니다.
     """
     print("Bugs Music 실시간 차트 크롤링 시작...\n")
-    
+
     # 차트 데이터 크롤링
     chart_data = crawl_bugs_chart()
-    
+
     if chart_data:
         # JSON 형태로 출력 (한글이 깨지지 않도록 ensure_ascii=False 설정)
         print(json.dumps(chart_data, ensure_ascii=False, indent=2))
@@ -110,4 +137,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
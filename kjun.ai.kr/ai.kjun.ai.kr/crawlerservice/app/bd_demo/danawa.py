@@ -1,99 +1,144 @@
 """
 다나와 메탈시계 제품 정보 크롤러
 정적 크롤링을 사용하여 prod_name, prod_meta, low_price 정보를 추출합니다.
+요청은 공용 비동기 크롤러(crawler.async_crawler)로 보내고, 목록 페이지 여러 개를 동시에 받습니다.
+페이지별 결과는 크롤링 캐시(crawler.crawl_cache)를 거치므로 연속 호출은 캐시에서 응답합니다.
 """
 
-import requests
+import asyncio
 from bs4 import BeautifulSoup
+import httpx
 import json
 
+from crawler.async_crawler import AsyncCrawler
+from crawler.crawl_cache import crawl_cache
 
-def crawl_danawa_products():
+DANAWA_LIST_URL = "https://prod.danawa.com/list/"
+DANAWA_CATEGORY = "18349533"
+
+
+def parse_danawa_products(html):
     """
-    다나와 메탈시계 제품 목록에서 제품 정보를 크롤링합니다.
-    
+    다나와 제품 목록 HTML에서 제품 정보를 추출합니다.
+
+    Args:
+        html (str): 목록 페이지 HTML
+
+    Returns:
+        list: 제품 정보를 담은 딕셔너리 리스트 (index는 페이지 안의 순서)
+    """
+    # HTML 파싱 (lxml이 html.parser보다 빠름)
+    soup = BeautifulSoup(html, 'lxml')
+
+    # 제품 데이터 저장할 리스트
+    products_data = []
+
+    # 제품 목록 찾기
+    # 다나와의 일반적인 구조: product_list 또는 prod_list 클래스
+    product_list = soup.select('div.product_list')
+
+    if not product_list:
+        # 대체 셀렉터 시도
+        product_list = soup.select('div.prod_list')
+
+    if not product_list:
+        # 다른 대체 셀렉터
+        product_list = soup.select('ul.product_list')
+
+    if product_list:
+        # 제품 리스트 내의 각 제품 아이템 찾기
+        products = product_list[0].select('li.prod_item, div.prod_item')
+
+        for idx, product in enumerate(products, 1):
+            try:
+                # prod_name 추출
+                name_element = product.select_one('.prod_name, .prod_name a, a.prod_name')
+                prod_name = name_element.get_text(strip=True) if name_element else "N/A"
+
+                # prod_meta 추출
+                meta_element = product.select_one('.prod_meta, .spec_list')
+                prod_meta = meta_element.get_text(strip=True) if meta_element else "N/A"
+
+                # low_price 추출
+                price_element = product.select_one('.low_price, .price_sect strong, .price strong')
+                low_price = price_element.get_text(strip=True) if price_element else "N/A"
+
+                # 제품 정보를 딕셔너리로 저장
+                product_info = {
+                    "index": idx,
+                    "prod_name": prod_name,
+                    "prod_meta": prod_meta,
+                    "low_price": low_price
+                }
+
+                products_data.append(product_info)
+
+            except Exception as e:
+                print(f"제품 {idx} 파싱 중 오류 발생: {e}")
+                continue
+    else:
+        print("제품 목록을 찾을 수 없습니다.")
+
+        # 디버깅을 위해 페이지 구조 일부 출력
+        print("\n=== 페이지 구조 확인 ===")
+        # 제품 관련 클래스 찾기
+        prod_classes = soup.find_all(class_=lambda x: x and 'prod' in x.lower(), limit=10)
+        for i, elem in enumerate(prod_classes):
+            print(f"요소 {i+1}: {elem.get('class', 'class 없음')}")
+
+    return products_data
+
+
+async def crawl_danawa_products_async(pages=1, client=None):
+    """
+    다나와 메탈시계 제품 목록 페이지들을 동시에 크롤링합니다 (비동기).
+
+    Args:
+        pages (int): 크롤링할 목록 페이지 수 (1페이지부터)
+        client (AsyncCrawler): 사용할 크롤러 (기본값: 서비스 공용 인스턴스)
+
+    Returns:
+        list: 제품 정보를 담은 딕셔너리 리스트 (index는 전체 순서)
+    """
+    targets = [
+        {"cate": DANAWA_CATEGORY, "page": page} if page > 1 else {"cate": DANAWA_CATEGORY}
+        for page in range(1, pages + 1)
+    ]
+    results = await asyncio.gather(
+        *(crawl_cache.crawl(DANAWA_LIST_URL, parse_danawa_products, params=params, client=client) for params in targets),
+        return_exceptions=True,
+    )
+
+    products_data = []
+    for page, result in enumerate(results, 1):
+        if isinstance(result, httpx.HTTPError):
+            print(f"{page}페이지 요청 중 오류 발생: {result}")
+            continue
+        if isinstance(result, Exception):
+            print(f"{page}페이지 크롤링 중 오류 발생: {result}")
+            continue
+        for product in result:
+            # 캐시된 페이지 결과는 공유되므로 복사해서 번호를 매김
+            products_data.append(dict(product, index=len(products_data) + 1))
+    return products_data
+
+
+def crawl_danawa_products(pages=1):
+    """
+    다나와 메탈시계 제품 목록에서 제품 정보를 크롤링합니다 (동기 호출용).
+
+    Args:
+        pages (int): 크롤링할 목록 페이지 수
+
     Returns:
         list: 제품 정보를 담은 딕셔너리 리스트
     """
-    url = "https://prod.danawa.com/list/?cate=18349533"
-    
-    # User-Agent 헤더 추가 (봇 차단 방지)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    try:
-        # 웹페이지 요청
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
-        
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 제품 데이터 저장할 리스트
-        products_data = []
-        
-        # 제품 목록 찾기
-        # 다나와의 일반적인 구조: product_list 또는 prod_list 클래스
-        product_list = soup.select('div.product_list')
-        
-        if not product_list:
-            # 대체 셀렉터 시도
-            product_list = soup.select('div.prod_list')
-        
-        if not product_list:
-            # 다른 대체 셀렉터
-            product_list = soup.select('ul.product_list')
-        
-        if product_list:
-            # 제품 리스트 내의 각 제품 아이템 찾기
-            products = product_list[0].select('li.prod_item, div.prod_item')
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    # prod_name 추출
-                    name_element = product.select_one('.prod_name, .prod_name a, a.prod_name')
-                    prod_name = name_element.get_text(strip=True) if name_element else "N/A"
-                    
-                    # prod_meta 추출
-                    meta_element = product.select_one('.prod_meta, .spec_list')
-                    prod_meta = meta_element.get_text(strip=True) if meta_element else "N/A"
-                    
-                    # low_price 추출
-                    price_element = product.select_one('.low_price, .price_sect strong, .price strong')
-                    low_price = price_element.get_text(strip=True) if price_element else "N/A"
-                    
-                    # 제품 정보를 딕셔너리로 저장
-                    product_info = {
-                        "index": idx,
-                        "prod_name": prod_name,
-                        "prod_meta": prod_meta,
-                        "low_price": low_price
-                    }
-                    
-                    products_data.append(product_info)
-                    
-                except Exception as e:
-                    print(f"제품 {idx} 파싱 중 오류 발생: {e}")
-                    continue
-        else:
-            print("제품 목록을 찾을 수 없습니다.")
-            
-            # 디버깅을 위해 페이지 구조 일부 출력
-            print("\n=== 페이지 구조 확인 ===")
-            # 제품 관련 클래스 찾기
-            prod_classes = soup.find_all(class_=lambda x: x and 'prod' in x.lower(), limit=10)
-            for i, elem in enumerate(prod_classes):
-                print(f"요소 {i+1}: {elem.get('class', 'class 없음')}")
-        
-        return products_data
-        
-    except requests.RequestException as e:
-        print(f"웹페이지 요청 중 오류 발생: {e}")
-        return []
-    except Exception as e:
-        print(f"크롤링 중 오류 발생: {e}")
-        return []
+    async def _run():
+        # 이벤트 루프마다 새 크롤러 사용 (공용 인스턴스는 서버 루프에 묶여 있음)
+        async with AsyncCrawler() as client:
+            return await crawl_danawa_products_async(pages, client)
+
+    return asyncio.run(_run())
 
 
 def main():
@@ -101,10 +146,10 @@ def main():
     메인 함수: 크롤링을 실행하고 결과를 JSON 형태로 출력합니다.
     """
     print("다나와 메탈시계 제품 크롤링 시작...\n")
-    
+
     # 제품 데이터 크롤링
     products_data = crawl_danawa_products()
-    
+
     if products_data:
         # JSON 형태로 출력 (한글이 깨지지 않도록 ensure_ascii=False 설정)
         print(json.dumps(products_data, ensure_ascii=False, indent=2))
@@ -115,4 +160,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,5 @@
+# crawler 패키지 (공용 비동기 크롤러 엔진)
+
+from .async_crawler import AsyncCrawler, crawler
+
+__all__ = ["AsyncCrawler", "crawler"]
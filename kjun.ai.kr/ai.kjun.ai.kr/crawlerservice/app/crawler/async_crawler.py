@@ -0,0 +1,183 @@
+"""
+공용 비동기 크롤러 엔진
+
+- httpx.AsyncClient 하나를 공유해 호스트별 연결(TCP+TLS)을 재사용합니다.
+- 호스트마다 동시 요청 수를 제한하고, 타임아웃과 재시도(지수 백오프)를 적용합니다.
+- HTML 파싱(lxml)은 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+
+환경 변수:
+    CRAWLER_TIMEOUT          요청 타임아웃 (초, 기본값 10)
+    CRAWLER_RETRIES          재시도 횟수 (기본값 2)
+    CRAWLER_MAX_CONNECTIONS  전체 최대 연결 수 (기본값 20)
+    CRAWLER_PER_HOST         호스트별 동시 요청 수 (기본값 4)
+    CRAWLER_PARSE_WORKERS    파싱 스레드 수 (기본값 4)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# 재시도할 HTTP 상태 코드 (일시적인 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class AsyncCrawler:
+    """연결 풀을 공유하는 비동기 크롤러"""
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        per_host: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+    ):
+        self.timeout = timeout or float(os.getenv("CRAWLER_TIMEOUT", "10"))
+        self.retries = retries if retries is not None else int(os.getenv("CRAWLER_RETRIES", "2"))
+        self.max_connections = max_connections or int(os.getenv("CRAWLER_MAX_CONNECTIONS", "20"))
+        self.per_host = per_host or int(os.getenv("CRAWLER_PER_HOST", "4"))
+        self.parse_workers = parse_workers or int(os.getenv("CRAWLER_PARSE_WORKERS", "4"))
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
+        self.requests = 0
+        self.failures = 0
+
+    async def __aenter__(self) -> "AsyncCrawler":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+            )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        페이지를 요청합니다 (호스트별 동시 요청 제한, 실패 시 재시도).
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            headers: 추가 헤더
+
+        Returns:
+            httpx.Response (304 응답도 그대로 반환)
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._host_limit(url):
+                    self.requests += 1
+                    response = await self.client.get(url, params=params, headers=headers)
+                if response.status_code in RETRY_STATUS and attempt < self.retries:
+                    raise httpx.HTTPStatusError(
+                        f"일시적인 오류 {response.status_code}", request=response.request, response=response
+                    )
+                # 304 Not Modified는 조건부 요청의 정상 응답
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = isinstance(e, httpx.TransportError) or e.response.status_code in RETRY_STATUS
+                if not retryable or attempt >= self.retries:
+                    self.failures += 1
+                    raise
+                print(f"요청 재시도 ({attempt + 1}/{self.retries}): {url} - {e}")
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+    async def parse(self, parser: Callable[[str], Any], html: str) -> Any:
+        """파서 함수를 스레드 풀에서 실행 (lxml 파싱이 이벤트 루프를 막지 않도록)"""
+        if self._parse_pool is None:
+            self._parse_pool = ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix="crawler-parse")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, parser, html)
+
+    async def crawl(
+        self,
+        url: str,
+        parser: Callable[[str], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """페이지를 받아 파서 함수 결과를 반환"""
+        response = await self.fetch(url, params=params)
+        return await self.parse(parser, response.text)
+
+    async def crawl_many(
+        self,
+        targets: List[Dict[str, Any]],
+        parser: Callable[[str], Any],
+    ) -> List[Any]:
+        """
+        여러 페이지를 동시에 크롤링합니다.
+
+        Args:
+            targets: {"url": ..., "params": ...} 리스트
+            parser: HTML 문자열을 받는 파서 함수
+
+        Returns:
+            요청 순서대로 파서 결과 또는 예외 객체
+        """
+        return await asyncio.gather(
+            *(self.crawl(req["url"], parser, params=req.get("params")) for req in targets),
+            return_exceptions=True,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """요청 통계"""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "hosts": len(self._host_limits),
+            "max_connections": self.max_connections,
+            "per_host": self.per_host,
+        }
+
+    async def aclose(self) -> None:
+        """HTTP 클라이언트와 파싱 스레드 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+        # 세마포어는 이벤트 루프에 묶이므로 함께 초기화
+        self._host_limits.clear()
+
+
+# 서비스 전체가 공유하는 인스턴스
+crawler = AsyncCrawler()
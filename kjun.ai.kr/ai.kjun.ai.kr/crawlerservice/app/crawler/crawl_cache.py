@@ -0,0 +1,225 @@
+"""
+크롤링 결과 캐시
+
+- URL+파라미터를 키로 파싱 결과를 메모리(LRU)에 저장합니다.
+- 신선 기간(fresh) 안에는 네트워크 없이 바로 반환합니다.
+- 신선 기간이 지나도 허용 기간(stale) 안이면 이전 결과를 바로 반환하고
+  백그라운드에서 갱신합니다 (stale-while-revalidate).
+- 갱신할 때는 ETag/Last-Modified로 조건부 요청을 보내고, 304이거나
+  본문 해시가 같으면 다시 파싱하지 않습니다.
+- 같은 키의 동시 갱신은 하나로 합칩니다.
+
+환경 변수:
+    CRAWL_CACHE_FRESH_SECONDS  신선 기간 (초, 기본값 60)
+    CRAWL_CACHE_STALE_SECONDS  신선 기간 이후 이전 결과를 쓸 수 있는 기간 (초, 기본값 600)
+    CRAWL_CACHE_SIZE           최대 항목 수 (기본값 256)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from crawler.async_crawler import AsyncCrawler, crawler
+
+# 캐시 응답 상태
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class CacheEntry:
+    """캐시 항목 하나 (파싱 결과와 재검증 정보)"""
+
+    __slots__ = ("value", "fetched_at", "etag", "last_modified", "content_hash")
+
+    def __init__(self, value: Any, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                 content_hash: Optional[str] = None):
+        self.value = value
+        self.fetched_at = time.monotonic()
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class CrawlCache:
+    """stale-while-revalidate 방식의 크롤링 결과 캐시"""
+
+    def __init__(self, fresh_seconds: Optional[float] = None, stale_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.fresh_seconds = fresh_seconds if fresh_seconds is not None else float(os.getenv("CRAWL_CACHE_FRESH_SECONDS", "60"))
+        self.stale_seconds = stale_seconds if stale_seconds is not None else float(os.getenv("CRAWL_CACHE_STALE_SECONDS", "600"))
+        self.max_entries = max_entries or int(os.getenv("CRAWL_CACHE_SIZE", "256"))
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats_counter = {
+            "fresh_hits": 0, "stale_hits": 0, "misses": 0,
+            "refreshes": 0, "not_modified": 0, "unchanged": 0, "refresh_errors": 0,
+        }
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """URL과 파라미터로 캐시 키 생성"""
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, ensure_ascii=False)}"
+
+    async def get(
+        self,
+        key: str,
+        refresh: Callable[[Optional[CacheEntry]], Awaitable[Optional[CacheEntry]]],
+        fresh_seconds: Optional[float] = None,
+    ) -> Tuple[Any, str]:
+        """
+        캐시된 결과를 반환하거나 refresh로 새로 가져옵니다.
+
+        Args:
+            key: 캐시 키
+            refresh: 이전 항목(없으면 None)을 받아 새 항목을 돌려주는 코루틴 함수
+                     (None을 돌려주면 결과를 저장하지 않음)
+            fresh_seconds: 이 키의 신선 기간 (기본값: 캐시 설정)
+
+        Returns:
+            (결과, 상태) - 상태는 fresh, stale, miss 중 하나
+        """
+        fresh_seconds = self.fresh_seconds if fresh_seconds is None else fresh_seconds
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry.age < fresh_seconds:
+                self.stats_counter["fresh_hits"] += 1
+                return entry.value, FRESH
+            if entry.age < fresh_seconds + self.stale_seconds:
+                # 이전 결과를 바로 돌려주고 백그라운드에서 갱신
+                self.stats_counter["stale_hits"] += 1
+                self._refresh(key, refresh, entry)
+                return entry.value, STALE
+
+        self.stats_counter["misses"] += 1
+        entry = await asyncio.shield(self._refresh(key, refresh, entry))
+        return (entry.value if entry is not None else None), MISS
+
+    def _refresh(self, key: str, refresh, previous: Optional[CacheEntry]) -> asyncio.Task:
+        """같은 키의 갱신은 진행 중인 작업 하나로 합침"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run_refresh(key, refresh, previous))
+            self._inflight[key] = task
+        return task
+
+    async def _run_refresh(self, key: str, refresh, previous: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        self.stats_counter["refreshes"] += 1
+        try:
+            entry = await refresh(previous)
+        except Exception as e:
+            self.stats_counter["refresh_errors"] += 1
+            if previous is not None:
+                # 갱신 실패 시 이전 결과를 유지 (다음 요청에서 다시 시도)
+                print(f"캐시 갱신 실패, 이전 결과 유지: {key} - {e}")
+                return previous
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if entry is not None:
+            self._store(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def crawl(
+        self,
+        url: str,
+        parser: Callable[[str], Any],
+        params: Optional[Dict[str, Any]] = None,
+        client: Optional[AsyncCrawler] = None,
+        fresh_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        정적 페이지를 캐시를 거쳐 크롤링합니다 (조건부 요청, 본문 해시 비교).
+
+        Args:
+            url: 요청 URL
+            parser: HTML 문자열을 받는 파서 함수
+            params: 쿼리 파라미터
+            client: 사용할 크롤러 (기본값: 서비스 공용 인스턴스)
+            fresh_seconds: 이 URL의 신선 기간
+
+        Returns:
+            파서 결과 (캐시된 결과는 여러 요청이 공유하므로 수정하지 말 것)
+        """
+        client = client or crawler
+
+        async def refresh(previous: Optional[CacheEntry]) -> CacheEntry:
+            headers = {}
+            if previous is not None:
+                if previous.etag:
+                    headers["If-None-Match"] = previous.etag
+                if previous.last_modified:
+                    headers["If-Modified-Since"] = previous.last_modified
+            response = await client.fetch(url, params=params, headers=headers or None)
+
+            if previous is not None and response.status_code == 304:
+                self.stats_counter["not_modified"] += 1
+                return CacheEntry(previous.value, previous.etag, previous.last_modified, previous.content_hash)
+
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if previous is not None and previous.content_hash == content_hash:
+                # 본문이 같으면 다시 파싱하지 않음
+                self.stats_counter["unchanged"] += 1
+                return CacheEntry(previous.value, etag, last_modified, content_hash)
+
+            value = await client.parse(parser, response.text)
+            return CacheEntry(value, etag, last_modified, content_hash)
+
+        value, _ = await self.get(self.make_key(url, params), refresh, fresh_seconds)
+        return value
+
+    async def call(
+        self,
+        key: str,
+        func: Callable[..., Any],
+        *args: Any,
+        fresh_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        동기 크롤링 함수(Selenium 등)의 결과를 캐시합니다 (스레드에서 실행).
+
+        빈 결과는 크롤링 실패로 보고 저장하지 않습니다.
+
+        Returns:
+            func 결과 (캐시된 결과는 여러 요청이 공유하므로 수정하지 말 것)
+        """
+        async def refresh(previous: Optional[CacheEntry]) -> Optional[CacheEntry]:
+            value = await asyncio.to_thread(func, *args)
+            if not value:
+                return previous
+            return CacheEntry(value)
+
+        value, _ = await self.get(key, refresh, fresh_seconds)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "fresh_seconds": self.fresh_seconds,
+            "stale_seconds": self.stale_seconds,
+            "refreshing": len(self._inflight),
+            **self.stats_counter,
+        }
+
+
+# 서비스 전체가 공유하는 인스턴스
+crawl_cache = CrawlCache()
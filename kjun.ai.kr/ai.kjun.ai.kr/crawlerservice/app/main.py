@@ -1,14 +1,18 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Query
 import uvicorn
+import asyncio
 import sys
 from pathlib import Path
 
 # 현재 파일의 디렉토리를 sys.path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from bd_demo.bugsmusic import crawl_bugs_chart
-from bd_demo.danawa import crawl_danawa_products
+from bd_demo.bugsmusic import crawl_bugs_chart_async
+from bd_demo.danawa import crawl_danawa_products_async
 from sel_demo.navernews import crawl_navernews
+from sel_demo.driver_pool import driver_pool
+from crawler.async_crawler import crawler
+from crawler.crawl_cache import crawl_cache
 
 app = FastAPI(
     title="Crawler Service API",
@@ -31,7 +35,7 @@ async def get_bugs_chart():
     Returns:
         dict: 크롤링 결과 (success, count, data)
     """
-    chart_data = crawl_bugs_chart()
+    chart_data = await crawl_bugs_chart_async()
     return {
         "success": True,
         "count": len(chart_data),
@@ -39,14 +43,19 @@ async def get_bugs_chart():
     }
 
 @crawler_router.get("/danawa")
-async def get_danawa_products():
+async def get_danawa_products(
+    pages: int = Query(1, ge=1, le=20, description="크롤링할 목록 페이지 수 (동시 요청)")
+):
     """
     다나와 메탈시계 제품 정보를 크롤링하여 반환합니다.
     
+    Args:
+        pages: 크롤링할 목록 페이지 수 (기본값: 1)
+    
     Returns:
         dict: 크롤링 결과 (success, count, data)
     """
-    products_data = crawl_danawa_products()
+    products_data = await crawl_danawa_products_async(pages)
     return {
         "success": True,
         "count": len(products_data),
@@ -61,7 +70,10 @@ async def get_navernews():
     Returns:
         dict: 크롤링 결과 (success, count, data)
     """
-    news_data = crawl_navernews("esg")
+    # Selenium은 동기 API이므로 스레드에서 실행 (이벤트 루프 차단 방지)
+    # 드라이버는 풀에서 빌려 쓰므로 동시 요청도 Chrome 프로세스를 새로 띄우지 않음
+    # 결과는 캐시해 두고 신선 기간이 지나면 이전 결과를 반환하며 백그라운드에서 갱신
+    news_data = await crawl_cache.call("navernews:esg", crawl_navernews, "esg") or []
     return {
         "success": True,
         "count": len(news_data),
@@ -69,10 +81,41 @@ async def get_navernews():
     }
 
 
+@crawler_router.get("/stats")
+async def get_crawler_stats():
+    """
+    크롤러 요청 통계를 반환합니다.
+    
+    Returns:
+        dict: HTTP 요청/실패 수, 캐시 적중률, 드라이버 풀 상태
+    """
+    return {
+        "success": True,
+        "data": {
+            "http": crawler.stats(),
+            "cache": crawl_cache.stats(),
+            "driver_pool": driver_pool.stats()
+        }
+    }
+
+
 # 서브 라우터를 앱에 포함
 app.include_router(crawler_router)
 
 
+@app.on_event("startup")
+async def warm_driver_pool():
+    """Chrome 드라이버를 백그라운드에서 미리 띄움 (서버 시작을 막지 않음)"""
+    asyncio.get_running_loop().run_in_executor(None, driver_pool.warm)
+
+
+@app.on_event("shutdown")
+async def shutdown_crawler():
+    """공용 HTTP 클라이언트와 드라이버 풀 종료"""
+    await crawler.aclose()
+    await asyncio.to_thread(driver_pool.close)
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=9002)
 
@@ -0,0 +1,236 @@
+"""
+헤드리스 Chrome 드라이버 풀
+
+Chrome은 시작에 수 초, 프로세스마다 수백 MB가 들기 때문에 요청마다 새로 띄우지 않고
+고정된 수의 드라이버를 미리 띄워 두고 돌려 씁니다.
+
+- 드라이버마다 탭 하나를 작업 간에 재사용하고, 작업이 끝나면 about:blank로 되돌립니다.
+- 이미지/폰트/미디어 요청은 CDP로 차단해 페이지 로딩을 줄입니다.
+- 동시 요청은 드라이버가 반납되거나 빈 자리가 생기기를 기다립니다 (Chrome 프로세스가 늘어나지 않음).
+- WebDriver 오류가 난 드라이버나 일정 횟수 이상 사용한 드라이버는 종료하고,
+  기다리던 요청이 빈 자리에 새 드라이버를 띄웁니다.
+
+환경 변수:
+    SELENIUM_POOL_SIZE        드라이버 수 (기본값 2)
+    SELENIUM_ACQUIRE_TIMEOUT  드라이버 대기 시간 (초, 기본값 60)
+    SELENIUM_PAGE_TIMEOUT     페이지 로드 타임아웃 (초, 기본값 20)
+    SELENIUM_DRIVER_MAX_USES  드라이버 재시작 주기 (작업 수, 기본값 50)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# 차단할 리소스 (이미지, 폰트, 미디어)
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+]
+
+
+class DriverPoolTimeout(Exception):
+    """대기 시간 안에 사용할 수 있는 드라이버가 없음"""
+
+
+class DriverPool:
+    """고정 크기 헤드리스 Chrome 드라이버 풀 (스레드 안전)"""
+
+    def __init__(self, size=None, acquire_timeout=None, page_timeout=None, max_uses=None):
+        self.size = size or int(os.getenv("SELENIUM_POOL_SIZE", "2"))
+        self.acquire_timeout = acquire_timeout or float(os.getenv("SELENIUM_ACQUIRE_TIMEOUT", "60"))
+        self.page_timeout = page_timeout or float(os.getenv("SELENIUM_PAGE_TIMEOUT", "20"))
+        self.max_uses = max_uses or int(os.getenv("SELENIUM_DRIVER_MAX_USES", "50"))
+        # 아래 상태는 모두 _cond 안에서만 변경
+        self._cond = threading.Condition()
+        self._idle = []  # 최근에 쓴(캐시가 따뜻한) 드라이버부터 사용 (LIFO)
+        self._live = set()  # 살아 있는 드라이버 (사용 중 포함, close()에서 모두 종료)
+        self._creating = 0  # 시작 중인 드라이버 수
+        self._uses = {}
+        self._closed = False
+        self.tasks = 0
+        self.restarts = 0
+        self.waits = 0
+
+    def _options(self):
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')  # 브라우저 창 숨기기
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument(f'user-agent={USER_AGENT}')
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        # DOMContentLoaded까지만 기다리고 필요한 요소는 WebDriverWait로 기다림
+        chrome_options.page_load_strategy = 'eager'
+        return chrome_options
+
+    def _create_driver(self):
+        driver = webdriver.Chrome(options=self._options())
+        driver.set_page_load_timeout(self.page_timeout)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        except Exception as e:
+            print(f"리소스 차단 설정 실패 (무시): {e}")
+        return driver
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _discard(self, driver, restart=True):
+        """드라이버를 종료하고 빈 자리를 기다리는 스레드를 깨움"""
+        with self._cond:
+            was_live = driver in self._live
+            self._live.discard(driver)
+            self._uses.pop(driver, None)
+            if restart and was_live:
+                self.restarts += 1
+            self._cond.notify()
+        self._quit(driver)
+
+    def _acquire(self):
+        deadline = time.monotonic() + self.acquire_timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다.")
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._live) + self._creating < self.size:
+                    # 빈 자리가 있으면 이 스레드가 새 드라이버를 띄움 (시작은 잠금 밖에서)
+                    self._creating += 1
+                    break
+                if not waited:
+                    waited = True
+                    self.waits += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    if self._idle or len(self._live) + self._creating < self.size:
+                        continue
+                    raise DriverPoolTimeout(f"{self.acquire_timeout}초 안에 사용할 수 있는 드라이버가 없습니다.")
+
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._cond:
+                self._creating -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._creating -= 1
+            if not self._closed:
+                self._live.add(driver)
+                self._uses[driver] = 0
+                return driver
+        self._quit(driver)
+        raise RuntimeError("드라이버 풀이 종료되었습니다.")
+
+    def _release(self, driver, broken=False):
+        with self._cond:
+            if driver not in self._live:
+                # close()로 이미 종료된 드라이버
+                return
+            self._uses[driver] += 1
+            retire = broken or self._uses[driver] >= self.max_uses
+        if retire:
+            self._discard(driver)
+            return
+        try:
+            # 다음 작업이 이전 페이지 상태를 보지 않도록 탭 초기화
+            driver.get("about:blank")
+        except WebDriverException:
+            self._discard(driver)
+            return
+        with self._cond:
+            if driver in self._live:
+                self._idle.append(driver)
+                self._cond.notify()
+
+    @contextmanager
+    def driver(self):
+        """
+        드라이버를 빌려 쓰고 반납합니다.
+
+        WebDriver 오류가 나면 드라이버를 종료하고 새로 띄우며,
+        파싱 오류처럼 드라이버와 무관한 예외는 드라이버를 그대로 반납합니다.
+
+        사용 예:
+            with driver_pool.driver() as driver:
+                driver.get(url)
+
+        Raises:
+            DriverPoolTimeout: 대기 시간 안에 드라이버를 얻지 못한 경우
+        """
+        driver = self._acquire()
+        with self._cond:
+            self.tasks += 1
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken=broken)
+
+    def warm(self):
+        """풀 크기만큼 드라이버를 미리 띄움 (서버 시작 시 호출)"""
+        drivers = []
+        try:
+            for _ in range(self.size):
+                drivers.append(self._acquire())
+        except Exception as e:
+            print(f"드라이버 미리 띄우기 실패: {e}")
+        with self._cond:
+            for driver in drivers:
+                if driver in self._live:
+                    self._idle.append(driver)
+            self._cond.notify_all()
+        return len(drivers)
+
+    def stats(self):
+        """풀 통계"""
+        with self._cond:
+            return {
+                "size": self.size,
+                "alive": len(self._live),
+                "idle": len(self._idle),
+                "tasks": self.tasks,
+                "waits": self.waits,
+                "restarts": self.restarts,
+            }
+
+    def close(self):
+        """사용 중인 것을 포함해 모든 드라이버 종료 (서버 종료 시 호출)"""
+        with self._cond:
+            self._closed = True
+            drivers = list(self._live)
+            self._live.clear()
+            self._idle.clear()
+            self._uses.clear()
+            self._cond.notify_all()
+        for driver in drivers:
+            self._quit(driver)
+
+
+# 서비스 전체가 공유하는 풀
+driver_pool = DriverPool()
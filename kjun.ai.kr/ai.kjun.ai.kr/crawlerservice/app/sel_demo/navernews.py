@@ -1,130 +1,135 @@
 """
 네이버 뉴스 검색 크롤러 (Selenium 사용)
 ESG 키워드로 네이버 뉴스를 검색하여 제목과 관련 정보를 추출합니다.
+요청마다 Chrome을 새로 띄우지 않고 드라이버 풀(driver_pool)의 드라이버를 빌려 씁니다.
 """
 
-from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 import json
-import time
+import os
 
+from sel_demo.driver_pool import driver_pool
 
-def crawl_navernews(keyword="esg"):
+PROFILE_TITLE_SELECTOR = ".sds-comps-horizontal-layout.sds-comps-inline-layout.sds-comps-profile-info-title"
+FENDER_SELECTOR = ".fender-ui_228e3bd1.xaRANlI1WEmTnsgGH3eP"
+NEWS_TITLE_SELECTOR = ".news_tit"
+
+# 검색 결과 요소 대기 시간 (초)
+WAIT_TIMEOUT = float(os.getenv("NAVERNEWS_WAIT_TIMEOUT", "10"))
+
+
+def crawl_navernews(keyword="esg", pool=None):
     """
     네이버 뉴스 검색 결과를 크롤링합니다.
     
     Args:
         keyword (str): 검색 키워드 (기본값: "esg")
+        pool (DriverPool): 사용할 드라이버 풀 (기본값: 서비스 공용 풀)
     
     Returns:
         list: 뉴스 정보를 담은 딕셔너리 리스트
     """
-    # Chrome 옵션 설정
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')  # 브라우저 창 숨기기
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
-    driver = None
+    pool = pool or driver_pool
+    try:
+        # 풀에서 드라이버를 빌려 사용 (동시 요청은 반납될 때까지 대기)
+        with pool.driver() as driver:
+            return _scrape_navernews(driver, keyword)
+    except Exception as e:
+        print(f"크롤링 중 오류 발생: {e}")
+        return []
+
+
+def _scrape_navernews(driver, keyword):
+    """드라이버 하나로 검색 결과 페이지를 열어 뉴스 정보를 추출"""
     news_data = []
     
+    # 네이버 뉴스 검색 페이지 접속 (기간 필터 없음)
+    url = (
+        f"https://search.naver.com/search.naver?"
+        f"ssc=tab.news.all&where=news&sm=tab_jum&query={keyword}"
+    )
+    
+    print(f"검색 키워드: {keyword}")
+    print(f"URL: {url}\n")
+    
+    driver.get(url)
+    
+    # 검색 결과 요소가 나타날 때까지 대기 (고정 sleep 대신)
     try:
-        # Chrome 드라이버 초기화
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        # 네이버 뉴스 검색 페이지 접속 (기간 필터 없음)
-        url = (
-            f"https://search.naver.com/search.naver?"
-            f"ssc=tab.news.all&where=news&sm=tab_jum&query={keyword}"
+        WebDriverWait(driver, WAIT_TIMEOUT).until(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_TITLE_SELECTOR)),
+            EC.presence_of_element_located((By.CSS_SELECTOR, FENDER_SELECTOR)),
+            EC.presence_of_element_located((By.CSS_SELECTOR, NEWS_TITLE_SELECTOR)),
+        ))
+    except TimeoutException:
+        print(f"{WAIT_TIMEOUT}초 안에 검색 결과 요소가 나타나지 않았습니다.")
+    
+    # 뉴스 기사 요소들 찾기
+    try:
+        # 첫 번째 셀렉터: sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-info-title
+        profile_titles = driver.find_elements(
+            By.CSS_SELECTOR, 
+            PROFILE_TITLE_SELECTOR
         )
         
-        print(f"검색 키워드: {keyword}")
-        print(f"URL: {url}\n")
+        for idx, element in enumerate(profile_titles, 1):
+            try:
+                text = element.text.strip()
+                if text:
+                    news_data.append({
+                        "index": idx,
+                        "type": "profile_info_title",
+                        "content": text
+                    })
+            except Exception as e:
+                print(f"프로필 제목 {idx} 추출 중 오류: {e}")
         
-        driver.get(url)
+        # 두 번째 셀렉터: fender-ui_228e3bd1 xaRANlI1WEmTnsgGH3eP
+        fender_elements = driver.find_elements(
+            By.CSS_SELECTOR,
+            FENDER_SELECTOR
+        )
         
-        # 페이지 로딩 대기
-        time.sleep(2)
+        for idx, element in enumerate(fender_elements, 1):
+            try:
+                text = element.text.strip()
+                if text:
+                    news_data.append({
+                        "index": idx + len(profile_titles),
+                        "type": "fender_ui",
+                        "content": text
+                    })
+            except Exception as e:
+                print(f"Fender UI {idx} 추출 중 오류: {e}")
         
-        # 뉴스 기사 요소들 찾기
-        try:
-            # 첫 번째 셀렉터: sds-comps-horizontal-layout sds-comps-inline-layout sds-comps-profile-info-title
-            profile_titles = driver.find_elements(
-                By.CSS_SELECTOR, 
-                ".sds-comps-horizontal-layout.sds-comps-inline-layout.sds-comps-profile-info-title"
-            )
+        # 추가: 일반 뉴스 제목 추출 (대체 방법)
+        if not news_data:
+            print("지정된 클래스를 찾지 못했습니다. 대체 셀렉터를 시도합니다.")
             
-            for idx, element in enumerate(profile_titles, 1):
-                try:
-                    text = element.text.strip()
-                    if text:
-                        news_data.append({
-                            "index": idx,
-                            "type": "profile_info_title",
-                            "content": text
-                        })
-                except Exception as e:
-                    print(f"프로필 제목 {idx} 추출 중 오류: {e}")
-            
-            # 두 번째 셀렉터: fender-ui_228e3bd1 xaRANlI1WEmTnsgGH3eP
-            fender_elements = driver.find_elements(
-                By.CSS_SELECTOR,
-                ".fender-ui_228e3bd1.xaRANlI1WEmTnsgGH3eP"
-            )
+            # 뉴스 제목 요소 찾기
+            news_titles = driver.find_elements(By.CSS_SELECTOR, NEWS_TITLE_SELECTOR)
             
-            for idx, element in enumerate(fender_elements, 1):
+            for idx, title in enumerate(news_titles, 1):
                 try:
-                    text = element.text.strip()
-                    if text:
-                        news_data.append({
-                            "index": idx + len(profile_titles),
-                            "type": "fender_ui",
-                            "content": text
-                        })
+                    text = title.text.strip()
+                    href = title.get_attribute('href')
+                    
+                    news_data.append({
+                        "index": idx,
+                        "type": "news_title",
+                        "title": text,
+                        "url": href
+                    })
                 except Exception as e:
-                    print(f"Fender UI {idx} 추출 중 오류: {e}")
-            
-            # 추가: 일반 뉴스 제목 추출 (대체 방법)
-            if not news_data:
-                print("지정된 클래스를 찾지 못했습니다. 대체 셀렉터를 시도합니다.")
-                
-                # 뉴스 제목 요소 찾기
-                news_titles = driver.find_elements(By.CSS_SELECTOR, ".news_tit")
-                
-                for idx, title in enumerate(news_titles, 1):
-                    try:
-                        text = title.text.strip()
-                        href = title.get_attribute('href')
-                        
-                        news_data.append({
-                            "index": idx,
-                            "type": "news_title",
-                            "title": text,
-                            "url": href
-                        })
-                    except Exception as e:
-                        print(f"뉴스 제목 {idx} 추출 중 오류: {e}")
-        
-        except Exception as e:
-            print(f"요소 검색 중 오류 발생: {e}")
-        
-        return news_data
-        
+                    print(f"뉴스 제목 {idx} 추출 중 오류: {e}")
+    
     except Exception as e:
-        print(f"크롤링 중 오류 발생: {e}")
-        return []
+        print(f"요소 검색 중 오류 발생: {e}")
     
-    finally:
-        # 드라이버 종료
-        if driver:
-            driver.quit()
+    return news_data
 
 
 def main():
@@ -142,6 +147,9 @@ def main():
         print(f"\n총 {len(news_data)}개의 뉴스 정보를 크롤링했습니다.")
     else:
         print("크롤링된 데이터가 없습니다.")
+    
+    # 풀에 남은 Chrome 프로세스 종료
+    driver_pool.close()
 
 
 if __name__ == "__main__":
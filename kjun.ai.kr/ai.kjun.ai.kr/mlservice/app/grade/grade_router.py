@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from .grade_service import GradeService
+from jobs.job_manager import job_manager
+from pathlib import Path
 from icecream import ic
 
 grade_router = APIRouter(prefix="/grade", tags=["grade"])
@@ -19,7 +21,11 @@ async def root():
 async def preprocess():
     """전처리 수행 및 결과 조회"""
     try:
-        result = service.preprocess()
+        result = await job_manager.run(
+            "grade/preprocess", service.preprocess, input_files=[Path(__file__).parent / "grade.csv"],
+            lock_key="grade",
+            cache=True,
+        )
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -0,0 +1,327 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 결과에서 저장된 파일 경로를 담는 키
+RESULT_FILE_KEYS = ("filepath", "file_path")
+
+# 작업 상태
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+def _is_error(result: Any) -> bool:
+    """서비스가 예외 대신 돌려주는 오류 결과 ({"error": ...})인지 확인"""
+    return isinstance(result, dict) and "error" in result
+
+
+def _result_files(result: Any) -> Iterator[str]:
+    """결과에 담긴 파일 경로 (중첩된 dict/list 포함)"""
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if key in RESULT_FILE_KEYS and isinstance(value, str):
+                yield value
+            else:
+                yield from _result_files(value)
+    elif isinstance(result, list):
+        for item in result:
+            yield from _result_files(item)
+
+
+class Job:
+    """백그라운드 작업 하나의 상태와 결과"""
+
+    def __init__(self, endpoint: str, key: str, params: Optional[Dict[str, Any]] = None):
+        self.id = uuid.uuid4().hex
+        self.endpoint = endpoint
+        self.key = key
+        self.params = params or {}
+        self.status = PENDING
+        self.cached = False
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = asyncio.Event()
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "endpoint": self.endpoint,
+            "params": self.params,
+            "status": self.status,
+            "cached": self.cached,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.started_at and self.finished_at:
+            data["elapsed_seconds"] = round(self.finished_at - self.started_at, 3)
+        if self.status == FAILED:
+            data["error"] = str(self.error)
+        if include_result and self.status == SUCCEEDED:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """분석 엔드포인트 공용 작업/결과 계층
+
+    - cache=True인 엔드포인트만 (엔드포인트, 파라미터, 입력 파일 수정 시각)을 키로
+      결과를 LRU 캐시에 저장 (TTL이 지나면 다시 계산)
+    - "error"가 담긴 결과는 저장하지 않고, 결과의 파일 경로가 사라졌으면 다시 계산
+    - 같은 키로 동시에 들어온 요청은 하나의 계산으로 합침
+    - 무거운 계산(모델 학습, 워드클라우드)은 프로세스 풀, 나머지는 스레드 풀에서 실행해
+      이벤트 루프를 막지 않음
+    - background 요청은 작업 ID를 바로 돌려주고 GET /jobs/{id}로 상태 조회
+    - 같은 lock_key의 작업은 한 번에 하나씩 실행 (모듈 공용 서비스 인스턴스의 상태를
+      여러 스레드가 동시에 바꾸지 않도록)
+    """
+
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        history_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+    ):
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv("MLSERVICE_CACHE_SIZE", "64"))
+        # 결과 유효 시간 (초, 0 이하면 입력 파일이 바뀔 때까지 유지)
+        self.cache_ttl = cache_ttl if cache_ttl is not None else float(os.getenv("MLSERVICE_CACHE_TTL", "600"))
+        self.process_workers = process_workers or int(os.getenv("MLSERVICE_PROCESS_WORKERS", "2"))
+        self.thread_workers = thread_workers or int(os.getenv("MLSERVICE_THREAD_WORKERS", "4"))
+        self.history_size = history_size or int(os.getenv("MLSERVICE_JOB_HISTORY", "200"))
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Job] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None, input_files: Iterable = ()) -> str:
+        """엔드포인트, 파라미터, 입력 파일 수정 시각으로 캐시 키 생성"""
+        mtimes = []
+        for path in input_files:
+            try:
+                mtimes.append([str(path), os.stat(path).st_mtime_ns])
+            except OSError:
+                mtimes.append([str(path), None])
+        raw = json.dumps([endpoint, params or {}, mtimes], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _executor(self, heavy: bool):
+        if heavy:
+            if self._process_pool is None:
+                # spawn: 워커 프로세스가 부모의 스레드/JVM 상태를 물려받지 않도록
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_workers, mp_context=get_context("spawn")
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="mlservice-job")
+        return self._thread_pool
+
+    def _lock(self, lock_key: Optional[str]) -> Optional[asyncio.Lock]:
+        if lock_key is None:
+            return None
+        if lock_key not in self._locks:
+            self._locks[lock_key] = asyncio.Lock()
+        return self._locks[lock_key]
+
+    def submit(
+        self,
+        endpoint: str,
+        func: Callable[..., Any],
+        *args: Any,
+        params: Optional[Dict[str, Any]] = None,
+        input_files: Iterable = (),
+        heavy: bool = False,
+        lock_key: Optional[str] = None,
+        cache: bool = False,
+    ) -> Job:
+        """
+        계산을 작업으로 등록합니다 (결과를 기다리지 않음).
+
+        같은 계산이 진행 중이면 그 작업을, cache=True이고 캐시에 결과가 있으면
+        완료된 작업을 반환합니다.
+
+        Args:
+            endpoint: 엔드포인트 이름 (캐시 키)
+            func: 실행할 함수 (heavy=True면 프로세스 풀로 보내므로 모듈 최상위 함수여야 함)
+            *args: func 인자
+            params: 요청 파라미터 (캐시 키, 작업 정보)
+            input_files: 결과에 영향을 주는 입력 파일 (수정 시각이 바뀌면 다시 계산)
+            heavy: 프로세스 풀에서 실행할지 여부
+            lock_key: 같은 키의 작업끼리 순서대로 실행 (같은 서비스 인스턴스를 쓰는 엔드포인트)
+            cache: 결과를 캐시할지 여부 (파일 저장 등 부수 효과가 있는 엔드포인트는 False)
+
+        Returns:
+            Job
+        """
+        key = self.make_key(endpoint, params, input_files)
+
+        cached = self._lookup(key) if cache else None
+        if cached is not None:
+            self.hits += 1
+            job = Job(endpoint, key, params)
+            job.status, job.cached, job.result = SUCCEEDED, True, cached[1]
+            job.started_at = job.finished_at = time.time()
+            job.done.set()
+            self._remember(job)
+            return job
+
+        if key in self._inflight:
+            self.coalesced += 1
+            return self._inflight[key]
+
+        self.misses += 1
+        job = Job(endpoint, key, params)
+        self._inflight[key] = job
+        self._remember(job)
+        asyncio.get_running_loop().create_task(self._execute(job, func, args, heavy, lock_key, cache))
+        return job
+
+    async def run(
+        self,
+        endpoint: str,
+        func: Callable[..., Any],
+        *args: Any,
+        params: Optional[Dict[str, Any]] = None,
+        input_files: Iterable = (),
+        heavy: bool = False,
+        lock_key: Optional[str] = None,
+        cache: bool = False,
+    ) -> Any:
+        """계산 결과를 기다려 반환합니다 (캐시/중복 요청 합치기 적용, 실패 시 원래 예외 발생)."""
+        job = self.submit(
+            endpoint, func, *args,
+            params=params, input_files=input_files, heavy=heavy, lock_key=lock_key, cache=cache,
+        )
+        await job.done.wait()
+        if job.status == FAILED:
+            raise job.error
+        return job.result
+
+    async def call(self, func: Callable[..., Any], *args: Any, lock_key: Optional[str] = None) -> Any:
+        """캐시 없이 스레드 풀에서 실행합니다 (lock_key가 같은 작업과는 순서대로 실행)."""
+        loop = asyncio.get_running_loop()
+        lock = self._lock(lock_key)
+        if lock is None:
+            return await loop.run_in_executor(self._executor(False), func, *args)
+        async with lock:
+            return await loop.run_in_executor(self._executor(False), func, *args)
+
+    async def _execute(
+        self,
+        job: Job,
+        func: Callable[..., Any],
+        args: tuple,
+        heavy: bool,
+        lock_key: Optional[str] = None,
+        cache: bool = False,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        lock = self._lock(lock_key)
+        try:
+            if lock is not None:
+                # 같은 서비스의 앞선 작업이 끝날 때까지 pending 상태로 대기
+                await lock.acquire()
+            job.status = RUNNING
+            job.started_at = time.time()
+            try:
+                job.result = await loop.run_in_executor(self._executor(heavy), func, *args)
+            finally:
+                if lock is not None:
+                    lock.release()
+            job.status = SUCCEEDED
+            if cache:
+                self._store(job.key, job.result)
+            logger.info(f"작업 완료: {job.endpoint} ({time.time() - job.started_at:.2f}s)")
+        except Exception as e:
+            job.status = FAILED
+            job.error = e
+            logger.error(f"작업 실패: {job.endpoint}: {e}")
+        finally:
+            job.finished_at = time.time()
+            self._inflight.pop(job.key, None)
+            job.done.set()
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, Any]]:
+        """유효한 캐시 항목 반환 (만료되었거나 결과 파일이 사라졌으면 삭제)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        expired = self.cache_ttl > 0 and time.time() - stored_at > self.cache_ttl
+        if expired or not all(os.path.exists(path) for path in _result_files(result)):
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, result: Any) -> None:
+        if self.cache_size <= 0 or _is_error(result):
+            return
+        self._cache[key] = (time.time(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _remember(self, job: Job) -> None:
+        self._jobs[job.id] = job
+        # 오래된 완료 작업부터 정리
+        while len(self._jobs) > self.history_size:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if not oldest.done.is_set():
+                break
+            del self._jobs[oldest_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시/작업 통계"""
+        return {
+            "cache_size": len(self._cache),
+            "cache_max_size": self.cache_size,
+            "cache_ttl": self.cache_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "running": len(self._inflight),
+            "jobs": len(self._jobs),
+            "process_workers": self.process_workers,
+            "thread_workers": self.thread_workers,
+        }
+
+    def shutdown(self) -> None:
+        """실행기 종료"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+
+
+# 모든 라우터가 공유하는 인스턴스
+job_manager = JobManager()
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+from .job_manager import job_manager
+import logging
+
+logger = logging.getLogger(__name__)
+
+jobs_router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@jobs_router.get("/")
+async def job_stats():
+    """결과 캐시 및 작업 통계"""
+    return JSONResponse(content={
+        "success": True,
+        "data": job_manager.stats()
+    })
+
+
+@jobs_router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    백그라운드 작업 상태 조회
+    
+    완료된 작업은 결과(result)를, 실패한 작업은 오류(error)를 함께 반환합니다.
+    
+    Example:
+        GET /jobs/3f2c...
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return JSONResponse(content={
+        "success": True,
+        "data": job.to_dict()
+    })
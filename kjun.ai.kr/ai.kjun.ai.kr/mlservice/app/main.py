@@ -5,6 +5,8 @@ from seoul_crime.seoul_router import seoul_router
 from seoullab_crime.seoullab_router import seoullab_router
 from us_unemployment.router import usa_router
 from nlp.nlp_router import nlp_router
+from jobs.job_router import jobs_router
+from jobs.job_manager import job_manager
 import logging
 from dotenv import load_dotenv
 import os
@@ -70,6 +72,14 @@ app.include_router(usa_router)
 # NLP 라우터 연결
 app.include_router(nlp_router)
 
+# 작업 상태 조회 라우터 연결
+app.include_router(jobs_router)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """작업 실행기(프로세스/스레드 풀) 종료"""
+    job_manager.shutdown()
+
 @app.get("/")
 async def root():
     return {"message": "ML Service API"}
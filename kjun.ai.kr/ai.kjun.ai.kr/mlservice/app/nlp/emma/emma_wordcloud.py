@@ -20,9 +20,38 @@ from nltk.tag import pos_tag, untag
 from nltk import Text, FreqDist
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
+from PIL import Image
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
+import hashlib
+import io
+import logging
 import os
+import pickle
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 고유명사 추출 시 기본 제외 단어
+PROPER_NOUN_STOPWORDS = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
+
+# 분석 결과/워드클라우드 이미지 캐시 경로
+CACHE_DIR = Path(__file__).parent.parent / "save" / "cache"
+
+
+def _write_cache_file(path, data):
+    """캐시 파일을 임시 파일에 쓴 뒤 교체 (임시 파일 이름은 요청마다 다름)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False) as f:
+        f.write(data)
+        tmp_path = Path(f.name)
+    try:
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 class NLPService:
@@ -73,6 +102,10 @@ class NLPService:
         # 말뭉치 데이터 저장
         self.corpus_data = {}
         self.text_objects = {}
+        # 말뭉치 분석 결과 (get_corpus_analytics, 키별 메모리 캐시)
+        self.analytics_cache = {}
+        # 여러 요청이 동시에 같은 말뭉치를 품사 태깅하지 않도록
+        self._analytics_lock = threading.Lock()
     
     # *********
     # 말뭉치 관리
@@ -410,16 +443,103 @@ class NLPService:
             FreqDist: 고유명사 빈도 분포 객체
         """
         if stopwords is None:
-            stopwords = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
+            stopwords = PROPER_NOUN_STOPWORDS
         
         tokens = self.tokenize_regex(text)
         tagged_list = self.pos_tag(tokens)
+        return self._proper_nouns(tagged_list, stopwords)
+    
+    def _proper_nouns(self, tagged_list, stopwords):
+        """품사 태깅 결과에서 고유명사(NNP) 빈도 분포 생성"""
         names_list = [
             t[0] for t in tagged_list 
             if t[1] == "NNP" and t[0] not in stopwords
         ]
         return self.create_freq_dist(names_list)
     
+    # ***********
+    # 분석 결과 캐시
+    # ***********
+    
+    def get_corpus_analytics(self, corpus_name='gutenberg', fileid='austen-emma.txt', stopwords=None):
+        """
+        말뭉치의 토큰/품사/고유명사 빈도를 한 번만 계산해 캐시
+        
+        품사 태깅은 소설 한 권에 수 초가 걸리므로 결과를 메모리와
+        save/cache/analytics_<key>.pkl에 저장합니다. 키는 말뭉치 ID,
+        NLTK 버전, 제외 단어로 만들므로 셋 중 하나가 바뀌면 다시 계산합니다.
+        
+        Args:
+            corpus_name (str): 말뭉치 이름
+            fileid (str): 파일 ID
+            stopwords (list): 고유명사에서 제외할 단어 리스트
+            
+        Returns:
+            dict: key, total_tokens, unique_tokens, pos_counts, token_counts,
+                  proper_nouns(FreqDist) / 말뭉치가 없으면 None
+        """
+        if stopwords is None:
+            stopwords = PROPER_NOUN_STOPWORDS
+        raw_key = f"{corpus_name}/{fileid}|nltk={nltk.__version__}|{','.join(sorted(stopwords))}"
+        key = hashlib.sha256(raw_key.encode('utf-8')).hexdigest()[:16]
+        
+        if key in self.analytics_cache:
+            return self.analytics_cache[key]
+        
+        with self._analytics_lock:
+            # 기다리는 동안 다른 요청이 계산을 마쳤으면 그 결과 사용
+            if key in self.analytics_cache:
+                return self.analytics_cache[key]
+            return self._compute_corpus_analytics(key, corpus_name, fileid, stopwords)
+    
+    def _compute_corpus_analytics(self, key, corpus_name, fileid, stopwords):
+        """get_corpus_analytics의 캐시 파일 읽기/계산 (_analytics_lock 안에서 호출)"""
+        cache_path = CACHE_DIR / f"analytics_{key}.pkl"
+        analytics = None
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    analytics = pickle.load(f)
+                logger.info(f"말뭉치 분석 캐시 사용: {cache_path}")
+            except Exception as e:
+                logger.warning(f"말뭉치 분석 캐시를 읽을 수 없어 다시 계산합니다: {e}")
+        
+        if analytics is None:
+            text = self.load_corpus(corpus_name, fileid)
+            if not text:
+                return None
+            logger.info(f"말뭉치 분석 중: {corpus_name}/{fileid}")
+            tokens = self.tokenize_regex(text)
+            tagged_list = self.pos_tag(tokens)
+            token_counts = self.create_freq_dist(tokens)
+            # 빈도(dict)만 저장해 캐시 파일을 작게 유지
+            analytics = {
+                "key": key,
+                "corpus": f"{corpus_name}/{fileid}",
+                "nltk_version": nltk.__version__,
+                "total_tokens": len(tokens),
+                "unique_tokens": len(token_counts),
+                "pos_counts": dict(Counter(tag for _, tag in tagged_list)),
+                "token_counts": dict(token_counts),
+                "proper_nouns": dict(self._proper_nouns(tagged_list, stopwords)),
+            }
+            _write_cache_file(cache_path, pickle.dumps(analytics, protocol=pickle.HIGHEST_PROTOCOL))
+            logger.info(f"말뭉치 분석 캐시 저장: {cache_path}")
+        
+        analytics = dict(analytics, proper_nouns=FreqDist(analytics["proper_nouns"]))
+        self.analytics_cache[key] = analytics
+        return analytics
+    
+    def get_emma_proper_nouns(self):
+        """
+        엠마 말뭉치의 고유명사 빈도 분포 (캐시 사용)
+        
+        Returns:
+            FreqDist: 고유명사 빈도 분포 객체 (말뭉치가 없으면 None)
+        """
+        analytics = self.get_corpus_analytics('gutenberg', 'austen-emma.txt')
+        return analytics["proper_nouns"] if analytics else None
+    
     # ***********
     # 워드클라우드
     # ***********
@@ -492,6 +612,77 @@ class NLPService:
         
         return wordcloud, saved_path
     
+    def render_wordcloud_png(self, freq_dist, width=1000, height=600,
+                             background_color="white", random_state=0, cache_key=None):
+        """
+        워드클라우드를 PNG 바이트로 렌더링
+        
+        cache_key가 있으면 (cache_key, width, height, background_color, random_state)별로
+        save/cache에 저장된 이미지를 재사용합니다.
+        
+        Args:
+            freq_dist (FreqDist): 빈도 분포 객체
+            width (int): 이미지 너비
+            height (int): 이미지 높이
+            background_color (str): 배경색
+            random_state (int): 랜덤 시드
+            cache_key (str, optional): 빈도 분포를 구분하는 키 (분석 결과 key)
+            
+        Returns:
+            bytes: PNG 이미지
+        """
+        cache_path = None
+        if cache_key:
+            params = f"{cache_key}|{width}|{height}|{background_color}|{random_state}"
+            cache_path = CACHE_DIR / f"wordcloud_{hashlib.sha256(params.encode('utf-8')).hexdigest()[:16]}.png"
+            if cache_path.exists():
+                return cache_path.read_bytes()
+        
+        wordcloud, _ = self.generate_wordcloud(
+            freq_dist, width, height, background_color, random_state
+        )
+        img_buffer = io.BytesIO()
+        Image.fromarray(wordcloud.to_array()).save(img_buffer, format='PNG')
+        png = img_buffer.getvalue()
+        
+        if cache_path is not None:
+            _write_cache_file(cache_path, png)
+        return png
+    
+    def emma_wordcloud_png(self, width=1000, height=600, background_color="white", random_state=0):
+        """
+        엠마 고유명사 워드클라우드 PNG (분석 결과와 이미지 모두 캐시 사용)
+        
+        Returns:
+            bytes: PNG 이미지
+        """
+        analytics = self.get_corpus_analytics('gutenberg', 'austen-emma.txt')
+        if not analytics:
+            raise FileNotFoundError("엠마 말뭉치를 찾을 수 없습니다.")
+        if len(analytics["proper_nouns"]) == 0:
+            raise ValueError("고유명사를 추출할 수 없습니다.")
+        return self.render_wordcloud_png(
+            analytics["proper_nouns"], width, height, background_color, random_state,
+            cache_key=analytics["key"]
+        )
+    
+    def save_wordcloud_png(self, png, file_name="emma_wordcloud.png"):
+        """
+        렌더링된 PNG를 save 디렉토리에 저장 (고정 파일명, 덮어쓰기)
+        
+        Args:
+            png (bytes): PNG 이미지
+            file_name (str): 저장할 파일명
+            
+        Returns:
+            str: 저장된 파일 경로
+        """
+        save_dir = Path(__file__).parent.parent / "save"
+        save_dir.mkdir(parents=True, exist_ok=True)
+        save_path = save_dir / file_name
+        save_path.write_bytes(png)
+        return str(save_path)
+    
     def plot_wordcloud(self, freq_dist, width=1000, height=600, 
                       background_color="white", random_state=0):
         """
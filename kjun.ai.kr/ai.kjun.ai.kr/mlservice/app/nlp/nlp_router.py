@@ -3,10 +3,10 @@ from fastapi.responses import StreamingResponse, JSONResponse
 from typing import Optional
 import io
 import logging
-from PIL import Image
 from pathlib import Path
 from .emma.emma_wordcloud import NLPService
-from .samsung.samsung_wordcloud import SamsungWordcloud
+from .samsung.samsung_wordcloud import draw_wordcloud_job
+from jobs.job_manager import job_manager
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +15,6 @@ nlp_router = APIRouter(prefix="/nlp", tags=["nlp"])
 # NLPService 인스턴스 생성
 nlp_service = NLPService()
 
-# SamsungWordcloud 인스턴스는 필요할 때 생성 (초기화 오류 방지)
-samsung_wordcloud = None
-
-def get_samsung_wordcloud():
-    """SamsungWordcloud 인스턴스를 지연 초기화"""
-    global samsung_wordcloud
-    if samsung_wordcloud is None:
-        try:
-            samsung_wordcloud = SamsungWordcloud()
-        except Exception as e:
-            logger.error(f"SamsungWordcloud 초기화 실패: {str(e)}")
-            raise
-    return samsung_wordcloud
-
-
 @nlp_router.get("/")
 async def root():
     """NLP API 루트"""
@@ -56,48 +41,15 @@ async def generate_emma_wordcloud(
         StreamingResponse: PNG 이미지 스트림
     """
     try:
-        # 엠마 말뭉치 로드
-        logger.info("엠마 말뭉치 로드 중...")
-        emma_raw = nlp_service.get_emma_corpus()
-        
-        if not emma_raw:
-            raise HTTPException(
-                status_code=404, 
-                detail="엠마 말뭉치를 찾을 수 없습니다."
-            )
-        
-        # 고유명사 추출 및 빈도 분포 생성
-        logger.info("고유명사 추출 중...")
-        proper_nouns_fd = nlp_service.extract_proper_nouns(emma_raw)
-        
-        if not proper_nouns_fd or len(proper_nouns_fd) == 0:
-            raise HTTPException(
-                status_code=500,
-                detail="고유명사를 추출할 수 없습니다."
-            )
-        
-        # 워드클라우드 생성 (저장하지 않음)
-        logger.info("워드클라우드 생성 중...")
-        wordcloud, saved_path = nlp_service.generate_wordcloud(
-            freq_dist=proper_nouns_fd,
-            width=width,
-            height=height,
-            background_color=background_color,
-            random_state=random_state,
-            save_path=None  # 저장하지 않음
+        # 분석 결과와 이미지 모두 캐시되어 같은 파라미터는 다시 렌더링하지 않음
+        png = await job_manager.run(
+            "nlp/emma",
+            nlp_service.emma_wordcloud_png,
+            width, height, background_color, random_state,
+            params={"width": width, "height": height, "background_color": background_color, "random_state": random_state},
+            cache=True,
         )
-        
-        # WordCloud 객체를 이미지로 변환
-        # WordCloud는 to_array() 메서드로 numpy 배열을 반환
-        wordcloud_array = wordcloud.to_array()
-        
-        # numpy 배열을 PIL Image로 변환
-        img = Image.fromarray(wordcloud_array)
-        
-        # 이미지를 바이트 스트림으로 변환
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
+        img_buffer = io.BytesIO(png)
         
         logger.info("워드클라우드 생성 완료")
         
@@ -110,8 +62,8 @@ async def generate_emma_wordcloud(
             }
         )
         
-    except HTTPException:
-        raise
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         import traceback
         error_msg = f"워드클라우드 생성 오류: {str(e)}"
@@ -140,41 +92,18 @@ async def save_emma_wordcloud(
         JSONResponse: 저장된 파일 경로 정보
     """
     try:
-        # 엠마 말뭉치 로드
-        logger.info("엠마 말뭉치 로드 중...")
-        emma_raw = nlp_service.get_emma_corpus()
-        
-        if not emma_raw:
-            raise HTTPException(
-                status_code=404, 
-                detail="엠마 말뭉치를 찾을 수 없습니다."
-            )
-        
-        # 고유명사 추출 및 빈도 분포 생성
-        logger.info("고유명사 추출 중...")
-        proper_nouns_fd = nlp_service.extract_proper_nouns(emma_raw)
-        
-        if not proper_nouns_fd or len(proper_nouns_fd) == 0:
-            raise HTTPException(
-                status_code=500,
-                detail="고유명사를 추출할 수 없습니다."
-            )
-        
-        # 워드클라우드 생성 및 저장 (고정 파일명으로 덮어쓰기)
-        logger.info("워드클라우드 생성 및 저장 중...")
-        wordcloud, saved_path = nlp_service.generate_wordcloud(
-            freq_dist=proper_nouns_fd,
-            width=width,
-            height=height,
-            background_color=background_color,
-            random_state=random_state,
-            save_path="fixed"  # 고정 파일명으로 덮어쓰기
+        # /emma와 같은 캐시된 PNG를 고정 파일명으로 저장 (덮어쓰기)
+        png = await job_manager.run(
+            "nlp/emma",
+            nlp_service.emma_wordcloud_png,
+            width, height, background_color, random_state,
+            params={"width": width, "height": height, "background_color": background_color, "random_state": random_state},
+            cache=True,
         )
-        
+        saved_path = nlp_service.save_wordcloud_png(png, "emma_wordcloud.png")
         logger.info(f"워드클라우드 이미지 저장 완료: {saved_path}")
         
         # 저장된 파일 정보 반환
-        from pathlib import Path
         saved_path_obj = Path(saved_path)
         
         return JSONResponse(content={
@@ -191,8 +120,8 @@ async def save_emma_wordcloud(
             }
         })
         
-    except HTTPException:
-        raise
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         import traceback
         error_msg = f"워드클라우드 저장 오류: {str(e)}"
@@ -210,18 +139,15 @@ async def get_emma_stats():
         dict: 통계 정보
     """
     try:
-        # 엠마 말뭉치 로드
-        emma_raw = nlp_service.get_emma_corpus()
+        # 고유명사 빈도 (캐시된 분석 결과 사용)
+        proper_nouns_fd = await job_manager.run("nlp/emma/stats", nlp_service.get_emma_proper_nouns, cache=True)
         
-        if not emma_raw:
+        if proper_nouns_fd is None:
             raise HTTPException(
                 status_code=404,
                 detail="엠마 말뭉치를 찾을 수 없습니다."
             )
         
-        # 고유명사 추출
-        proper_nouns_fd = nlp_service.extract_proper_nouns(emma_raw)
-        
         # 통계 정보
         total_count = proper_nouns_fd.N()
         most_common = nlp_service.get_most_common(proper_nouns_fd, 10)
@@ -255,8 +181,14 @@ async def get_emma_stats():
         raise HTTPException(status_code=500, detail=error_msg)
 
 
+# 삼성 워드클라우드 입력 파일 (수정되면 다시 생성)
+SAMSUNG_INPUT_FILES = [Path(__file__).parent / "data" / name for name in ("kr-Report_2018.txt", "stopwords.txt")]
+
+
 @nlp_router.get("/samsung/save")
-async def save_samsung_wordcloud():
+async def save_samsung_wordcloud(
+    background: bool = Query(False, description="true면 작업 ID를 바로 반환 (GET /jobs/{job_id}로 결과 조회)")
+):
     """
     삼성 리포트를 기반으로 워드클라우드 생성 및 저장
     
@@ -266,11 +198,14 @@ async def save_samsung_wordcloud():
     try:
         logger.info("삼성 워드클라우드 생성 및 저장 시작...")
         
-        # SamsungWordcloud 인스턴스 가져오기 (지연 초기화)
-        swc = get_samsung_wordcloud()
-        
-        # 워드클라우드 생성 및 저장
-        output_file_path = swc.draw_wordcloud()
+        # 워드클라우드 생성 및 저장 (프로세스 풀, 파일을 저장하므로 결과 캐시 없음)
+        if background:
+            job = job_manager.submit("nlp/samsung/save", draw_wordcloud_job, input_files=SAMSUNG_INPUT_FILES, heavy=True)
+            return JSONResponse(status_code=202, content={
+                "success": True,
+                "job": job.to_dict(include_result=False)
+            })
+        output_file_path = await job_manager.run("nlp/samsung/save", draw_wordcloud_job, input_files=SAMSUNG_INPUT_FILES, heavy=True)
         
         # 저장된 파일 경로 확인
         output_file = Path(output_file_path)
@@ -36,6 +36,9 @@ matplotlib.use('Agg')  # GUI 없이 사용 (서버 환경)
 import matplotlib.pyplot as plt
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import List
 import os
 
 # KoNLPy의 Okt 형태소 분석기 import
@@ -47,6 +50,52 @@ except ImportError:
     raise
 
 
+# 한 번의 Okt 호출로 분석할 어절 수 (JVM 왕복 횟수 감소)
+CHUNK_WORDS = int(os.getenv('SAMSUNG_OKT_CHUNK_WORDS', '2000'))
+# 어절 수가 이보다 많고 SAMSUNG_NLP_WORKERS > 1이면 여러 프로세스에서 분석
+PARALLEL_MIN_WORDS = int(os.getenv('SAMSUNG_PARALLEL_MIN_WORDS', '20000'))
+
+
+def nouns_per_word(okt, words: List[str]) -> List[str]:
+    """
+    어절 목록을 한 번의 Okt 호출로 분석해 어절별 명사 결합 결과를 반환합니다.
+    
+    형태소를 원문 위치에 맞춰 어절에 다시 배정하므로 어절마다 okt.pos를 호출한 결과와 같습니다.
+    (예: '삼성전자의' → '삼성전자') 위치를 맞출 수 없으면 어절별 분석으로 대체합니다.
+    """
+    text = ' '.join(words)
+    # 각 문자 위치가 속한 어절 번호 (공백은 -1)
+    owner = []
+    for index, word in enumerate(words):
+        owner.extend([index] * len(word))
+        owner.append(-1)
+    
+    nouns = [[] for _ in words]
+    cursor = 0
+    for morph, tag in okt.pos(text):
+        found = text.find(morph, cursor) if morph else -1
+        if found < 0 or text[cursor:found].strip() or owner[found] < 0:
+            logger.warning("형태소 위치를 맞출 수 없어 어절별로 분석합니다.")
+            return [''.join(m for m, t in okt.pos(word) if t == 'Noun') for word in words]
+        if tag == 'Noun':
+            nouns[owner[found]].append(morph)
+        cursor = found + len(morph)
+    return [''.join(noun) for noun in nouns]
+
+
+# 병렬 분석 워커 프로세스의 Okt (워커마다 JVM 한 번만 시작)
+_worker_okt = None
+
+
+def _init_okt_worker():
+    global _worker_okt
+    _worker_okt = Okt()
+
+
+def _extract_chunk(words: List[str]) -> List[str]:
+    return nouns_per_word(_worker_okt, words)
+
+
 class SamsungWordcloud:
 
     def __init__(self):
@@ -56,6 +105,20 @@ class SamsungWordcloud:
         except Exception as e:
             logger.error(f"Okt 형태소 분석기 초기화 실패: {str(e)}")
             raise RuntimeError(f"Okt 형태소 분석기 초기화 실패: {str(e)}. Java가 설치되어 있고 JAVA_HOME이 설정되어 있는지 확인하세요.")
+        self.workers = int(os.getenv('SAMSUNG_NLP_WORKERS', '1'))
+        # 중간 결과 캐시 (입력 파일이 바뀌지 않으면 빈도 계산과 렌더링이 같이 사용)
+        self._cache_key = None
+        self._tokens = None
+        self._freq = None
+
+    def _source_key(self):
+        """보고서/불용어 파일 수정 시각 (캐시 무효화용)"""
+        data_path = Path(__file__).parent.parent / "data"
+        key = []
+        for name in ("kr-Report_2018.txt", "stopwords.txt"):
+            path = data_path / name
+            key.append(path.stat().st_mtime_ns if path.exists() else None)
+        return tuple(key)
 
     def text_process(self):
         freq_txt = self.find_freq()
@@ -89,24 +152,24 @@ class SamsungWordcloud:
     
     def extract_noun(self):
         # 삼성전자의 스마트폰은 -> 삼성전자 스마트폰
-        noun_tokens = []
         tokens = self.change_token(self.extract_hangeul(self.read_file()))
-        for i in tokens:
-            pos = self.okt.pos(i)
-            # Okt 품사 태그: Noun
-            temp = [j[0] for j in pos if j[1] == 'Noun']
-            if len(''.join(temp)) > 1 :
-                noun_tokens.append(''.join(temp))   #단어 앞에 띄어쓰기 추가
+        # 어절을 묶어서 Okt 호출 (어절마다 JVM을 왕복하지 않도록)
+        chunks = [tokens[i:i + CHUNK_WORDS] for i in range(0, len(tokens), CHUNK_WORDS)]
+        if self.workers > 1 and len(tokens) >= PARALLEL_MIN_WORDS:
+            logger.info(f"{len(tokens)}개 어절을 {self.workers}개 프로세스에서 분석합니다.")
+            with ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=get_context('spawn'), initializer=_init_okt_worker
+            ) as executor:
+                nouns = [noun for chunk in executor.map(_extract_chunk, chunks) for noun in chunk]
+        else:
+            nouns = [noun for chunk in chunks for noun in nouns_per_word(self.okt, chunk)]
+        # Okt 품사 태그: Noun, 두 글자 이상만 사용
+        noun_tokens = [noun for noun in nouns if len(noun) > 1]
         texts = ' '.join(noun_tokens)
         logger.info(texts[:100])    # 100번째 단어까지 보여줘라
         return texts
 
     def read_stopword(self):
-        # 형태소 분석기 초기화 확인 (선택적)
-        try:
-            self.okt.pos("삼성전자 글로벌센터 전자사업부", stem=True)
-        except:
-            pass
         # 현재 파일 기준으로 data 폴더 경로 찾기
         current_file = Path(__file__)
         stopwords_path = current_file.parent.parent / "data" / "stopwords.txt"
@@ -117,28 +180,35 @@ class SamsungWordcloud:
             stopwords = f.read()
         return stopwords
 
+    def stopword_set(self):
+        # 불용어 파일을 단어 집합으로 (토큰마다 문자열 전체를 검색하지 않도록)
+        return set(self.read_stopword().split())
+
     def remove_stopword(self):
+        # 입력 파일이 그대로면 이전 분석 결과 재사용
+        key = self._source_key()
+        if self._tokens is not None and key == self._cache_key:
+            return self._tokens
         texts = self.extract_noun()
         tokens = self.change_token(texts)
-        # print('------- 1 명사 -------')
-        # print(texts[:30])
-        stopwords = self.read_stopword()
-        # print('------- 2 스톱 -------')
-        # print(stopwords[:30])
-        # print('------- 3 필터 -------')
-        texts = [text for text in tokens
-                 if text not in stopwords]
-        # print(texts[:30])
-        return texts
+        stopwords = self.stopword_set()
+        self._tokens = [text for text in tokens
+                        if text not in stopwords]
+        self._freq = None
+        self._cache_key = key
+        return self._tokens
     
     def find_freq(self):
         texts = self.remove_stopword()
-        freqtxt = pd.Series(dict(FreqDist(texts))).sort_values(ascending=False)
+        if self._freq is None:
+            self._freq = pd.Series(dict(FreqDist(texts))).sort_values(ascending=False)
+        freqtxt = self._freq
         logger.info(freqtxt[:30])
         return freqtxt
 
     def draw_wordcloud(self):
-        texts = self.remove_stopword()
+        # find_freq와 같은 빈도 결과 사용 (텍스트를 다시 분석하지 않음)
+        frequencies = {word: int(count) for word, count in self.find_freq().items()}
         
         # 현재 파일 기준으로 경로 찾기
         current_file = Path(__file__)
@@ -159,13 +229,13 @@ class SamsungWordcloud:
                                height=height,
                                relative_scaling=0.2,
                                background_color='white',
-                               max_words=500).generate(" ".join(texts))
+                               max_words=500).generate_from_frequencies(frequencies)
         else:
             wcloud = WordCloud(width=width, 
                                height=height,
                                relative_scaling=0.2,
                                background_color='white',
-                               max_words=500).generate(" ".join(texts))
+                               max_words=500).generate_from_frequencies(frequencies)
         
         plt.figure(figsize=(20, 20), dpi=150)
         plt.imshow(wcloud, interpolation='bilinear')
@@ -178,4 +248,16 @@ class SamsungWordcloud:
         plt.savefig(output_file, dpi=600, bbox_inches='tight', facecolor='white', edgecolor='none')
         plt.close()
         
-        return str(output_file)
\ No newline at end of file
+        return str(output_file)
+
+
+# 작업 프로세스 풀 워커에서 재사용하는 인스턴스 (Okt/JVM 초기화는 워커당 한 번)
+_worker_instance = None
+
+
+def draw_wordcloud_job() -> str:
+    """워드클라우드 생성 및 저장 (작업 프로세스 풀에서 실행)"""
+    global _worker_instance
+    if _worker_instance is None:
+        _worker_instance = SamsungWordcloud()
+    return _worker_instance.draw_wordcloud()
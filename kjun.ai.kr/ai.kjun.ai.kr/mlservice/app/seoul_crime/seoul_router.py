@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from .seoul_service import SeoulService
+from jobs.job_manager import job_manager
+from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +12,9 @@ seoul_router = APIRouter(prefix="/seoul", tags=["seoul"])
 # SeoulService 인스턴스
 service = SeoulService()
 
+# 결과 캐시 키에 포함할 입력 파일 (수정되면 다시 계산)
+INPUT_FILES = [Path(__file__).parent / "data" / name for name in ('cctv.xlsx', 'crime.csv', 'pop.csv')]
+
 
 @seoul_router.get("/")
 async def root():
@@ -21,7 +26,7 @@ async def root():
 async def preprocess():
     """전처리 수행 및 결과 조회"""
     try:
-        result = service.preprocess()
+        result = await job_manager.run("seoul/preprocess", service.preprocess, input_files=INPUT_FILES, lock_key="seoul", cache=True)
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -60,7 +65,7 @@ async def get_preprocess_data(data_type: str):
         GET /seoul_crime/preprocess/pop
     """
     try:
-        result = service.get_data_by_type(data_type)
+        result = await job_manager.call(service.get_data_by_type, data_type, lock_key="seoul")
         return JSONResponse(content={
             "success": True,
             "data_type": data_type,
@@ -0,0 +1,68 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GeocodeCache:
+    """지오코딩 결과를 검색어 기준으로 저장하는 SQLite 캐시 (TTL 적용)
+
+    경찰서 주소처럼 거의 바뀌지 않는 검색 결과를 매번 API로 다시 조회하지 않도록
+    프로세스 재시작 후에도 유지되는 파일 캐시에 저장합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: GEOCODE_CACHE_PATH 환경 변수 또는 save/geocode_cache.sqlite3)
+            ttl_seconds: 캐시 유효 시간 (기본값: GEOCODE_CACHE_TTL_DAYS 환경 변수, 30일)
+        """
+        default_path = Path(__file__).resolve().parent / "save" / "geocode_cache.sqlite3"
+        self.path = Path(path or os.getenv("GEOCODE_CACHE_PATH", str(default_path)))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("GEOCODE_CACHE_TTL_DAYS", "30")) * 86400
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "query TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, query: str) -> Optional[list]:
+        """유효 기간 안의 캐시 결과 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, created_at FROM geocode WHERE query = ?", (query,)
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, query: str, result: list) -> None:
+        """검색 결과 저장 (같은 검색어는 덮어씀)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode (query, result, created_at) VALUES (?, ?, ?)",
+                (query, json.dumps(result, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        return {"path": str(self.path), "size": size, "hits": self.hits, "misses": self.misses}
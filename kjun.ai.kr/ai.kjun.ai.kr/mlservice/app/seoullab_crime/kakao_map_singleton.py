@@ -1,5 +1,31 @@
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from seoullab_crime.geocode_cache import GeocodeCache
+
+
+class _RateLimiter:
+    """초당 요청 수 제한 (여러 스레드가 공유)"""
+
+    def __init__(self, rate_per_sec: float):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
 
 class KakaoMapSingleton:
     _instance = None  # 싱글턴 인스턴스를 저장할 클래스 변수
@@ -9,6 +35,14 @@ class KakaoMapSingleton:
             cls._instance = super(KakaoMapSingleton, cls).__new__(cls)
             cls._instance._api_key = cls._instance._retrieve_api_key()  # API 키 가져오기
             cls._instance._base_url = "https://dapi.kakao.com/v2/local"
+            cls._instance._max_workers = int(os.getenv('KAKAO_GEOCODE_WORKERS', '8'))
+            # 연결 재사용을 위한 세션 (동시 요청 수만큼 커넥션 풀 유지)
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cls._instance._max_workers)
+            session.mount('https://', adapter)
+            cls._instance._session = session
+            cls._instance._rate_limiter = _RateLimiter(float(os.getenv('KAKAO_RATE_LIMIT_PER_SEC', '10')))
+            cls._instance._cache = GeocodeCache()
         return cls._instance  # 기존 인스턴스 반환
 
     def _retrieve_api_key(self):
@@ -23,10 +57,14 @@ class KakaoMapSingleton:
         return self._api_key
 
     def geocode(self, address, language='ko'):
-        """주소를 위도, 경도로 변환하는 메서드 (카카오 맵 API)"""
+        """주소를 위도, 경도로 변환하는 메서드 (카카오 맵 API, 결과는 캐시에 저장)"""
         import logging
         logger = logging.getLogger(__name__)
         
+        cached = self._cache.get(address)
+        if cached is not None:
+            return cached
+        
         # 키워드 검색 API 사용 (장소명 검색용)
         url = f"{self._base_url}/search/keyword.json"
         headers = {
@@ -37,7 +75,8 @@ class KakaoMapSingleton:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            self._rate_limiter.wait()
+            response = self._session.get(url, headers=headers, params=params, timeout=10)
             
             # 에러 응답 처리
             if response.status_code == 403:
@@ -56,7 +95,7 @@ class KakaoMapSingleton:
                 doc = result['documents'][0]
                 # 키워드 검색 결과는 place_name, address_name, road_address_name 등을 포함
                 address_name = doc.get('address_name', '') or doc.get('road_address_name', '')
-                return [{
+                result = [{
                     "formatted_address": address_name,
                     "geometry": {
                         "location": {
@@ -65,8 +104,34 @@ class KakaoMapSingleton:
                         }
                     }
                 }]
+                # 검색 결과가 없는 경우는 일시적일 수 있으므로 캐시하지 않음
+                self._cache.set(address, result)
+                return result
             return []
         except requests.exceptions.RequestException as e:
             logger.error(f"카카오 맵 API 요청 실패: {e}")
             raise
 
+    def geocode_many(self, addresses: List[str], language='ko', max_workers: Optional[int] = None) -> List[list]:
+        """
+        여러 주소를 동시에 변환 (캐시 확인 후 나머지만 API 요청, 초당 요청 수 제한 적용)
+        
+        Args:
+            addresses: 검색할 주소/장소명 목록
+            language: 언어 (geocode와 동일)
+            max_workers: 동시 요청 수 (기본값: KAKAO_GEOCODE_WORKERS 환경 변수)
+        
+        Returns:
+            입력 순서와 같은 geocode 결과 목록
+        """
+        # 중복된 검색어는 한 번만 요청
+        unique = list(dict.fromkeys(addresses))
+        workers = max(1, min(max_workers or self._max_workers, len(unique) or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kakao-geocode') as executor:
+            results = dict(zip(unique, executor.map(lambda address: self.geocode(address, language=language), unique)))
+        return [results[address] for address in addresses]
+
+    def cache_stats(self):
+        """지오코딩 캐시 통계"""
+        return self._cache.stats()
+
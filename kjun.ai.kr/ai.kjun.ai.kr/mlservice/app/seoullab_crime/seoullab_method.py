@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 import pandas as pd
 import numpy as np
@@ -20,6 +22,54 @@ class SeoullabMethod(object):
         # data 폴더의 절대 경로
         self.data_path = Path(__file__).resolve().parent / "data"
 
+    def file_hash(self, *fnames: str) -> str:
+        #data 폴더 파일들의 내용 해시 (파일이 바뀌면 캐시 무효화용)
+        digest = hashlib.sha256()
+        for fname in fnames:
+            filepath = self.data_path / fname
+            if not filepath.exists():
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+            digest.update(fname.encode('utf-8'))
+            digest.update(filepath.read_bytes())
+        return digest.hexdigest()
+
+    def district_centroids(self, fname: str = 'kr-state.json') -> dict:
+        """
+        GeoJSON의 자치구별 중심 좌표 인덱스 (경계 좌표의 평균)
+        
+        GeoJSON 내용 해시 기준으로 save/cache에 저장해 두고 다시 계산하지 않습니다.
+        
+        Returns:
+            dict: 자치구명(feature id) → [위도, 경도] (folium 형식)
+        """
+        key = self.file_hash(fname)
+        cached = getattr(self, '_centroids', None)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        cache_file = Path(self.dataset.sname) / "cache" / f"centroids_{key[:16]}.json"
+        if cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                centroids = json.load(f)
+        else:
+            with open(self.data_path / fname, 'r', encoding='utf-8') as f:
+                geo = json.load(f)
+            centroids = {}
+            for feature in geo['features']:
+                coords = feature['geometry']['coordinates'][0]
+                if not coords:
+                    continue
+                # 외곽선 좌표 (경도, 위도) 평균 → [위도, 경도]
+                lng, lat = np.asarray(coords, dtype=float).reshape(-1, 2).mean(axis=0)
+                centroids[feature['id']] = [float(lat), float(lng)]
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(centroids, f, ensure_ascii=False)
+            logger.info(f"자치구 중심 좌표 인덱스 생성: {len(centroids)}개 → {cache_file}")
+        
+        self._centroids = (key, centroids)
+        return centroids
+
     def read_csv(self, fname: str) -> pd.DataFrame:
         #csv 파일을 읽어와서 데이터프레임으로 반환
         filepath = self.data_path / fname
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from .seoullab_service import SeoullabService
+from jobs.job_manager import job_manager
+from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +12,9 @@ seoullab_router = APIRouter(prefix="/seoullab", tags=["seoullab"])
 # SeoullabService 인스턴스
 service = SeoullabService()
 
+# 작업 키에 포함할 입력 파일 (전처리 결과는 서비스가 직접 캐시)
+INPUT_FILES = [Path(__file__).parent / "data" / name for name in SeoullabService.SOURCE_FILES + ('kr-state.json',)]
+
 
 @seoullab_router.get("/")
 async def root():
@@ -26,7 +31,7 @@ async def save():
         dict: 저장 결과
     """
     try:
-        result = service.save_csv()
+        result = await job_manager.call(service.save_csv, lock_key="seoullab")
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -48,7 +53,7 @@ async def submit():
         dict: 저장 결과
     """
     try:
-        result = service.submit()
+        result = await job_manager.run("seoullab/submit", service.submit, input_files=INPUT_FILES, lock_key="seoullab")
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -71,7 +76,7 @@ async def submit():
 async def preprocess():
     """전처리 수행 및 결과 조회"""
     try:
-        result = service.preprocess()
+        result = await job_manager.run("seoullab/preprocess", service.preprocess, input_files=INPUT_FILES, lock_key="seoullab")
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -113,7 +118,7 @@ async def get_preprocess_data(data_type: str):
         GET /seoullab/preprocess/cctv_crime_pop
     """
     try:
-        result = service.get_data_by_type(data_type)
+        result = await job_manager.call(service.get_data_by_type, data_type, lock_key="seoullab")
         return JSONResponse(content={
             "success": True,
             "data_type": data_type,
@@ -139,7 +144,7 @@ async def create_map():
     """
     try:
         logger.info("서울시 범죄 지도 생성 시작...")
-        result = service.create_crime_map()
+        result = await job_manager.run("seoullab/map", service.create_crime_map, input_files=INPUT_FILES, lock_key="seoullab")
         return JSONResponse(content={
             "success": True,
             "message": "지도가 성공적으로 생성되었습니다.",
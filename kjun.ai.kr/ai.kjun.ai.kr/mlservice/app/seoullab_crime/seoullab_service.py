@@ -1,4 +1,6 @@
 import sys
+import hashlib
+import pickle
 import pandas as pd
 import numpy as np
 import logging
@@ -12,10 +14,76 @@ logger = logging.getLogger(__name__)
 
 class SeoullabService:
 
+    # 전처리 결과 캐시의 기준이 되는 원본 파일
+    SOURCE_FILES = ('cctv.csv', 'crime.csv', 'pop.xls')
+
     def __init__(self):
         self.method = SeoullabMethod()
+        # 원본 파일 내용 해시 → 전처리 결과 (메모리 캐시)
+        self._preprocess_key = None
+        self._preprocess_result = None
+        # 마지막 전처리에서 지오코딩에 실패한 경찰서 수
+        self._geocode_failures = 0
+        self._cache_path = Path(__file__).parent / "save" / "cache"
 
     def preprocess(self):
+        """
+        전처리 수행 (원본 파일 내용이 같으면 캐시된 결과 반환)
+        
+        메모리 캐시 → 디스크 캐시(save/cache/preprocess_<hash>.pkl) 순서로 확인하고,
+        둘 다 없을 때만 파일 읽기와 지오코딩을 포함한 전체 전처리를 실행합니다.
+        지오코딩에 실패한 경찰서가 있으면 (일시적일 수 있으므로) 결과를 캐시하지 않고
+        다음 호출에서 다시 전처리합니다.
+        
+        Returns:
+            dict: 전처리 결과 (각 데이터프레임 요약)
+        """
+        key = self.method.file_hash(*self.SOURCE_FILES)
+        if key == self._preprocess_key and self._preprocess_result is not None:
+            logger.info("🦝🦝전처리 캐시 사용 (메모리)")
+            return self._preprocess_result
+        
+        cache_file = self._cache_path / f"preprocess_{key[:16]}.pkl"
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached = pickle.load(f)
+                for name, df in cached['frames'].items():
+                    setattr(self.method.dataset, name, df)
+                self._preprocess_key, self._preprocess_result = key, cached['result']
+                logger.info(f"🦝🦝전처리 캐시 사용 (디스크): {cache_file}")
+                return self._preprocess_result
+            except Exception as e:
+                logger.warning(f"전처리 캐시를 읽을 수 없어 다시 전처리합니다: {e}")
+        
+        result = self._preprocess()
+        
+        if self._geocode_failures:
+            logger.warning(
+                f"지오코딩 실패 {self._geocode_failures}건: 전처리 결과를 캐시하지 않습니다 (다음 호출에서 다시 시도)"
+            )
+            return result
+        
+        frames = {
+            name: getattr(self.method.dataset, name)
+            for name in ('cctv', 'crime', 'pop', 'crime_with_gu', 'crime_pop', 'cctv_crime_pop')
+        }
+        try:
+            self._cache_path.mkdir(parents=True, exist_ok=True)
+            # 이전 원본 파일의 캐시는 삭제
+            for old in self._cache_path.glob("preprocess_*.pkl"):
+                old.unlink()
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'frames': frames, 'result': result}, f)
+            tmp_file.replace(cache_file)
+        except Exception as e:
+            logger.warning(f"전처리 캐시 저장 실패: {e}")
+        
+        self._preprocess_key, self._preprocess_result = key, result
+        return result
+
+    def _preprocess(self):
         logger.info("🦝🦝전처리 시작")
         
         try:
@@ -49,8 +117,9 @@ class SeoullabService:
             
             kmaps = KakaoMapSingleton()  # 카카오맵 객체 생성
             
-            for name in station_names:
-                tmp = kmaps.geocode(name, language='ko')
+            # 경찰서 검색을 동시에 요청 (캐시에 있는 경찰서는 API 호출 없음)
+            geocoded = kmaps.geocode_many(station_names, language='ko')
+            for name, tmp in zip(station_names, geocoded):
                 if tmp and len(tmp) > 0:
                     formatted_addr = tmp[0].get('formatted_address')
                     tmp_loc = tmp[0].get("geometry")
@@ -65,6 +134,8 @@ class SeoullabService:
                     station_addrs.append("")
                     station_lats.append(0.0)
                     station_lngs.append(0.0)
+            self._geocode_failures = station_addrs.count("")
+            logger.info(f"지오코딩 캐시: {kmaps.cache_stats()}")
             
             logger.info(f"🔥💧자치구 리스트: {station_addrs}")
             
@@ -916,17 +987,6 @@ class SeoullabService:
         save_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"저장 경로: {save_path}")
         
-        # GeoJSON 파일 경로
-        geo_json_path = current_file.parent / "data" / "kr-state.json"
-        if not geo_json_path.exists():
-            raise FileNotFoundError(f"GeoJSON 파일을 찾을 수 없습니다: {geo_json_path}")
-        
-        # GeoJSON 로드
-        with open(geo_json_path, 'r', encoding='utf-8') as f:
-            seoul_geo = json.load(f)
-        
-        logger.info("GeoJSON 파일 로드 완료")
-        
         # 필수 컬럼 확인
         required_cols = ['자치구', '범죄발생', '범죄검거', 'CCTV']
         for col in required_cols:
@@ -971,6 +1031,32 @@ class SeoullabService:
             '검거율': 검거율.values
         })
         
+        # 지도 입력 데이터와 GeoJSON이 같으면 저장된 지도를 그대로 사용
+        map_file_path = save_path / 'crime_map.html'
+        key_file_path = save_path / 'cache' / 'crime_map.key'
+        data_hash = hashlib.sha256(pd.util.hash_pandas_object(map_data, index=False).values.tobytes())
+        data_hash.update(self.method.file_hash('kr-state.json').encode('utf-8'))
+        map_key = data_hash.hexdigest()
+        if map_file_path.exists() and key_file_path.exists() and key_file_path.read_text() == map_key:
+            logger.info(f"🦝🦝지도 캐시 사용: {map_file_path}")
+            return {
+                "message": "지도 생성 완료",
+                "file_path": str(map_file_path),
+                "file_exists": True,
+                "cached": True
+            }
+        
+        # GeoJSON 파일 경로
+        geo_json_path = current_file.parent / "data" / "kr-state.json"
+        if not geo_json_path.exists():
+            raise FileNotFoundError(f"GeoJSON 파일을 찾을 수 없습니다: {geo_json_path}")
+        
+        # GeoJSON 로드
+        with open(geo_json_path, 'r', encoding='utf-8') as f:
+            seoul_geo = json.load(f)
+        
+        logger.info("GeoJSON 파일 로드 완료")
+        
         # 지도 생성 (서울 중심 좌표)
         seoul_center = [37.5665, 126.9780]  # 서울시청 좌표
         m = folium.Map(location=seoul_center, zoom_start=11, tiles='OpenStreetMap')
@@ -989,78 +1075,61 @@ class SeoullabService:
         ).add_to(m)
         
         # 각 자치구에 원형 마커 추가 (CCTV 수 = 크기, 검거율 = 색상)
-        for idx, row in map_data.iterrows():
-            자치구명 = row['자치구']
-            cctv_count = row['CCTV']
-            검거율 = row['검거율']
-            
-            # 자치구의 중심 좌표 찾기 (GeoJSON에서)
-            중심_좌표 = None
-            for feature in seoul_geo['features']:
-                if feature['id'] == 자치구명:
-                    # Polygon의 중심점 계산 (경계 좌표의 평균)
-                    coords = feature['geometry']['coordinates'][0]
-                    if coords:
-                        lats = [coord[1] for coord in coords]
-                        lngs = [coord[0] for coord in coords]
-                        # 위도, 경도 순서로 반환 (folium은 [lat, lng] 형식)
-                        중심_좌표 = [sum(lats) / len(lats), sum(lngs) / len(lngs)]
-                    break
+        # 중심 좌표는 미리 계산된 인덱스에서 조회
+        centroids = self.method.district_centroids('kr-state.json')
+        중심_좌표 = map_data['자치구'].map(centroids)
+        
+        # CCTV 수에 따른 원 크기 (최소 8, 최대 50)
+        cctv_values = map_data['CCTV'].to_numpy(dtype=float)
+        cctv_max = cctv_values.max() if len(cctv_values) else 0
+        cctv_min = cctv_values.min() if len(cctv_values) else 0
+        if cctv_max > cctv_min:
+            radii = 8 + (cctv_values - cctv_min) / (cctv_max - cctv_min) * 42
+        else:
+            radii = np.full(len(cctv_values), 25.0)
+        
+        # 검거율에 따른 색상 그라데이션 (0~100%를 색상으로 매핑)
+        # 검거율이 높을수록 초록색, 낮을수록 빨간색
+        # 0~50%: 빨간색 → 주황색, 50~100%: 주황색 → 초록색
+        검거율_values = map_data['검거율'].to_numpy(dtype=float)
+        검거율_normalized = np.clip(검거율_values, 0, 100) / 100.0
+        low = 검거율_normalized <= 0.5
+        reds = np.where(low, 255, (255 * (1 - (검거율_normalized - 0.5) / 0.5)).astype(int))
+        greens = np.where(low, (165 * (검거율_normalized / 0.5)).astype(int), 255)
+        colors = [f'#{r:02x}{g:02x}00' for r, g in zip(reds, greens)]
+        
+        for 자치구명, location, radius, color, cctv_count, 검거율, 범죄발생_값 in zip(
+            map_data['자치구'], 중심_좌표, radii, colors, cctv_values, 검거율_values, map_data['범죄발생_정규화']
+        ):
+            if not isinstance(location, list):
+                continue
             
-            if 중심_좌표:
-                # CCTV 수에 따른 원 크기 (최소 8, 최대 50)
-                cctv_max = map_data['CCTV'].max()
-                cctv_min = map_data['CCTV'].min()
-                if cctv_max > cctv_min:
-                    radius = 8 + (cctv_count - cctv_min) / (cctv_max - cctv_min) * 42
-                else:
-                    radius = 25
-                
-                # 검거율에 따른 색상 그라데이션 (0~100%를 색상으로 매핑)
-                # 검거율이 높을수록 초록색, 낮을수록 빨간색
-                # RGB 값을 선형 보간으로 계산
-                검거율_normalized = max(0, min(100, 검거율)) / 100.0
-                
-                if 검거율_normalized <= 0.5:
-                    # 빨간색에서 주황색으로 (0~50%)
-                    ratio = 검거율_normalized / 0.5
-                    r = 255
-                    g = int(165 * ratio)  # 0~165
-                    b = 0
-                else:
-                    # 주황색에서 초록색으로 (50~100%)
-                    ratio = (검거율_normalized - 0.5) / 0.5
-                    r = int(255 * (1 - ratio))  # 255~0
-                    g = 255
-                    b = 0
-                
-                color = f'#{r:02x}{g:02x}{b:02x}'
-                
-                # 원형 마커 추가
-                folium.CircleMarker(
-                    location=중심_좌표,
-                    radius=radius,
-                    popup=folium.Popup(
-                        f"<b>{자치구명}</b><br>"
-                        f"CCTV 수: {int(cctv_count)}<br>"
-                        f"검거율: {검거율:.2f}%<br>"
-                        f"범죄발생(정규화): {row['범죄발생_정규화']:.3f}",
-                        max_width=200
-                    ),
-                    tooltip=f"{자치구명} (CCTV: {int(cctv_count)}, 검거율: {검거율:.2f}%)",
-                    color='black',
-                    weight=2,
-                    fill=True,
-                    fillColor=color,
-                    fillOpacity=0.8
-                ).add_to(m)
+            # 원형 마커 추가
+            folium.CircleMarker(
+                location=location,
+                radius=float(radius),
+                popup=folium.Popup(
+                    f"<b>{자치구명}</b><br>"
+                    f"CCTV 수: {int(cctv_count)}<br>"
+                    f"검거율: {검거율:.2f}%<br>"
+                    f"범죄발생(정규화): {범죄발생_값:.3f}",
+                    max_width=200
+                ),
+                tooltip=f"{자치구명} (CCTV: {int(cctv_count)}, 검거율: {검거율:.2f}%)",
+                color='black',
+                weight=2,
+                fill=True,
+                fillColor=color,
+                fillOpacity=0.8
+            ).add_to(m)
         
         # 레이어 컨트롤 추가
         folium.LayerControl().add_to(m)
         
-        # 지도 저장
-        map_file_path = save_path / 'crime_map.html'
+        # 지도 저장 (입력 데이터 해시도 함께 저장)
         m.save(str(map_file_path))
+        key_file_path.parent.mkdir(parents=True, exist_ok=True)
+        key_file_path.write_text(map_key)
         
         logger.info(f"지도 저장 완료: {map_file_path}")
         logger.info("🦝🦝지도 생성 완료")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse
-from .titanic_service import TitanicService
+from .titanic_service import TitanicService, run_cv_pipeline, run_evaluate_pipeline, run_submit_pipeline
+from jobs.job_manager import job_manager
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,6 +11,9 @@ titanic_router = APIRouter(prefix="/titanic", tags=["titanic"])
 # TitanicService 인스턴스
 service = TitanicService()
 
+# 결과 캐시 키에 포함할 입력 파일 (수정되면 다시 계산)
+INPUT_FILES = (service.train_csv_path, service.test_csv_path)
+
 
 @titanic_router.get("/")
 async def root():
@@ -21,7 +25,7 @@ async def root():
 async def preprocess():
     """전처리 수행 및 결과 조회"""
     try:
-        result = service.preprocess()
+        result = await job_manager.run("titanic/preprocess", service.preprocess, input_files=INPUT_FILES, lock_key="titanic", cache=True)
         return JSONResponse(content={
             "success": True,
             "data": result
@@ -33,17 +37,20 @@ async def preprocess():
         raise HTTPException(status_code=500, detail=str(e))
 
 @titanic_router.get("/evaluate")
-async def evaluate_model():
+async def evaluate_model(background: bool = Query(default=False, description="true면 작업 ID를 바로 반환 (GET /jobs/{job_id}로 결과 조회)")):
     """
     모델 평가 실행 
     실행 후 모델 평가 결과 반환
     """
     try:
-        # 전처리, 모델링, 학습, 평가 순서로 실행
-        service.preprocess()
-        service.modeling()
-        service.learning()
-        result = service.evaluate()
+        # 전처리, 모델링, 학습, 평가 순서로 실행 (프로세스 풀, 입력이 같으면 캐시 사용)
+        if background:
+            job = job_manager.submit("titanic/evaluate", run_evaluate_pipeline, input_files=INPUT_FILES, heavy=True, cache=True)
+            return JSONResponse(status_code=202, content={
+                "success": True,
+                "job": job.to_dict(include_result=False)
+            })
+        result = await job_manager.run("titanic/evaluate", run_evaluate_pipeline, input_files=INPUT_FILES, heavy=True, cache=True)
         
         return JSONResponse(content={
             "success": True,
@@ -55,9 +62,43 @@ async def evaluate_model():
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+@titanic_router.get("/cv")
+async def cross_validate_model(
+    folds: int = Query(default=5, ge=2, le=20, description="fold 수"),
+    background: bool = Query(default=False, description="true면 작업 ID를 바로 반환 (GET /jobs/{job_id}로 결과 조회)")
+):
+    """
+    모델별 k-fold 교차 검증 (모델 × fold를 여러 코어에서 병렬 실행)
+    
+    Example:
+        GET /api/ml/titanic/cv?folds=5
+    """
+    try:
+        params = {"folds": folds}
+        if background:
+            job = job_manager.submit("titanic/cv", run_cv_pipeline, folds, params=params, input_files=INPUT_FILES, heavy=True, cache=True)
+            return JSONResponse(status_code=202, content={
+                "success": True,
+                "job": job.to_dict(include_result=False)
+            })
+        result = await job_manager.run("titanic/cv", run_cv_pipeline, folds, params=params, input_files=INPUT_FILES, heavy=True, cache=True)
+        
+        return JSONResponse(content={
+            "success": True,
+            "data": result
+        })
+    except Exception as e:
+        import traceback
+        logger.error(f"교차 검증 오류 발생: {e}")
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=str(e))
+
 @titanic_router.get("/submit")
 @titanic_router.post("/submit")
-async def submit_model(model_name: str = Query(default=None, description="사용할 모델 이름 (None이면 정확도가 가장 높은 모델 자동 선택)")):
+async def submit_model(
+    model_name: str = Query(default=None, description="사용할 모델 이름 (None이면 정확도가 가장 높은 모델 자동 선택)"),
+    background: bool = Query(default=False, description="true면 작업 ID를 바로 반환 (GET /jobs/{job_id}로 결과 조회)")
+):
     """
     Kaggle 제출 파일 생성
     모델명을 선택하여 제출 파일을 생성합니다.
@@ -72,15 +113,19 @@ async def submit_model(model_name: str = Query(default=None, description="사용
         GET /api/ml/titanic/submit?model_name=lightgbm (특정 모델 선택)
         POST /api/ml/titanic/submit (자동 선택)
         POST /api/ml/titanic/submit?model_name=lightgbm (특정 모델 선택)
+        POST /api/ml/titanic/submit?background=true (백그라운드 작업)
     """
     try:
-        # 전처리, 모델링, 학습 순서로 실행
-        service.preprocess()
-        service.modeling()
-        service.learning()
-        
-        # 제출 파일 생성 (model_name이 None이면 자동으로 정확도가 가장 높은 모델 선택)
-        result = service.submit(model_name=model_name)
+        # 전처리, 모델링, 학습 후 제출 파일 생성 (프로세스 풀)
+        # model_name이 None이면 자동으로 정확도가 가장 높은 모델 선택
+        params = {"model_name": model_name}
+        if background:
+            job = job_manager.submit("titanic/submit", run_submit_pipeline, model_name, params=params, input_files=INPUT_FILES, heavy=True)
+            return JSONResponse(status_code=202, content={
+                "success": True,
+                "job": job.to_dict(include_result=False)
+            })
+        result = await job_manager.run("titanic/submit", run_submit_pipeline, model_name, params=params, input_files=INPUT_FILES, heavy=True)
         
         return JSONResponse(content={
             "success": True,
@@ -7,8 +7,14 @@ from sklearn.naive_bayes import GaussianNB
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
 from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+import joblib
+import copy
+import hashlib
 import logging
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from titanic.titanic_method import TitanicMethod
@@ -32,6 +38,40 @@ except (ImportError, OSError) as e:
     lgb = type('lgb', (), {'LGBMClassifier': DummyLGBM})()
 
 
+class DummyLightGBMModel:
+    """LightGBM이 없어도 결과에 포함되도록 하는 더미 모델 (병렬 학습/저장을 위해 모듈 최상위에 정의)"""
+
+    def fit(self, X, y):
+        logger.warning("LightGBM 더미 모델: fit 호출됨")
+        return self
+
+    def predict(self, X):
+        logger.warning("LightGBM 더미 모델: predict 호출됨")
+        return np.zeros(len(X), dtype=int)
+
+    def __repr__(self):
+        return "DummyLightGBMModel()"
+
+
+def _fit_model(model_name: str, model, X, y):
+    """모델 하나 학습 (joblib 워커에서 실행)"""
+    start = time.perf_counter()
+    model.fit(X, y)
+    return model_name, model, time.perf_counter() - start
+
+
+def _fit_and_score(model_name: str, model, X_train, y_train, X_val, y_val):
+    """모델 하나 학습 후 검증 정확도 계산 (joblib 워커에서 실행, 실패 시 정확도 None)"""
+    start = time.perf_counter()
+    try:
+        model.fit(X_train, y_train)
+        accuracy = float(accuracy_score(y_val, model.predict(X_val)))
+    except Exception as e:
+        logger.error(f"{model_name} 평가 중 오류 발생: {e}")
+        accuracy = None
+    return model_name, accuracy, time.perf_counter() - start
+
+
 class TitanicService:
     """Titanic Passenger CRUD 서비스"""
     
@@ -46,6 +86,13 @@ class TitanicService:
         self.processed_data = None
         self.models = {}
         self.y_train = None
+        # 모델별 학습 시간, 평가 결과 (learning/evaluate/submit 사이에 재사용)
+        self.fit_times = {}
+        self.evaluation = None
+        # 병렬 학습 설정 및 학습된 모델 저장 경로
+        self.parallel = os.getenv('TITANIC_PARALLEL', 'true').lower() == 'true'
+        self.n_jobs = int(os.getenv('TITANIC_N_JOBS', '-1'))
+        self.model_path = Path(os.getenv('TITANIC_MODEL_PATH', str(titanic_dir / "save" / "models.joblib")))
     
     def _get_csv_path(self, filename: str) -> Path:
         """
@@ -184,55 +231,121 @@ class TitanicService:
         else:
             # LightGBM이 없어도 결과에 포함되도록 더미 모델 추가
             logger.warning("LightGBM이 없습니다. 더미 모델을 사용합니다.")
-            class DummyLightGBMModel:
-                def fit(self, X, y):
-                    logger.warning("LightGBM 더미 모델: fit 호출됨")
-                    return self
-                def predict(self, X):
-                    logger.warning("LightGBM 더미 모델: predict 호출됨")
-                    return [0] * len(X)
             self.models['lightgbm'] = DummyLightGBMModel()
         
+        # 새 모델은 아직 학습/평가되지 않음
+        self.fit_times = {}
+        self.evaluation = None
+        
         logger.info(f"🦝🦝모델링 완료 - 총 {len(self.models)}개 모델: {list(self.models.keys())}")
 
-    def learning(self):
+    def _features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """학습/예측용 특성 행렬 (PassengerId 제거, 모든 컬럼 숫자형 변환)"""
+        X = df.copy()
+        
+        # PassengerId가 있으면 제거 (ID는 학습에 사용하지 않음)
+        if 'PassengerId' in X.columns:
+            X = X.drop(columns=['PassengerId'])
+        
+        # 모든 컬럼을 숫자형으로 변환 (object 타입 제거)
+        for col in X.columns:
+            if X[col].dtype == 'object':
+                logger.warning(f"{col} 컬럼이 object 타입입니다. 숫자형으로 변환합니다.")
+                X[col] = pd.to_numeric(X[col], errors='coerce').fillna(0).astype(int)
+        return X
+
+    def _run_tasks(self, func, tasks: List[tuple]) -> List[tuple]:
+        """작업 목록을 여러 코어에서 병렬 실행 (TITANIC_PARALLEL=false면 순차 실행)"""
+        if self.parallel and len(tasks) > 1:
+            return joblib.Parallel(n_jobs=self.n_jobs)(joblib.delayed(func)(*task) for task in tasks)
+        return [func(*task) for task in tasks]
+
+    def _model_key(self) -> str:
+        """저장된 모델 재사용 여부 판단용 키 (입력 CSV 내용 + 모델 설정)"""
+        digest = hashlib.sha256()
+        for path in (self.train_csv_path, self.test_csv_path):
+            digest.update(path.read_bytes())
+        for model_name, model in sorted(self.models.items()):
+            digest.update(f"{model_name}={model!r}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_models(self) -> bool:
+        """저장된 모델이 현재 데이터/설정과 같으면 불러오기"""
+        if not self.model_path.exists():
+            return False
+        try:
+            saved = joblib.load(self.model_path)
+        except Exception as e:
+            logger.warning(f"저장된 모델을 불러올 수 없습니다: {e}")
+            return False
+        if saved.get('key') != self._model_key():
+            logger.info("데이터 또는 모델 설정이 바뀌어 저장된 모델을 사용하지 않습니다.")
+            return False
+        self.models = saved['models']
+        self.fit_times = saved.get('fit_times', {})
+        self.evaluation = saved.get('evaluation')
+        logger.info(f"저장된 모델 불러오기 완료: {self.model_path}")
+        return True
+
+    def _save_models(self) -> None:
+        """학습된 모델과 평가 결과 저장 (submit에서 다시 학습하지 않도록)"""
+        self.model_path.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일 이름을 작업마다 다르게 (여러 워커 프로세스가 동시에 저장할 수 있음)
+        with tempfile.NamedTemporaryFile(dir=self.model_path.parent, suffix='.tmp', delete=False) as f:
+            tmp_path = Path(f.name)
+        try:
+            joblib.dump({
+                'key': self._model_key(),
+                'models': self.models,
+                'fit_times': self.fit_times,
+                'evaluation': self.evaluation,
+            }, tmp_path)
+            tmp_path.replace(self.model_path)
+        except Exception as e:
+            # 저장 실패는 다음 요청에서 다시 학습하면 되므로 요청을 실패시키지 않음
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"학습된 모델을 저장하지 못했습니다: {e}")
+            return
+        logger.info(f"학습된 모델 저장 완료: {self.model_path}")
+
+    def learning(self) -> Dict[str, Any]:
         logger.info("🦝🦝학습 시작")
 
         if self.processed_data is None or not self.models:
             logger.warning("전처리된 데이터나 모델이 없습니다. 먼저 preprocess()와 modeling()을 실행하세요.")
-            return
+            return {"error": "전처리된 데이터나 모델이 없습니다."}
         
         if self.y_train is None:
             logger.warning("학습용 label이 없습니다. 먼저 preprocess()를 실행하세요.")
-            return
-        
-        X_train = self.processed_data.train.copy()
-        y_train = self.y_train
-        
-        # PassengerId가 있으면 제거 (ID는 학습에 사용하지 않음)
-        if 'PassengerId' in X_train.columns:
-            X_train = X_train.drop(columns=['PassengerId'])
-            logger.info("PassengerId 컬럼을 제거했습니다.")
+            return {"error": "학습용 label이 없습니다."}
         
-        # 모든 컬럼을 숫자형으로 변환 (object 타입 제거)
-        for col in X_train.columns:
-            if X_train[col].dtype == 'object':
-                logger.warning(f"{col} 컬럼이 object 타입입니다. 숫자형으로 변환합니다.")
-                X_train[col] = pd.to_numeric(X_train[col], errors='coerce').fillna(0).astype(int)
+        # 같은 데이터/설정으로 학습된 모델이 저장되어 있으면 재사용
+        if self._load_models():
+            logger.info("🦝🦝학습 완료 (저장된 모델 사용)")
+            return {"message": "학습 완료", "loaded": True, "fit_seconds": self.fit_times}
         
+        X_train = self._features(self.processed_data.train)
+        y_train = self.y_train
         logger.info(f"학습 데이터 타입: {X_train.dtypes}")
         
-        # 각 모델 학습
-        for model_name, model in self.models.items():
-            logger.info(f"{model_name} 학습 중...")
-            try:
-                model.fit(X_train, y_train)
-                logger.info(f"{model_name} 학습 완료")
-            except Exception as e:
-                logger.error(f"{model_name} 학습 중 오류 발생: {e}")
-                raise
-        
+        # 각 모델을 여러 코어에서 동시에 학습
+        logger.info(f"학습할 모델 목록: {list(self.models.keys())} (병렬: {self.parallel})")
+        tasks = [(model_name, copy.deepcopy(model), X_train, y_train) for model_name, model in self.models.items()]
+        try:
+            fitted = self._run_tasks(_fit_model, tasks)
+        except Exception as e:
+            logger.error(f"모델 학습 중 오류 발생: {e}")
+            raise
+        
+        self.models = {model_name: model for model_name, model, _ in fitted}
+        self.fit_times = {model_name: round(seconds, 3) for model_name, _, seconds in fitted}
+        self.evaluation = None
+        for model_name, seconds in self.fit_times.items():
+            logger.info(f"{model_name} 학습 완료 ({seconds:.3f}s)")
+        
+        self._save_models()
         logger.info("🦝🦝학습 완료")
+        return {"message": "학습 완료", "loaded": False, "fit_seconds": self.fit_times}
 
     def evaluate(self) -> Dict[str, Any]:
         logger.info("🦝🦝평가 시작")
@@ -245,20 +358,13 @@ class TitanicService:
             logger.warning("학습용 label이 없습니다.")
             return {"error": "학습용 label이 없습니다."}
         
-        X_train = self.processed_data.train.copy()
-        y_train = self.y_train
-        
-        # PassengerId가 있으면 제거 (ID는 학습에 사용하지 않음)
-        if 'PassengerId' in X_train.columns:
-            X_train = X_train.drop(columns=['PassengerId'])
-            logger.info("PassengerId 컬럼을 제거했습니다.")
-        
-        # 모든 컬럼을 숫자형으로 변환 (object 타입 제거)
-        for col in X_train.columns:
-            if X_train[col].dtype == 'object':
-                logger.warning(f"{col} 컬럼이 object 타입입니다. 숫자형으로 변환합니다.")
-                X_train[col] = pd.to_numeric(X_train[col], errors='coerce').fillna(0).astype(int)
+        # 이미 평가한 결과가 있으면 재사용 (submit에서 반복 호출해도 다시 학습하지 않음)
+        if self.evaluation is not None:
+            logger.info("🦝🦝평가 완료 (이전 평가 결과 사용)")
+            return self.evaluation
         
+        X_train = self._features(self.processed_data.train)
+        y_train = self.y_train
         logger.info(f"평가 데이터 타입: {X_train.dtypes}")
         
         # Train 데이터를 train/validation으로 분할
@@ -266,29 +372,83 @@ class TitanicService:
             X_train, y_train, test_size=0.2, random_state=42, stratify=y_train
         )
         
-        # 각 모델 재학습 및 평가
+        # 학습된 모델은 그대로 두고, 복사본을 분할 데이터로 병렬 학습 및 평가
         logger.info(f"평가할 모델 목록: {list(self.models.keys())}")
+        tasks = [
+            (model_name, copy.deepcopy(model), X_train_split, y_train_split, X_val_split, y_val_split)
+            for model_name, model in self.models.items()
+        ]
         results = {}
-        for model_name, model in self.models.items():
-            logger.info(f"{model_name} 재학습 및 평가 중...")
-            try:
-                # Validation set으로 재학습
-                model.fit(X_train_split, y_train_split)
-                # Validation set으로 예측
-                y_pred = model.predict(X_val_split)
-                accuracy = accuracy_score(y_val_split, y_pred)
-                results[model_name] = float(accuracy)
-                logger.info(f'{model_name} 활용한 검증 정확도 {accuracy:.4f}')
-            except Exception as e:
-                logger.error(f"{model_name} 평가 중 오류 발생: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
-                results[model_name] = None
+        eval_seconds = {}
+        for model_name, accuracy, seconds in self._run_tasks(_fit_and_score, tasks):
+            results[model_name] = accuracy
+            eval_seconds[model_name] = round(seconds, 3)
+            if accuracy is not None:
+                logger.info(f'{model_name} 활용한 검증 정확도 {accuracy:.4f} ({seconds:.3f}s)')
         
         logger.info("🦝🦝평가 완료")
         
-        return {
+        self.evaluation = {
             "message": "평가 완료",
+            "results": results,
+            "fit_seconds": self.fit_times,
+            "eval_seconds": eval_seconds
+        }
+        if self.fit_times:
+            self._save_models()
+        return self.evaluation
+
+    def cross_validate(self, folds: int = 5) -> Dict[str, Any]:
+        """
+        모델별 k-fold 교차 검증 (모델 × fold 작업을 병렬 실행)
+        
+        Args:
+            folds: fold 수
+        
+        Returns:
+            모델별 fold 정확도, 평균, 표준편차, 소요 시간
+        """
+        logger.info(f"🦝🦝{folds}-fold 교차 검증 시작")
+        
+        if self.processed_data is None or not self.models or self.y_train is None:
+            logger.warning("전처리된 데이터나 모델이 없습니다. 먼저 preprocess(), modeling()을 실행하세요.")
+            return {"error": "전처리된 데이터나 모델이 없습니다."}
+        
+        X = self._features(self.processed_data.train)
+        y = self.y_train.reset_index(drop=True)
+        X = X.reset_index(drop=True)
+        splits = list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=42).split(X, y))
+        
+        tasks = [
+            (model_name, copy.deepcopy(model), X.iloc[train_idx], y.iloc[train_idx], X.iloc[val_idx], y.iloc[val_idx])
+            for model_name, model in self.models.items()
+            for train_idx, val_idx in splits
+        ]
+        start = time.perf_counter()
+        scores: Dict[str, List[Optional[float]]] = {model_name: [] for model_name in self.models}
+        seconds: Dict[str, float] = {model_name: 0.0 for model_name in self.models}
+        for model_name, accuracy, elapsed in self._run_tasks(_fit_and_score, tasks):
+            scores[model_name].append(accuracy)
+            seconds[model_name] += elapsed
+        
+        results = {}
+        for model_name, fold_scores in scores.items():
+            valid = [score for score in fold_scores if score is not None]
+            results[model_name] = {
+                "scores": fold_scores,
+                "mean": float(np.mean(valid)) if valid else None,
+                "std": float(np.std(valid)) if valid else None,
+                "fit_seconds": round(seconds[model_name], 3)
+            }
+            if valid:
+                logger.info(f"{model_name} {folds}-fold 정확도 {np.mean(valid):.4f} ± {np.std(valid):.4f}")
+        
+        logger.info("🦝🦝교차 검증 완료")
+        return {
+            "message": "교차 검증 완료",
+            "folds": folds,
+            "parallel": self.parallel,
+            "elapsed_seconds": round(time.perf_counter() - start, 3),
             "results": results
         }
 
@@ -354,36 +514,14 @@ class TitanicService:
             return {"error": "PassengerId 컬럼이 없습니다."}
         
         passenger_ids = X_test['PassengerId'].copy()
-        X_test = X_test.drop(columns=['PassengerId'])
-        
-        # 모든 컬럼을 숫자형으로 변환 (object 타입 제거)
-        for col in X_test.columns:
-            if X_test[col].dtype == 'object':
-                logger.warning(f"{col} 컬럼이 object 타입입니다. 숫자형으로 변환합니다.")
-                X_test[col] = pd.to_numeric(X_test[col], errors='coerce').fillna(0).astype(int)
-        
-        # Train 데이터로 모델 재학습
-        X_train = self.processed_data.train.copy()
-        y_train = self.y_train
-        
-        # PassengerId 제거
-        if 'PassengerId' in X_train.columns:
-            X_train = X_train.drop(columns=['PassengerId'])
+        X_test = self._features(X_test)
         
-        # 모든 컬럼을 숫자형으로 변환
-        for col in X_train.columns:
-            if X_train[col].dtype == 'object':
-                X_train[col] = pd.to_numeric(X_train[col], errors='coerce').fillna(0).astype(int)
-        
-        # 모델 선택 및 학습
+        # learning()에서 전체 학습 데이터로 학습된 모델 사용 (재학습하지 않음)
         model = self.models[model_name]
-        logger.info(f"{model_name} 모델로 전체 학습 데이터로 재학습 중...")
-        model.fit(X_train, y_train)
-        logger.info(f"{model_name} 모델 학습 완료")
         
         # 예측
         logger.info(f"{model_name} 모델로 예측 중...")
-        predictions = model.predict(X_test)
+        predictions = np.asarray(model.predict(X_test))
         logger.info(f"예측 완료: {len(predictions)}개")
         
         # 제출 파일 생성
@@ -430,4 +568,30 @@ class TitanicService:
             result["model_accuracy"] = float(model_accuracy)
             result["auto_selected"] = (model_name is None or model_name == "auto")
         
-        return result
\ No newline at end of file
+        return result
+
+
+def run_evaluate_pipeline() -> Dict[str, Any]:
+    """전처리 → 모델링 → 학습 → 평가 (작업 프로세스 풀에서 실행)"""
+    service = TitanicService()
+    service.preprocess()
+    service.modeling()
+    service.learning()
+    return service.evaluate()
+
+
+def run_submit_pipeline(model_name: str = None) -> Dict[str, Any]:
+    """전처리 → 모델링 → 학습 → 제출 파일 생성 (작업 프로세스 풀에서 실행)"""
+    service = TitanicService()
+    service.preprocess()
+    service.modeling()
+    service.learning()
+    return service.submit(model_name=model_name)
+
+
+def run_cv_pipeline(folds: int = 5) -> Dict[str, Any]:
+    """전처리 → 모델링 → k-fold 교차 검증 (작업 프로세스 풀에서 실행)"""
+    service = TitanicService()
+    service.preprocess()
+    service.modeling()
+    return service.cross_validate(folds=folds)
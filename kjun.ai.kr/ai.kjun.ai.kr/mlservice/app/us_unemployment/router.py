@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from .service import UnemploymentService
+from jobs.job_manager import job_manager
 import logging
 from pathlib import Path
 
@@ -12,6 +13,12 @@ usa_router = APIRouter(prefix="/usa", tags=["usa"])
 service = UnemploymentService()
 
 
+def _render_map_html() -> str:
+    """지도를 생성하고 HTML 문자열로 반환 (작업 스레드에서 실행)"""
+    service.create_map()
+    return service.get_map_html()
+
+
 @usa_router.get("/")
 async def root():
     """USA Unemployment API 루트"""
@@ -27,8 +34,7 @@ async def get_map():
         HTMLResponse: 지도 HTML
     """
     try:
-        map_obj = service.create_map()
-        html_content = service.get_map_html()
+        html_content = await job_manager.run("usa/map", _render_map_html, cache=True)
         return HTMLResponse(content=html_content)
     except Exception as e:
         import traceback
@@ -0,0 +1,169 @@
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 추론 백엔드
+BACKENDS = ("pytorch", "int8", "onnx")
+
+# fp32 모델과 결과를 비교할 문장
+PARITY_TEXTS = [
+    "정말 재미있게 봤어요. 또 보고 싶네요.",
+    "시간이 아까운 영화였다",
+    "그냥 그랬음",
+    "배우들 연기는 좋았지만 스토리가 너무 지루했습니다.",
+]
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """행 단위 소프트맥스"""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+class TorchBackend:
+    """PyTorch 모델 백엔드 (fp32 또는 동적 int8 양자화)"""
+
+    def __init__(self, model: torch.nn.Module, device: torch.device, name: str = "pytorch"):
+        self.model = model
+        self.device = device
+        self.name = name
+
+    def predict(self, inputs: Dict[str, torch.Tensor]) -> np.ndarray:
+        """토크나이저 출력(tensor)을 받아 소프트맥스 확률 반환"""
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+        return softmax(logits.float().cpu().numpy())
+
+
+class OnnxBackend:
+    """ONNX Runtime 세션 백엔드 (CPU)"""
+
+    name = "onnx"
+
+    def __init__(self, onnx_path: Path, num_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def predict(self, inputs: Dict[str, torch.Tensor]) -> np.ndarray:
+        """토크나이저 출력(tensor)을 받아 소프트맥스 확률 반환"""
+        feed = {
+            name: inputs[name].cpu().numpy().astype(np.int64)
+            for name in self.input_names
+            if name in inputs
+        }
+        logits = self.session.run(["logits"], feed)[0]
+        return softmax(logits)
+
+
+def quantize_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Linear 레이어 동적 int8 양자화 (CPU 전용)"""
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def export_onnx(model: torch.nn.Module, tokenizer: Any, onnx_path: Path) -> None:
+    """PyTorch 모델을 ONNX로 내보내기 (배치/문장 길이 가변)"""
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    sample = tokenizer(PARITY_TEXTS[:2], return_tensors="pt", padding=True)
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    model = model.to("cpu").eval()
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(onnx_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+        )
+    logger.info(f"ONNX 모델 내보내기 완료: {onnx_path}")
+
+
+def create_backend(
+    name: str,
+    model: torch.nn.Module,
+    tokenizer: Any,
+    model_path: Path,
+    device: torch.device,
+    num_threads: Optional[int] = None,
+):
+    """
+    설정에 맞는 추론 백엔드를 생성합니다.
+
+    int8/onnx 백엔드는 CPU 전용입니다.
+
+    Args:
+        name: 백엔드 이름 (pytorch, int8, onnx)
+        model: fp32 PyTorch 모델
+        tokenizer: 토크나이저 (ONNX 내보내기용 샘플 입력 생성)
+        model_path: 모델 디렉토리 (ONNX 파일 기본 위치)
+        device: PyTorch 디바이스
+        num_threads: CPU 스레드 수
+
+    Returns:
+        predict(inputs) -> 확률 배열을 제공하는 백엔드
+    """
+    if name == "pytorch":
+        return TorchBackend(model, device)
+    if name == "int8":
+        return TorchBackend(quantize_int8(model.to("cpu")), torch.device("cpu"), name="int8")
+    if name == "onnx":
+        onnx_path = Path(os.getenv("KOELECTRA_ONNX_PATH", str(model_path / "onnx" / "model.onnx")))
+        if not onnx_path.exists():
+            export_onnx(model, tokenizer, onnx_path)
+        return OnnxBackend(onnx_path, num_threads)
+    raise ValueError(f"지원하지 않는 백엔드입니다: {name} (지원: {', '.join(BACKENDS)})")
+
+
+def check_parity(
+    reference,
+    candidate,
+    tokenizer: Any,
+    texts: List[str] = PARITY_TEXTS,
+    tolerance: float = 0.05,
+) -> Dict[str, Any]:
+    """
+    기준(fp32) 백엔드와 후보 백엔드의 출력을 비교합니다.
+
+    Args:
+        reference: 기준 백엔드
+        candidate: 비교할 백엔드
+        tokenizer: 토크나이저
+        texts: 비교할 문장
+        tolerance: 허용하는 최대 확률 차이
+
+    Returns:
+        dict: passed, max_abs_diff, label_agreement
+    """
+    inputs = tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512)
+    expected = reference.predict(inputs)
+    actual = candidate.predict(inputs)
+    max_abs_diff = float(np.abs(expected - actual).max())
+    label_agreement = float((expected.argmax(axis=-1) == actual.argmax(axis=-1)).mean())
+    return {
+        "passed": max_abs_diff <= tolerance and label_agreement == 1.0,
+        "max_abs_diff": round(max_abs_diff, 6),
+        "label_agreement": label_agreement,
+    }
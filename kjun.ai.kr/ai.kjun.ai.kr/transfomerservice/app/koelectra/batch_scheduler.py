@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatchScheduler:
+    """동시에 들어온 요청을 짧은 시간 모아 한 번의 배치 추론으로 처리하는 스케줄러
+
+    요청마다 모델을 한 번씩 실행하면 CPU 시간 대부분이 호출 오버헤드에 쓰이므로,
+    첫 요청 이후 max_wait_ms 동안(또는 max_batch_size개가 찰 때까지) 요청을 모아
+    패딩된 배치 하나로 실행하고 결과를 각 요청에 돌려줍니다.
+    모델 실행은 전용 스레드에서 하므로 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[str]], List[Dict[str, Any]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Args:
+            process_batch: 문장 목록을 받아 같은 순서의 결과 목록을 반환하는 함수
+            max_batch_size: 한 번에 실행할 최대 문장 수
+            max_wait_ms: 첫 요청 이후 다른 요청을 기다리는 최대 시간 (밀리초)
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # 모델 실행 전용 스레드 (배치는 한 번에 하나씩 실행)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="koelectra-batch")
+        self._batches = 0
+        self._items = 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """현재 이벤트 루프에서 배치 워커 시작"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self._queue
+
+    async def submit(self, text: str) -> Dict[str, Any]:
+        """
+        문장 하나를 배치 대기열에 넣고 결과를 기다립니다.
+
+        Args:
+            text: 분석할 문장
+
+        Returns:
+            dict: 감정 분석 결과
+        """
+        return (await self.submit_many([text]))[0]
+
+    async def submit_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 문장을 배치 대기열에 넣고 결과를 기다립니다.
+
+        다른 요청의 문장과 함께 배치로 묶일 수 있습니다.
+
+        Args:
+            texts: 분석할 문장 목록
+
+        Returns:
+            list: 입력 순서와 같은 결과 목록
+        """
+        queue = self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """첫 요청을 기다린 뒤 max_wait 동안 또는 배치가 찰 때까지 요청 수집"""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # 이미 대기 중인 요청은 기다리지 않고 바로 가져옴
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """배치 수집 → 실행 → 결과 분배 반복"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # 연결이 끊겨 취소된 요청은 제외
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._executor, self.process_batch, texts)
+            except Exception as e:
+                logger.error(f"배치 추론 중 오류 발생: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self._batches += 1
+            self._items += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 통계"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self._batches,
+            "items": self._items,
+            "avg_batch_size": round(self._items / self._batches, 2) if self._batches else 0.0,
+        }
+
+    async def close(self) -> None:
+        """워커 종료"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
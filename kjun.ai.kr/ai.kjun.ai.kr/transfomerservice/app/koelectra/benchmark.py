@@ -0,0 +1,133 @@
+"""
+KoElectra 추론 백엔드 벤치마크
+
+백엔드(pytorch, int8, onnx)마다 별도 프로세스에서 모델을 로드하고
+리뷰 문장으로 지연 시간(p50/p99)과 메모리(RSS)를 측정합니다.
+
+실행 (transfomerservice/app 디렉토리에서):
+    python -m koelectra.benchmark --backends pytorch int8 onnx --batch-size 1 --iterations 200
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing as mp
+import resource
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def load_texts(limit: int) -> List[str]:
+    """벤치마크용 리뷰 문장 로드"""
+    texts: List[str] = []
+    for path in sorted(DATA_DIR.glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            texts.extend(item["review"] for item in json.load(f) if item.get("review", "").strip())
+        if len(texts) >= limit:
+            break
+    return texts[:limit]
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB, Linux 기준 ru_maxrss는 KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _current_rss_mb() -> float:
+    """현재 프로세스의 RSS (MB, /proc 사용 불가 시 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        return _peak_rss_mb()
+
+
+def _run_backend(backend: str, texts: List[str], batch_size: int, iterations: int, warmup: int, num_threads: int, queue) -> None:
+    """자식 프로세스: 백엔드 하나를 로드하고 측정"""
+    from koelectra.koelectra_service import KoElectraService
+
+    try:
+        load_start = time.perf_counter()
+        service = KoElectraService(backend=backend, num_threads=num_threads)
+        load_seconds = time.perf_counter() - load_start
+        # fp32 비교용 모델 해제 후 측정
+        gc.collect()
+        rss_after_load = _current_rss_mb()
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        for i in range(warmup):
+            service.analyze_batch(batches[i % len(batches)])
+
+        latencies = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            service.analyze_batch(batches[i % len(batches)])
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        latencies_ms = np.array(latencies)
+        total_seconds = latencies_ms.sum() / 1000
+        queue.put({
+            "backend": service.backend_name,
+            "requested_backend": backend,
+            "parity": service.parity,
+            "load_seconds": round(load_seconds, 2),
+            "p50_ms": round(float(np.percentile(latencies_ms, 50)), 2),
+            "p99_ms": round(float(np.percentile(latencies_ms, 99)), 2),
+            "texts_per_sec": round(iterations * batch_size / total_seconds, 1) if total_seconds else 0.0,
+            "rss_after_load_mb": round(rss_after_load, 1),
+            "rss_mb": round(_current_rss_mb(), 1),
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+        })
+    except Exception as e:
+        queue.put({"backend": backend, "error": str(e)})
+
+
+def run_benchmark(backends: List[str], batch_size: int, iterations: int, warmup: int, num_threads: int) -> List[Dict[str, Any]]:
+    """백엔드마다 새 프로세스에서 측정 (RSS가 섞이지 않도록)"""
+    texts = load_texts(max(batch_size * 50, 200))
+    context = mp.get_context("spawn")
+    results = []
+    for backend in backends:
+        queue = context.Queue()
+        process = context.Process(
+            target=_run_backend,
+            args=(backend, texts, batch_size, iterations, warmup, num_threads, queue),
+        )
+        process.start()
+        results.append(queue.get())
+        process.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KoElectra 추론 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "int8", "onnx"])
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.backends, args.batch_size, args.iterations, args.warmup, args.threads)
+
+    print(f"{'backend':<10}{'p50(ms)':>10}{'p99(ms)':>10}{'texts/s':>10}{'RSS(MB)':>10}  parity")
+    for result in results:
+        if "error" in result:
+            print(f"{result['backend']:<10} 실패: {result['error']}")
+            continue
+        parity = result["parity"] or {}
+        print(
+            f"{result['backend']:<10}{result['p50_ms']:>10}{result['p99_ms']:>10}"
+            f"{result['texts_per_sec']:>10}{result['rss_mb']:>10}  "
+            f"{parity.get('max_abs_diff', '-')}"
+        )
+
+
+if __name__ == "__main__":
+    main()
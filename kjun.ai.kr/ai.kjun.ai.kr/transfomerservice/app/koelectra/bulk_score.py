@@ -0,0 +1,278 @@
+"""
+KoElectra 리뷰 코퍼스 일괄 감정 분석 작업
+
+리뷰 JSON 파일(review, rating, movie_id ...)을 하나씩 읽어 프로세스 풀에서
+배치 추론하고, 파일마다 Parquet 파트 파일로 저장한 뒤 영화별 집계를 만듭니다.
+워커마다 모델을 한 번만 로드하며 torch 스레드 수를 고정합니다.
+이미 저장된 파트 파일은 건너뛰므로 중단된 작업을 이어서 실행할 수 있습니다.
+
+실행 (transfomerservice/app 디렉토리에서):
+    python -m koelectra.bulk_score --data-dir ../../../../RAG/api/app/data --workers 4 --threads 2
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+OUTPUT_DIR = Path(__file__).parent / "output" / "sentiment"
+
+# 리뷰별 결과 스키마 (파트 파일마다 같은 스키마 유지)
+SCHEMA = pa.schema([
+    ("review_id", pa.string()),
+    ("movie_id", pa.string()),
+    ("author", pa.string()),
+    ("date", pa.string()),
+    ("rating", pa.int32()),
+    ("review", pa.string()),
+    ("sentiment", pa.string()),
+    ("confidence", pa.float32()),
+    ("score_positive", pa.float32()),
+    ("score_negative", pa.float32()),
+    ("error", pa.string()),
+])
+
+# 워커 프로세스의 서비스 인스턴스 (워커마다 한 번만 로드)
+_service = None
+
+
+def iter_review_files(data_dir: Path) -> Iterator[Path]:
+    """리뷰 JSON 파일 경로를 이름 순으로 반환"""
+    yield from sorted(data_dir.glob("*.json"))
+
+
+def part_path(output_dir: Path, source: Path) -> Path:
+    """원본 JSON 파일에 대응하는 Parquet 파트 파일 경로"""
+    return output_dir / "parts" / f"{source.stem}.parquet"
+
+
+def _init_worker(backend: str, threads: int) -> None:
+    """워커 초기화: 스레드 수 고정 후 모델 로드"""
+    global _service
+    # torch import 전에 설정해야 OpenMP/MKL 스레드 수가 적용됨
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[name] = str(threads)
+
+    import torch
+    from koelectra.koelectra_service import KoElectraService
+
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    _service = KoElectraService(backend=backend, num_threads=threads)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """평점 문자열을 정수로 변환 (변환 불가 시 None)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def score_file(source: str, output: str, batch_size: int) -> Dict[str, Any]:
+    """
+    워커: JSON 파일 하나를 분석해 Parquet 파트 파일로 저장합니다.
+
+    Args:
+        source: 리뷰 JSON 파일 경로
+        output: 저장할 파트 파일 경로
+        batch_size: 한 번에 추론할 리뷰 수
+
+    Returns:
+        dict: file, rows, errors, seconds
+    """
+    start = time.perf_counter()
+    with open(source, "r", encoding="utf-8") as f:
+        items = json.load(f)
+
+    columns: Dict[str, List[Any]] = {name: [] for name in SCHEMA.names}
+    errors = 0
+    for offset in range(0, len(items), batch_size):
+        chunk = items[offset:offset + batch_size]
+        results = _service.analyze_batch([item.get("review", "") for item in chunk])
+        for item, result in zip(chunk, results):
+            scores = result.get("scores", {})
+            columns["review_id"].append(item.get("review_id"))
+            columns["movie_id"].append(item.get("movie_id"))
+            columns["author"].append(item.get("author"))
+            columns["date"].append(item.get("date"))
+            columns["rating"].append(_to_int(item.get("rating")))
+            columns["review"].append(item.get("review"))
+            columns["sentiment"].append(result.get("sentiment"))
+            columns["confidence"].append(result.get("confidence"))
+            columns["score_positive"].append(scores.get("positive"))
+            columns["score_negative"].append(scores.get("negative"))
+            columns["error"].append(result.get("error"))
+            if not result.get("success"):
+                errors += 1
+
+    # 임시 파일에 쓴 뒤 교체 (중단되어도 불완전한 파트 파일이 남지 않음)
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    pq.write_table(pa.Table.from_pydict(columns, schema=SCHEMA), tmp_path)
+    os.replace(tmp_path, output_path)
+
+    return {
+        "file": Path(source).name,
+        "rows": len(items),
+        "errors": errors,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def write_movie_aggregates(output_dir: Path) -> Optional[Path]:
+    """
+    파트 파일을 모아 영화별 집계 Parquet 파일을 만듭니다.
+
+    Returns:
+        집계 파일 경로 (파트 파일이 없으면 None)
+    """
+    parts = sorted((output_dir / "parts").glob("*.parquet"))
+    if not parts:
+        return None
+
+    table = pa.concat_tables(pq.read_table(path, schema=SCHEMA) for path in parts)
+    scored = table.filter(pc.is_null(table["error"]))
+    is_positive = pc.equal(scored["sentiment"], "positive").cast(pa.int32())
+    scored = scored.append_column("is_positive", is_positive)
+
+    grouped = scored.group_by("movie_id").aggregate([
+        ("review_id", "count"),
+        ("is_positive", "mean"),
+        ("score_positive", "mean"),
+        ("confidence", "mean"),
+        ("rating", "mean"),
+    ])
+    # 그룹 키 컬럼 위치는 pyarrow 버전마다 다르므로 이름으로 골라서 바꿈
+    columns = {
+        "movie_id": "movie_id",
+        "review_id_count": "reviews",
+        "is_positive_mean": "positive_ratio",
+        "score_positive_mean": "mean_score_positive",
+        "confidence_mean": "mean_confidence",
+        "rating_mean": "mean_rating",
+    }
+    aggregates = grouped.select(list(columns)).rename_columns(list(columns.values()))
+
+    output_path = output_dir / "movie_aggregates.parquet"
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    pq.write_table(aggregates.sort_by("movie_id"), tmp_path)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def run(
+    data_dir: Path,
+    output_dir: Path,
+    workers: int,
+    threads: int,
+    batch_size: int,
+    backend: str,
+    resume: bool = True,
+) -> Dict[str, Any]:
+    """
+    코퍼스 전체를 분석합니다.
+
+    Args:
+        data_dir: 리뷰 JSON 디렉토리
+        output_dir: 결과 디렉토리 (parts/*.parquet, movie_aggregates.parquet)
+        workers: 워커 프로세스 수 (워커마다 모델 1개)
+        threads: 워커당 torch 스레드 수
+        batch_size: 한 번에 추론할 리뷰 수
+        backend: 추론 백엔드 (pytorch, int8, onnx)
+        resume: 이미 저장된 파트 파일 건너뛰기
+
+    Returns:
+        dict: 처리 통계
+    """
+    sources = list(iter_review_files(data_dir))
+    pending = [path for path in sources if not (resume and part_path(output_dir, path).exists())]
+    print(f"[INFO] 리뷰 파일 {len(sources)}개 중 {len(pending)}개 처리 (건너뜀: {len(sources) - len(pending)})")
+
+    stats = {"files": 0, "rows": 0, "errors": 0, "failed_files": [], "seconds": 0.0}
+    start = time.perf_counter()
+    if pending:
+        # 워커마다 모델을 로드하므로 spawn 사용 (fork된 torch 스레드 풀 문제 방지)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(backend, threads),
+        ) as executor:
+            futures = {
+                executor.submit(score_file, str(path), str(part_path(output_dir, path)), batch_size): path
+                for path in pending
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"{futures[future].name} 처리 실패: {e}")
+                    stats["failed_files"].append(futures[future].name)
+                    continue
+                stats["files"] += 1
+                stats["rows"] += result["rows"]
+                stats["errors"] += result["errors"]
+                elapsed = time.perf_counter() - start
+                print(
+                    f"[INFO] {result['file']}: {result['rows']}건 ({result['seconds']:.1f}s) | "
+                    f"{stats['files']}/{len(pending)} 파일, {stats['rows'] / elapsed:.1f} reviews/s"
+                )
+
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    stats["reviews_per_sec"] = round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+    stats["aggregates"] = str(write_movie_aggregates(output_dir))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KoElectra 리뷰 코퍼스 일괄 감정 분석")
+    parser.add_argument("--data-dir", type=Path, default=Path(os.getenv("BULK_SCORE_DATA_DIR", str(DATA_DIR))))
+    parser.add_argument("--output-dir", type=Path, default=Path(os.getenv("BULK_SCORE_OUTPUT_DIR", str(OUTPUT_DIR))))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("BULK_SCORE_WORKERS", "2")))
+    parser.add_argument("--threads", type=int, default=int(os.getenv("BULK_SCORE_THREADS", "1")), help="워커당 torch 스레드 수")
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("BULK_SCORE_BATCH_SIZE", "64")))
+    parser.add_argument("--backend", default=os.getenv("KOELECTRA_BACKEND", "pytorch"), choices=["pytorch", "int8", "onnx"])
+    parser.add_argument("--no-resume", action="store_true", help="기존 파트 파일을 무시하고 전체 재처리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    onnx_path = Path(os.getenv("KOELECTRA_ONNX_PATH", str(Path(__file__).parent / "koelectra_model" / "onnx" / "model.onnx")))
+    if args.backend == "onnx" and not onnx_path.exists():
+        # 워커들이 동시에 ONNX 파일을 내보내지 않도록 먼저 한 번 로드
+        from koelectra.koelectra_service import KoElectraService
+        KoElectraService(backend="onnx", num_threads=args.threads)
+
+    stats = run(
+        args.data_dir,
+        args.output_dir,
+        workers=max(1, args.workers),
+        threads=max(1, args.threads),
+        batch_size=max(1, args.batch_size),
+        backend=args.backend,
+        resume=not args.no_resume,
+    )
+    print(
+        f"[OK] {stats['files']}개 파일, {stats['rows']}건 처리 "
+        f"({stats['seconds']}s, {stats['reviews_per_sec']} reviews/s, 오류 {stats['errors']}건)"
+    )
+    if stats["failed_files"]:
+        print(f"[WARNING] 실패한 파일 (다시 실행하면 재처리): {', '.join(stats['failed_files'])}")
+    print(f"[OK] 영화별 집계: {stats['aggregates']}")
+
+
+if __name__ == "__main__":
+    main()
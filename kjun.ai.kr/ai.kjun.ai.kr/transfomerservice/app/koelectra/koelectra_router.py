@@ -1,9 +1,11 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List
+from .batch_scheduler import MicroBatchScheduler
 from .koelectra_service import KoElectraService
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,30 @@ def get_service():
     return service
 
 
+# 마이크로 배치 스케줄러 (동시 요청을 모아 한 번의 forward로 처리)
+scheduler = None
+
+# 배치 엔드포인트에서 한 번에 받을 수 있는 최대 문장 수
+MAX_BATCH_ITEMS = int(os.getenv("KOELECTRA_BATCH_MAX_ITEMS", "256"))
+
+
+def _process_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    """스케줄러 스레드에서 실행되는 배치 추론 (첫 호출 시 모델 로드)"""
+    return get_service().analyze_batch(texts)
+
+
+def get_scheduler() -> MicroBatchScheduler:
+    """마이크로 배치 스케줄러를 지연 생성합니다"""
+    global scheduler
+    if scheduler is None:
+        scheduler = MicroBatchScheduler(
+            _process_batch,
+            max_batch_size=int(os.getenv("KOELECTRA_MAX_BATCH_SIZE", "32")),
+            max_wait_ms=float(os.getenv("KOELECTRA_MAX_WAIT_MS", "5")),
+        )
+    return scheduler
+
+
 class SentimentRequest(BaseModel):
     """감정 분석 요청 모델"""
     text: str
@@ -47,6 +73,17 @@ class SentimentResponse(BaseModel):
     data: SentimentAnalysisResult
 
 
+class BatchSentimentRequest(BaseModel):
+    """배치 감정 분석 요청 모델"""
+    texts: List[str]
+
+
+class BatchSentimentResponse(BaseModel):
+    """배치 감정 분석 API 응답"""
+    success: bool
+    data: List[SentimentAnalysisResult]
+
+
 @koelectra_router.get("/")
 async def root():
     """KoElectra API 루트"""
@@ -65,8 +102,7 @@ async def analyze_sentiment(request: SentimentRequest):
         SentimentResponse: 감정 분석 결과
     """
     try:
-        service_instance = get_service()
-        result = service_instance.analyze_sentiment(request.text)
+        result = await get_scheduler().submit(request.text)
         
         if not result.get("success", False):
             raise HTTPException(status_code=400, detail=result.get("error", "감정 분석 실패"))
@@ -96,8 +132,7 @@ async def analyze_sentiment_get(text: str):
         SentimentResponse: 감정 분석 결과
     """
     try:
-        service_instance = get_service()
-        result = service_instance.analyze_sentiment(text)
+        result = await get_scheduler().submit(text)
         
         if not result.get("success", False):
             raise HTTPException(status_code=400, detail=result.get("error", "감정 분석 실패"))
@@ -114,3 +149,54 @@ async def analyze_sentiment_get(text: str):
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=error_msg)
 
+
+@koelectra_router.post("/analyze/batch", response_model=BatchSentimentResponse)
+async def analyze_sentiment_batch(request: BatchSentimentRequest):
+    """
+    여러 문장의 감정을 한 번에 분석합니다.
+    
+    Args:
+        request: 배치 감정 분석 요청 (texts 필드 포함)
+    
+    Returns:
+        BatchSentimentResponse: 입력 순서와 같은 감정 분석 결과 목록
+    """
+    if not request.texts:
+        raise HTTPException(status_code=400, detail="입력 문장 목록이 비어있습니다.")
+    if len(request.texts) > MAX_BATCH_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {MAX_BATCH_ITEMS}개 문장까지 분석할 수 있습니다."
+        )
+    empty = [i for i, text in enumerate(request.texts) if not text or not text.strip()]
+    if empty:
+        raise HTTPException(status_code=400, detail=f"비어있는 입력 문장이 있습니다: {empty}")
+
+    try:
+        results = await get_scheduler().submit_many(request.texts)
+        
+        failed = [result for result in results if not result.get("success", False)]
+        if failed:
+            raise HTTPException(status_code=500, detail=failed[0].get("error", "감정 분석 실패"))
+        
+        return BatchSentimentResponse(
+            success=True,
+            data=[SentimentAnalysisResult(**result) for result in results]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        error_msg = f"감정 분석 오류 발생: {str(e)}"
+        logger.error(error_msg)
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@koelectra_router.get("/stats")
+async def batch_stats():
+    """마이크로 배치 스케줄러 및 토크나이저 캐시 통계"""
+    stats = get_scheduler().stats()
+    if service is not None:
+        stats["tokenizer"] = service.tokenizer_stats()
+    return stats
@@ -1,8 +1,13 @@
+import bisect
 import logging
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from .backends import BACKENDS, TorchBackend, check_parity, create_backend
 
 logger = logging.getLogger(__name__)
 
@@ -10,11 +15,37 @@ logger = logging.getLogger(__name__)
 class KoElectraService:
     """KoElectra 모델을 사용한 감정 분석 서비스"""
     
-    def __init__(self):
-        """서비스 초기화 및 모델 로드"""
+    def __init__(self, backend: Optional[str] = None, num_threads: Optional[int] = None):
+        """
+        서비스 초기화 및 모델 로드
+        
+        Args:
+            backend: 추론 백엔드 (pytorch, int8, onnx / 기본값: KOELECTRA_BACKEND 환경 변수)
+            num_threads: CPU 추론 스레드 수 (기본값: KOELECTRA_NUM_THREADS 환경 변수)
+        """
         self.model = None
         self.tokenizer = None
-        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.backend = None
+        self.backend_name = (backend or os.getenv("KOELECTRA_BACKEND", "pytorch")).lower()
+        if self.backend_name not in BACKENDS:
+            raise ValueError(f"지원하지 않는 백엔드입니다: {self.backend_name} (지원: {', '.join(BACKENDS)})")
+        threads = num_threads or os.getenv("KOELECTRA_NUM_THREADS")
+        self.num_threads = int(threads) if threads else None
+        self.parity: Optional[Dict[str, Any]] = None
+        # 토큰 길이 버킷 (버킷 경계까지만 패딩) 및 최대 토큰 길이 (넘으면 뒷부분 절단)
+        self.max_length = int(os.getenv("KOELECTRA_MAX_LENGTH", "512"))
+        buckets = os.getenv("KOELECTRA_LENGTH_BUCKETS", "16,32,64,128,256,512")
+        self.length_buckets = sorted({min(int(b), self.max_length) for b in buckets.split(",") if b.strip()} | {self.max_length})
+        self.bucket_batch_size = int(os.getenv("KOELECTRA_BUCKET_BATCH_SIZE", "64"))
+        # 반복 문장의 토크나이저 출력 캐시 (LRU)
+        self.token_cache_size = int(os.getenv("KOELECTRA_TOKEN_CACHE_SIZE", "10000"))
+        self._token_cache: "OrderedDict[str, Dict[str, List[int]]]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+        self._token_cache_hits = 0
+        self._token_cache_misses = 0
+        # int8/onnx 백엔드는 CPU 전용
+        use_cuda = torch.cuda.is_available() and self.backend_name == "pytorch"
+        self.device = torch.device('cuda' if use_cuda else 'cpu')
         self.model_path = Path(__file__).parent / "koelectra_model"
         self._load_model()
     
@@ -37,12 +68,49 @@ class KoElectraService:
             self.model.eval()  # 평가 모드로 설정
             logger.info(f"모델 로드 완료 (device: {self.device})")
             
+            if self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            self._load_backend()
+            
         except Exception as e:
             logger.error(f"모델 로드 중 오류 발생: {e}")
             import traceback
             logger.error(traceback.format_exc())
             raise
     
+    def _load_backend(self):
+        """설정된 추론 백엔드 생성 및 fp32 모델과의 결과 비교"""
+        reference = TorchBackend(self.model, self.device)
+        if self.backend_name == "pytorch":
+            self.backend = reference
+            return
+        
+        try:
+            backend = create_backend(
+                self.backend_name, self.model, self.tokenizer, self.model_path, self.device, self.num_threads
+            )
+        except Exception as e:
+            logger.warning(f"{self.backend_name} 백엔드 생성 실패, pytorch 백엔드 사용: {e}")
+            self.backend_name = "pytorch"
+            self.backend = reference
+            return
+        
+        # fp32 모델과 결과 비교 (허용 오차를 넘으면 fp32 사용)
+        if os.getenv("KOELECTRA_PARITY_CHECK", "true").lower() == "true":
+            tolerance = float(os.getenv("KOELECTRA_PARITY_TOLERANCE", "0.05"))
+            self.parity = check_parity(reference, backend, self.tokenizer, tolerance=tolerance)
+            logger.info(f"{self.backend_name} 백엔드 결과 비교: {self.parity}")
+            if not self.parity["passed"]:
+                logger.warning(f"{self.backend_name} 백엔드 결과가 fp32와 다릅니다. pytorch 백엔드 사용")
+                self.backend_name = "pytorch"
+                self.backend = reference
+                return
+        
+        # fp32 모델은 더 이상 필요 없으므로 메모리 해제
+        self.backend = backend
+        self.model = None
+        logger.info(f"{self.backend_name} 백엔드 사용")
+    
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """
         문장의 감정을 분석합니다.
@@ -56,74 +124,158 @@ class KoElectraService:
                 - confidence: 신뢰도 (0.0 ~ 1.0)
                 - scores: 각 감정별 점수
         """
-        if not text or not text.strip():
-            return {
-                "success": False,
-                "error": "입력 문장이 비어있습니다."
-            }
-        
+        logger.info(f"감정 분석 시작: {text[:50] if text else ''}...")
+        result = self.analyze_batch([text])[0]
+        if result.get("success"):
+            logger.info(f"감정 분석 완료: {result['sentiment']} (신뢰도: {result['confidence']:.4f})")
+        return result
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 문장의 감정을 토큰 길이 버킷 단위로 분석합니다.
+
+        빈 문장은 개별 오류 결과로 반환하고, 나머지 문장은 토큰 길이에 따라
+        버킷으로 나눠 버킷 경계까지만 패딩한 배치로 모델에 입력합니다.
+        결과는 입력 순서대로 반환합니다.
+
+        Args:
+            texts: 분석할 문장 목록
+
+        Returns:
+            list: 입력 순서와 같은 감정 분석 결과 목록 (analyze_sentiment와 같은 형식)
+        """
+        results: List[Dict[str, Any]] = [
+            {"success": False, "error": "입력 문장이 비어있습니다."} for _ in texts
+        ]
+        valid = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+        if not valid:
+            return results
+
         try:
-            logger.info(f"감정 분석 시작: {text[:50]}...")
-            
-            # 텍스트 토크나이징
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=512
-            )
-            
-            # 모델에 입력
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-            
-            # 소프트맥스로 확률 변환
-            probabilities = torch.nn.functional.softmax(logits, dim=-1)
-            probabilities = probabilities.cpu().numpy()[0]
-            
-            # 감정 레이블 (모델에 따라 다를 수 있음)
-            # 일반적으로: 0=negative, 1=neutral, 2=positive 또는 0=negative, 1=positive
-            # 실제 모델의 레이블에 맞게 조정 필요
-            sentiment_labels = ["negative", "neutral", "positive"]
-            
-            # 가장 높은 확률의 감정 찾기
-            predicted_class = probabilities.argmax()
-            confidence = float(probabilities[predicted_class])
-            
-            # 레이블 수에 맞게 조정
-            if len(probabilities) == 2:
-                sentiment_labels = ["negative", "positive"]
-            elif len(probabilities) > 3:
-                sentiment_labels = [f"label_{i}" for i in range(len(probabilities))]
-            
-            predicted_sentiment = sentiment_labels[predicted_class] if predicted_class < len(sentiment_labels) else f"label_{predicted_class}"
-            
-            # 각 감정별 점수 생성
-            scores = {}
-            for i, label in enumerate(sentiment_labels[:len(probabilities)]):
-                scores[label] = float(probabilities[i])
-            
-            result = {
-                "success": True,
-                "text": text,
-                "sentiment": predicted_sentiment,
-                "confidence": round(confidence, 4),
-                "scores": scores
-            }
-            
-            logger.info(f"감정 분석 완료: {predicted_sentiment} (신뢰도: {confidence:.4f})")
-            return result
-            
+            probabilities = self._predict_bucketed([text for _, text in valid])
+            for (index, text), row in zip(valid, probabilities):
+                results[index] = self._to_result(text, row)
+            return results
+
         except Exception as e:
             logger.error(f"감정 분석 중 오류 발생: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return {
-                "success": False,
-                "error": str(e)
+            for index, _ in valid:
+                results[index] = {
+                    "success": False,
+                    "error": str(e)
+                }
+            return results
+
+    def _encode(self, texts: List[str]) -> List[Dict[str, List[int]]]:
+        """패딩 없이 토크나이징 (캐시에 있는 문장은 다시 토크나이징하지 않음)"""
+        encodings: List[Optional[Dict[str, List[int]]]] = [None] * len(texts)
+        missing: List[int] = []
+        with self._token_cache_lock:
+            for i, text in enumerate(texts):
+                cached = self._token_cache.get(text)
+                if cached is None:
+                    missing.append(i)
+                    continue
+                self._token_cache.move_to_end(text)
+                encodings[i] = cached
+            self._token_cache_hits += len(texts) - len(missing)
+            self._token_cache_misses += len(missing)
+
+        if missing:
+            # 같은 배치 안의 중복 문장도 한 번만 토크나이징
+            unique = list(dict.fromkeys(texts[i] for i in missing))
+            batch = self.tokenizer(unique, truncation=True, max_length=self.max_length)
+            encoded = {
+                text: {key: batch[key][j] for key in batch.keys()}
+                for j, text in enumerate(unique)
             }
+            for i in missing:
+                encodings[i] = encoded[texts[i]]
 
+            if self.token_cache_size > 0:
+                with self._token_cache_lock:
+                    self._token_cache.update(encoded)
+                    while len(self._token_cache) > self.token_cache_size:
+                        self._token_cache.popitem(last=False)
+        return encodings
+
+    def _bucket_length(self, length: int) -> int:
+        """토큰 길이가 들어가는 가장 작은 버킷 경계"""
+        index = bisect.bisect_left(self.length_buckets, length)
+        return self.length_buckets[min(index, len(self.length_buckets) - 1)]
+
+    def _predict_bucketed(self, texts: List[str]) -> List[Any]:
+        """
+        토큰 길이 버킷별로 배치를 만들어 추론하고 입력 순서대로 확률을 반환합니다.
+
+        짧은 리뷰가 긴 문장과 같은 배치에 들어가 512 토큰까지 패딩되는 것을 막아
+        어텐션 연산 낭비를 줄입니다.
+        """
+        encodings = self._encode(texts)
+        buckets: Dict[int, List[int]] = {}
+        for i in sorted(range(len(texts)), key=lambda i: len(encodings[i]["input_ids"])):
+            buckets.setdefault(self._bucket_length(len(encodings[i]["input_ids"])), []).append(i)
+
+        probabilities: List[Any] = [None] * len(texts)
+        for boundary, indices in buckets.items():
+            for start in range(0, len(indices), self.bucket_batch_size):
+                chunk = indices[start:start + self.bucket_batch_size]
+                inputs = self.tokenizer.pad(
+                    [encodings[i] for i in chunk],
+                    padding="max_length",
+                    max_length=boundary,
+                    return_tensors="pt"
+                )
+                # 백엔드에 입력 (소프트맥스 확률 반환)
+                for i, row in zip(chunk, self.backend.predict(dict(inputs))):
+                    probabilities[i] = row
+        return probabilities
+
+    def tokenizer_stats(self) -> Dict[str, Any]:
+        """토큰 길이 버킷 설정 및 토크나이저 캐시 통계"""
+        lookups = self._token_cache_hits + self._token_cache_misses
+        return {
+            "max_length": self.max_length,
+            "length_buckets": self.length_buckets,
+            "bucket_batch_size": self.bucket_batch_size,
+            "token_cache_size": len(self._token_cache),
+            "token_cache_max_size": self.token_cache_size,
+            "token_cache_hits": self._token_cache_hits,
+            "token_cache_misses": self._token_cache_misses,
+            "token_cache_hit_rate": round(self._token_cache_hits / lookups, 4) if lookups else 0.0,
+        }
+
+    @staticmethod
+    def _to_result(text: str, probabilities) -> Dict[str, Any]:
+        """한 문장의 확률 벡터를 감정 분석 결과로 변환합니다."""
+        # 감정 레이블 (모델에 따라 다를 수 있음)
+        # 일반적으로: 0=negative, 1=neutral, 2=positive 또는 0=negative, 1=positive
+        # 실제 모델의 레이블에 맞게 조정 필요
+        sentiment_labels = ["negative", "neutral", "positive"]
+        
+        # 가장 높은 확률의 감정 찾기
+        predicted_class = int(probabilities.argmax())
+        confidence = float(probabilities[predicted_class])
+        
+        # 레이블 수에 맞게 조정
+        if len(probabilities) == 2:
+            sentiment_labels = ["negative", "positive"]
+        elif len(probabilities) > 3:
+            sentiment_labels = [f"label_{i}" for i in range(len(probabilities))]
+        
+        predicted_sentiment = sentiment_labels[predicted_class] if predicted_class < len(sentiment_labels) else f"label_{predicted_class}"
+        
+        # 각 감정별 점수 생성
+        scores = {}
+        for i, label in enumerate(sentiment_labels[:len(probabilities)]):
+            scores[label] = float(probabilities[i])
+        
+        return {
+            "success": True,
+            "text": text,
+            "sentiment": predicted_sentiment,
+            "confidence": round(confidence, 4),
+            "scores": scores
+        }